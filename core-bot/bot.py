@@ -36,6 +36,8 @@ from discord.ext import commands
 
 from database import (
     DB_NAME,
+    apply_pragmas,
+    close_db_pool,
     init_db_once,
     run_migrations,
     validate_db_connectivity,
@@ -149,6 +151,7 @@ class CoreBot(commands.Bot):
         phase1_start = time.perf_counter()
         self.db = await aiosqlite.connect(DB_NAME)
         self.db.row_factory = aiosqlite.Row
+        await apply_pragmas(self.db)
         try:
             await run_migrations(self.db, DB_NAME)
         except Exception as e:
@@ -348,6 +351,11 @@ async def shutdown():
         except Exception:
             log.exception("Error closing database")
 
+    try:
+        await close_db_pool()
+    except Exception:
+        log.exception("Error closing database pool")
+
     try:
         await bot.close()
     except Exception:
@@ -14,7 +14,6 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
-import aiosqlite
 import database  # use database.DB_NAME so monkeypatching works in tests
 
 from utils.server_config import ServerConfigManager
@@ -53,7 +52,7 @@ class LeaderboardCog(commands.Cog):
         """
         rows = []
         try:
-            async with aiosqlite.connect(database.DB_NAME) as db:
+            async with database.get_db() as db:
                 async with db.execute(
                     """
                     SELECT discord_id, claimed_rank, elo_1v1,
@@ -112,7 +111,7 @@ class LeaderboardCog(commands.Cog):
         """
         row = None
         try:
-            async with aiosqlite.connect(database.DB_NAME) as db:
+            async with database.get_db() as db:
                 async with db.execute(
                     """
                     SELECT claimed_rank, elo_1v1,
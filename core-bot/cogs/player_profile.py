@@ -14,7 +14,6 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
-import aiosqlite
 import database  # use database.DB_NAME so monkeypatching works
 
 from utils.server_config import ServerConfigManager
@@ -457,7 +456,7 @@ class PlayerProfile(commands.Cog):
         """
         rows = []
         try:
-            async with aiosqlite.connect(database.DB_NAME) as db:
+            async with database.get_db() as db:
                 async with db.execute(
                     """
                     SELECT claimed_rank, COUNT(*) AS count
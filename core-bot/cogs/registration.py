@@ -15,7 +15,8 @@ import asyncio
 import logging
 import re
 import time
-from typing import Dict, Optional, Tuple
+import weakref
+from typing import Dict, Iterable, Optional, Set, Tuple
 
 import aiosqlite
 import discord
@@ -30,9 +31,6 @@ from services.tournament_service import TournamentService
 
 # Import UI components from ui/ package
 from ui.registration_views import (
-    RegisterButton,
-    UnregisterButton,
-    RefreshButton,
     RegionMismatchView,
     ManualRegisterModal,
     KickPlayerModal,
@@ -42,13 +40,23 @@ from ui.registration_views import (
     AdminControlsView,
 )
 from ui.registration_embeds import (
+    RegistrationPanelState,
     build_public_registration_embed,
     build_admin_registration_embed,
     build_region_mismatch_embed,
+    invalidate_admin_embed,
+    normalize_restriction,
 )
 
 log = logging.getLogger(__name__)
 
+# How long a resolved (or known-absent) guild member stays cached
+MEMBER_CACHE_TTL = 300  # seconds
+MEMBER_CACHE_MAX = 512
+
+# Window in which repeated panel refreshes for one tournament collapse into one
+PANEL_REFRESH_DEBOUNCE = 0.25  # seconds
+
 
 # NOTE(core-bot): Team/Queue button classes removed - TeamsCog, ClansCog, QuickQueueView not in core-bot
 # Removed: CreateTeamButton, JoinTeamButton, SoloQueueButton, RegisterExistingTeamButton, TeamRegistrationView
@@ -65,6 +73,31 @@ class RegistrationCog(commands.Cog):
         self.tournaments: Dict[str, dict] = {}
         self.active_key: Optional[str] = None
         self.by_message_id: Dict[int, str] = {}
+        # Lowercased tournament name -> key, for O(1) uniqueness checks
+        self._name_index: Dict[str, str] = {}
+
+        # (guild_id, user_id) -> (cached_at, member or None if not in guild)
+        self._member_cache: Dict[
+            Tuple[int, int], Tuple[float, Optional[discord.Member]]
+        ] = {}
+        # In-flight fetch_member calls, so concurrent lookups share one request
+        self._member_fetches: Dict[Tuple[int, int], asyncio.Task] = {}
+        # Guilds chunked this session, and (without the members intent) the
+        # user ids already requested per guild (see warm_member_cache)
+        self._chunked_guilds: Set[int] = set()
+        self._warmed_members: Dict[int, Set[int]] = {}
+        # Strong references so warm-up tasks aren't garbage-collected
+        self._warm_tasks: Set[asyncio.Task] = set()
+        # Single-flight panel refreshes: key -> running task, plus keys that
+        # were requested again while that task was already running
+        self._panel_refresh_tasks: Dict[str, asyncio.Task] = {}
+        self._panel_refresh_pending: Set[str] = set()
+
+        # Live public-panel view per tournament, reused across panel edits.
+        # Weak: discord.py's view store keeps attached views alive.
+        self._panel_views: "weakref.WeakValueDictionary[str, RegistrationView]" = (
+            weakref.WeakValueDictionary()
+        )
 
     async def _safe_create_role(self, guild: discord.Guild, **kwargs):
         """
@@ -155,6 +188,155 @@ class RegistrationCog(commands.Cog):
 
         return await create_text_channel(**kwargs)
 
+    async def resolve_member(
+        self, guild: discord.Guild, user_id: int
+    ) -> Optional[discord.Member]:
+        """
+        Cache-first member lookup: guild cache, then our TTL cache, then the API.
+
+        Returns None if the user is not in the guild (negative results are
+        cached too). Raises discord.HTTPException on other API failures.
+        """
+        member = guild.get_member(user_id)
+        if member is not None:
+            return member
+
+        cache_key = (guild.id, user_id)
+        cached = self._member_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < MEMBER_CACHE_TTL:
+            return cached[1]
+
+        task = self._member_fetches.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_member(guild, user_id))
+            self._member_fetches[cache_key] = task
+            task.add_done_callback(
+                lambda _t: self._member_fetches.pop(cache_key, None)
+            )
+        # Shield so one cancelled caller doesn't cancel the shared fetch
+        return await asyncio.shield(task)
+
+    async def _fetch_member(
+        self, guild: discord.Guild, user_id: int
+    ) -> Optional[discord.Member]:
+        """Fetch a member from the API and store the result in the TTL cache."""
+        try:
+            member = await guild.fetch_member(user_id)
+        except discord.NotFound:
+            member = None
+
+        now = time.monotonic()
+        if len(self._member_cache) >= MEMBER_CACHE_MAX:
+            # Drop expired entries first; if still full, start over
+            self._member_cache = {
+                k: v
+                for k, v in self._member_cache.items()
+                if now - v[0] < MEMBER_CACHE_TTL
+            }
+            if len(self._member_cache) >= MEMBER_CACHE_MAX:
+                self._member_cache.clear()
+        self._member_cache[(guild.id, user_id)] = (now, member)
+        return member
+
+    def warm_member_cache(self, guild: discord.Guild, key: Optional[str] = None):
+        """
+        Warm the guild's member cache in the background.
+
+        With the members intent the whole guild is chunked, once per session.
+        Without it (the default for this build) the tournament's participants
+        are requested in bulk over the gateway instead, so later get_member()
+        lookups from admin modals hit the cache rather than one fetch_member
+        each. Only participants not yet requested this session are queried,
+        so players who register later are still warmed.
+        """
+        if guild.chunked:
+            return
+
+        if self.bot.intents.members:
+            if guild.id in self._chunked_guilds:
+                return
+            self._chunked_guilds.add(guild.id)
+            coro = guild.chunk(cache=True)
+        else:
+            state = self.tournaments.get(key) if key else None
+            warmed = self._warmed_members.setdefault(guild.id, set())
+            # Dummy players have negative IDs and are never guild members
+            user_ids = [
+                uid
+                for uid in (state or {}).get("participants", ())
+                if uid > 0 and uid not in warmed
+            ]
+            if not user_ids:
+                return
+            warmed.update(user_ids)
+            coro = self._query_members_bulk(guild, user_ids)
+
+        def _log_failure(task: asyncio.Task):
+            if task.cancelled() or task.exception() is not None:
+                # Allow a retry on the next admin click
+                if self.bot.intents.members:
+                    self._chunked_guilds.discard(guild.id)
+                else:
+                    self._warmed_members.get(guild.id, set()).difference_update(
+                        user_ids
+                    )
+            if not task.cancelled() and task.exception() is not None:
+                log.warning(
+                    f"[REGISTRATION] Member cache warm-up failed for {guild.id}: "
+                    f"{task.exception()}"
+                )
+
+        task = asyncio.create_task(coro)
+        self._warm_tasks.add(task)
+        task.add_done_callback(self._warm_tasks.discard)
+        task.add_done_callback(_log_failure)
+
+    @staticmethod
+    async def _query_members_bulk(guild: discord.Guild, user_ids: list) -> None:
+        """Request members by ID, 100 per gateway request (the API maximum)."""
+        for i in range(0, len(user_ids), 100):
+            batch = user_ids[i : i + 100]
+            await guild.query_members(user_ids=batch, limit=len(batch), cache=True)
+
+    def _get_panel_view(self, key: str, is_open: bool) -> RegistrationView:
+        """Return the tournament's public view with is_open applied in place."""
+        view = self._panel_views.get(key)
+        if view is None:
+            view = RegistrationView(self, tournament_key=key, is_open=is_open)
+            self._panel_views[key] = view
+        else:
+            view.set_open(is_open)
+        return view
+
+    def schedule_panel_refresh(self, key: str) -> asyncio.Task:
+        """
+        Request a panel refresh for a tournament, coalescing bursts.
+
+        If a refresh is already scheduled or running for this key, the
+        request is folded into it and the existing task is returned.
+        """
+        task = self._panel_refresh_tasks.get(key)
+        if task is not None and not task.done():
+            self._panel_refresh_pending.add(key)
+            return task
+
+        task = asyncio.create_task(self._run_panel_refresh(key))
+        self._panel_refresh_tasks[key] = task
+        return task
+
+    async def _run_panel_refresh(self, key: str) -> None:
+        """Debounce, refresh, and go again if more requests arrived meanwhile."""
+        try:
+            while True:
+                await asyncio.sleep(PANEL_REFRESH_DEBOUNCE)
+                self._panel_refresh_pending.discard(key)
+                await self.update_public_panel(key)
+                if key not in self._panel_refresh_pending:
+                    break
+        finally:
+            if self._panel_refresh_tasks.get(key) is asyncio.current_task():
+                del self._panel_refresh_tasks[key]
+
     def _check_region_match(
         self, member: discord.Member, tournament_region: str
     ) -> Tuple[bool, list]:
@@ -232,6 +414,21 @@ class RegistrationCog(commands.Cog):
         """Wait for bot to be ready before starting cleanup."""
         await self.bot.wait_until_ready()
 
+    def find_tournament_by_name(self, name: str) -> Optional[str]:
+        """Return the key of the tournament with this name (case-insensitive)."""
+        return self._name_index.get(name.lower())
+
+    def update_name_index(
+        self, key: str, old_name: Optional[str], new_name: Optional[str]
+    ) -> None:
+        """Move a tournament's entry in the name index after a rename/create/delete."""
+        if old_name:
+            old_lower = old_name.lower()
+            if self._name_index.get(old_lower) == key:
+                del self._name_index[old_lower]
+        if new_name:
+            self._name_index[new_name.lower()] = key
+
     def get_state_by_message(self, message_id: int) -> Optional[dict]:
         """Helper to find tournament state by a message ID (public or admin)."""
         key = self.by_message_id.get(message_id)
@@ -268,6 +465,7 @@ class RegistrationCog(commands.Cog):
                     import json
 
                     key = row[0]
+                    participants = set(json.loads(row[7] or "[]"))
                     self.tournaments[key] = {
                         "key": key,
                         "name": row[1],
@@ -276,7 +474,8 @@ class RegistrationCog(commands.Cog):
                         "size": row[4],
                         "start_time": row[5],
                         "is_open": bool(row[6]),
-                        "participants": set(json.loads(row[7] or "[]")),
+                        "participants": participants,
+                        "participant_count": len(participants),
                         "role_id": row[8],
                         "category_id": row[9],
                         "channels": json.loads(row[10] or "{}"),
@@ -287,11 +486,13 @@ class RegistrationCog(commands.Cog):
                         "requester_id": row[15],
                         "created_at": row[16] or time.time(),
                         "match_length": row[17] or "Bo3",
-                        "rank_restriction": row[18] or "",
-                        "region_restriction": row[19] or "",
+                        "rank_restriction": normalize_restriction(row[18]),
+                        "region_restriction": normalize_restriction(row[19]),
                         "team_size": row[20] or 1,
                     }
 
+                    self.update_name_index(key, None, row[1])
+
                     # Index by message IDs
                     if row[12]:
                         self.by_message_id[row[12]] = key
@@ -367,6 +568,7 @@ class RegistrationCog(commands.Cog):
 
         participants.add(user_id)
         state["participants"] = participants
+        state["participant_count"] = len(participants)
 
         # Add role if member provided
         if member and state.get("role_id"):
@@ -378,9 +580,58 @@ class RegistrationCog(commands.Cog):
                 log.warning(f"[REGISTRATION] Failed to add role: {e}")
 
         await self.save_tournament(key)
-        await self.update_public_panel(key)
+        # Panel rebuild is the slow part; don't hold up the caller's reply
+        self.schedule_panel_refresh(key)
         return True
 
+    async def add_participants_bulk(
+        self,
+        key: str,
+        ids_and_members: Iterable[Tuple[int, Optional[discord.Member]]],
+    ) -> int:
+        """
+        Add several users at once with a single DB save and panel update.
+
+        Returns the number of users actually added (duplicates are skipped).
+        """
+        state = self.tournaments.get(key)
+        if not state:
+            return 0
+
+        participants = state.get("participants", set())
+        added_members = []
+        added = 0
+        for user_id, member in ids_and_members:
+            if user_id in participants:
+                continue
+            participants.add(user_id)
+            added += 1
+            if member is not None:
+                added_members.append(member)
+
+        if not added:
+            return 0
+
+        state["participants"] = participants
+        state["participant_count"] = len(participants)
+
+        # Add roles concurrently for real members
+        role_id = state.get("role_id")
+        if added_members and role_id:
+            role = added_members[0].guild.get_role(role_id)
+            if role:
+                results = await asyncio.gather(
+                    *(m.add_roles(role) for m in added_members),
+                    return_exceptions=True,
+                )
+                for result in results:
+                    if isinstance(result, Exception):
+                        log.warning(f"[REGISTRATION] Failed to add role: {result}")
+
+        await self.save_tournament(key)
+        await self.update_public_panel(key)
+        return added
+
     async def remove_participant(
         self, key: str, user_id: int, member: Optional[discord.Member] = None
     ) -> bool:
@@ -395,6 +646,7 @@ class RegistrationCog(commands.Cog):
 
         participants.discard(user_id)
         state["participants"] = participants
+        state["participant_count"] = len(participants)
 
         # Remove role if member provided
         if member and state.get("role_id"):
@@ -406,9 +658,14 @@ class RegistrationCog(commands.Cog):
                 log.warning(f"[REGISTRATION] Failed to remove role: {e}")
 
         await self.save_tournament(key)
-        await self.update_public_panel(key)
+        self.schedule_panel_refresh(key)
         return True
 
+    def is_registered(self, key: str, user_id: int) -> bool:
+        """Check if a user is already in the tournament's participant set."""
+        state = self.tournaments.get(key)
+        return bool(state) and user_id in state.get("participants", ())
+
     def get_participants(self, key: str) -> list:
         """Get list of participant IDs."""
         state = self.tournaments.get(key)
@@ -489,6 +746,7 @@ class RegistrationCog(commands.Cog):
                 "start_time": start_time,
                 "is_open": True,
                 "participants": set(),
+                "participant_count": 0,
                 "role_id": role.id,
                 "category_id": category.id,
                 "channels": channels,
@@ -499,22 +757,24 @@ class RegistrationCog(commands.Cog):
                 "requester_id": requester_id,
                 "created_at": time.time(),
                 "match_length": match_length,
-                "rank_restriction": rank_restriction,
-                "region_restriction": region_restriction,
+                "rank_restriction": normalize_restriction(rank_restriction),
+                "region_restriction": normalize_restriction(region_restriction),
                 "team_size": team_size,
             }
 
             state = self.tournaments[key]
+            self.update_name_index(key, None, name)
+            snapshot = RegistrationPanelState.from_state(state)
 
             # Post public registration panel
-            embed = build_public_registration_embed(state)
-            view = RegistrationView(self, tournament_key=key, is_open=True)
+            embed = build_public_registration_embed(snapshot)
+            view = self._get_panel_view(key, True)
             public_msg = await reg_channel.send(embed=embed, view=view)
             state["public_message_id"] = public_msg.id
             self.by_message_id[public_msg.id] = key
 
             # Post admin panel
-            admin_embed = build_admin_registration_embed(state)
+            admin_embed = build_admin_registration_embed(snapshot)
             admin_view = AdminControlsView(self, key)
             admin_msg = await admin_channel.send(embed=admin_embed, view=admin_view)
             state["admin_message_id"] = admin_msg.id
@@ -571,6 +831,9 @@ class RegistrationCog(commands.Cog):
 
         # Remove from state
         self.tournaments.pop(key, None)
+        self.update_name_index(key, state.get("name"), None)
+        self._panel_views.pop(key, None)
+        invalidate_admin_embed(key)
 
         # Remove message ID mappings
         for msg_id, k in list(self.by_message_id.items()):
@@ -612,11 +875,11 @@ class RegistrationCog(commands.Cog):
 
                 log.info(f"Updated organizer interaction for {key}")
 
-    def _public_embed(self, state: dict) -> discord.Embed:
+    def _public_embed(self, state: dict | RegistrationPanelState) -> discord.Embed:
         """Create a public embed from tournament state."""
         return build_public_registration_embed(state)
 
-    def _admin_embed(self, state: dict) -> discord.Embed:
+    def _admin_embed(self, state: dict | RegistrationPanelState) -> discord.Embed:
         """Create an admin embed from tournament state."""
         return build_admin_registration_embed(state)
 
@@ -632,10 +895,12 @@ class RegistrationCog(commands.Cog):
                 return
             msg = await channel.fetch_message(state.get("public_message_id"))
 
-            embed = self._public_embed(state)
+            # Snapshot once; both panels render from the same fixed layout
+            snapshot = RegistrationPanelState.from_state(state)
+            embed = self._public_embed(snapshot)
 
             # core-bot: team registration UI removed; always use player-level registration
-            view = RegistrationView(self, tournament_key=key, is_open=state["is_open"])
+            view = self._get_panel_view(key, state["is_open"])
 
             await msg.edit(embed=embed, view=view)
 
@@ -643,7 +908,7 @@ class RegistrationCog(commands.Cog):
             admin_ch = self.bot.get_channel(state.get("admin_channel_id"))
             if admin_ch:
                 admin_msg = await admin_ch.fetch_message(state.get("admin_message_id"))
-                admin_embed = self._admin_embed(state)
+                admin_embed = self._admin_embed(snapshot)
                 admin_view = AdminControlsView(self, key)
                 await admin_msg.edit(embed=admin_embed, view=admin_view)
 
@@ -1030,8 +1295,7 @@ class RegistrationCog(commands.Cog):
         old_msg_id = state.get("admin_message_id")
         if old_msg_id:
             try:
-                old_msg = await admin_channel.fetch_message(old_msg_id)
-                await old_msg.delete()
+                await admin_channel.get_partial_message(old_msg_id).delete()
             except:
                 pass  # Message already gone, that's fine
 
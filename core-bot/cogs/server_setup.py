@@ -1013,7 +1013,18 @@ class FactoryResetConfirmView(ui.View):
                 pass
 
             # Delete tournaments
+            async with db.execute(
+                "SELECT id FROM tournaments WHERE guild_id = ?", (guild_id,)
+            ) as cursor:
+                tournament_ids = [row[0] for row in await cursor.fetchall()]
             await db.execute("DELETE FROM tournaments WHERE guild_id = ?", (guild_id,))
+            tournament_service = getattr(self.cog.bot, "tournament_service", None)
+            if tournament_service:
+                tournament_service.invalidate_active(guild_id)
+            tournaments_cog = self.cog.bot.get_cog("TournamentsCog")
+            if tournaments_cog:
+                for tournament_id in tournament_ids:
+                    tournaments_cog.discard_registration_view(tournament_id)
 
             # Delete player data for this guild (players table doesn't have guild_id, so skip)
             # Players are global, not per-guild
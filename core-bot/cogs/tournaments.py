@@ -15,12 +15,14 @@ Commands:
 from __future__ import annotations
 
 import logging
-from typing import Optional, List
+from typing import Dict, Optional, List
 
 import discord
 from discord import app_commands, ui
 from discord.ext import commands
 
+from services.status_enums import TournamentPhase
+
 # Import UI components from ui/ package
 from ui.match_views import MatchCardView, CompletedMatchView
 from ui.tournament_views import (
@@ -304,9 +306,35 @@ class TournamentsCog(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        # tournament_id -> registration view, reused when a panel is reposted
+        self._reg_views: Dict[int, ui.View] = {}
+
+    def get_registration_view(self, tournament) -> ui.View:
+        """Return the registration view for a tournament, creating it once."""
+        view = self._reg_views.get(tournament.id)
+        if view is None:
+            view_cls = (
+                Registration1v1View
+                if tournament.format == "1v1"
+                else Registration2v2View
+            )
+            view = view_cls(self, tournament.id)
+            self._reg_views[tournament.id] = view
+        return view
+
+    def discard_registration_view(self, tournament_id: int) -> None:
+        """Forget a tournament's cached registration view."""
+        self._reg_views.pop(tournament_id, None)
+
+    def _on_tournament_status(self, tournament_id: int, status: str) -> None:
+        """Drop the cached registration view once registration is over."""
+        if status != TournamentPhase.REG_OPEN:
+            self.discard_registration_view(tournament_id)
 
     async def cog_load(self):
         """Register persistent views when cog loads."""
+        self.tournament_service.add_status_listener(self._on_tournament_status)
+
         # Register admin control panel
         self.bot.add_view(AdminControlPanel(self.bot))
 
@@ -316,6 +344,10 @@ class TournamentsCog(commands.Cog):
 
         log.info("[TOURNAMENT] Registered persistent views")
 
+    async def cog_unload(self):
+        """Stop listening for status changes when the cog is unloaded."""
+        self.tournament_service.remove_status_listener(self._on_tournament_status)
+
     @property
     def tournament_service(self):
         """Get tournament service from bot."""
@@ -469,11 +501,8 @@ class TournamentsCog(commands.Cog):
         reg_embed.add_field(name="Registered", value="0", inline=True)
         reg_embed.set_footer(text="UMS Bot Core • Single Elimination Tournament")
 
-        # Create appropriate view based on format
-        if tournament.format == "1v1":
-            view = Registration1v1View(self, tournament.id)
-        else:
-            view = Registration2v2View(self, tournament.id)
+        # Reuse the tournament's view if a panel was posted before
+        view = self.get_registration_view(tournament)
 
         reg_message = await target.send(embed=reg_embed, view=view)
 
@@ -884,8 +913,9 @@ class TournamentsCog(commands.Cog):
             return
 
         # Get unresolved (pending) matches
-        all_matches = await self.tournament_service.list_matches(tournament.id)
-        pending_matches = [m for m in all_matches if m.status == "pending"]
+        pending_matches = await self.tournament_service.list_matches_where(
+            tournament.id, "pending", require_both_entries=False
+        )
 
         if not pending_matches:
             embed = success_embed(
@@ -895,24 +925,23 @@ class TournamentsCog(commands.Cog):
             await interaction.followup.send(embed=embed, ephemeral=True)
             return
 
-        # Build match names lookup
-        match_names = {}
-        for match in pending_matches:
-            entry1_name = (
-                await self.tournament_service.get_entry_display_name(
-                    match.entry1_id, tournament.format
-                )
-                if match.entry1_id
-                else "BYE"
-            )
-            entry2_name = (
-                await self.tournament_service.get_entry_display_name(
-                    match.entry2_id, tournament.format
-                )
-                if match.entry2_id
-                else "BYE"
+        # Build match names lookup (one query for every entry)
+        names = await self.tournament_service.get_entry_display_names(
+            [
+                e
+                for m in pending_matches
+                for e in (m.entry1_id, m.entry2_id)
+                if e
+            ],
+            tournament.format,
+        )
+        match_names = {
+            m.id: (
+                names[m.entry1_id] if m.entry1_id else "BYE",
+                names[m.entry2_id] if m.entry2_id else "BYE",
             )
-            match_names[match.id] = (entry1_name, entry2_name)
+            for m in pending_matches
+        }
 
         # Show the override wizard
         from ui.tournament_views import MatchOverrideView
@@ -1010,30 +1039,12 @@ class TournamentsCog(commands.Cog):
             return
 
         # Get match counts for initial display
-        all_matches = await self.tournament_service.list_matches(tournament.id)
-        pending = [m for m in all_matches if m.status == "pending"]
-        completed = [m for m in all_matches if m.status == "completed"]
+        counts = await self.tournament_service.count_matches_by_status(tournament.id)
 
         # Import and create view
         from ui.tournament_views import DevBracketToolsView
 
-        embed = create_embed(
-            "Dev Bracket Tools",
-            f"**Tournament:** {tournament.name}\n**Code:** `{tournament.tournament_code}`",
-        )
-        embed.add_field(name="Status", value=tournament.status, inline=True)
-        embed.add_field(name="Pending", value=str(len(pending)), inline=True)
-        embed.add_field(name="Completed", value=str(len(completed)), inline=True)
-        embed.add_field(
-            name="Actions",
-            value=(
-                "• **Advance One** — Pick and resolve a single match\n"
-                "• **Advance Round** — Resolve all matches in lowest round\n"
-                "• **Auto-resolve** — Resolve all dummy vs dummy matches"
-            ),
-            inline=False,
-        )
-
+        embed = DevBracketToolsView.build_embed(tournament, counts)
         view = DevBracketToolsView(self.bot, tournament)
         await interaction.followup.send(embed=embed, view=view, ephemeral=True)
 
@@ -1120,38 +1131,31 @@ class TournamentsCog(commands.Cog):
 
         # Generate dummy entries
         # Use high synthetic IDs: 990000000000xxxx (won't conflict with real Discord IDs)
-        base_dummy_id = 9900000000000000 + (tournament_obj.id * 1000)
-        added = 0
-
-        for i in range(to_add):
-            dummy_player_id = base_dummy_id + current_entries + i
-
-            # Create dummy player record (optional, entries work with just player_id)
-            try:
-                await self.bot.player_service.db.execute(
-                    """
-                    INSERT OR IGNORE INTO players (user_id, discord_id, display_name, region, claimed_rank, has_onboarded)
-                    VALUES (?, ?, ?, ?, ?, 1)
-                    """,
-                    (
-                        dummy_player_id,
-                        dummy_player_id,
-                        f"DummyPlayer{i+1}",
-                        "USE",
-                        "Gold",
-                    ),
-                )
-                await self.bot.player_service.db.commit()
-            except Exception as e:
-                log.warning(f"[DEV] Could not create dummy player record: {e}")
+        base_dummy_id = self.tournament_service.DUMMY_PLAYER_ID_MIN + (
+            tournament_obj.id * 1000
+        )
+        dummy_ids = [base_dummy_id + current_entries + i for i in range(to_add)]
 
-            # Add tournament entry
-            entry = await self.tournament_service.add_dummy_entry(
-                tournament_id=tournament_obj.id,
-                dummy_player_id=dummy_player_id,
+        # Create dummy player records (optional, entries work with just player_id)
+        try:
+            await self.bot.player_service.db.executemany(
+                """
+                INSERT OR IGNORE INTO players (user_id, discord_id, display_name, region, claimed_rank, has_onboarded)
+                VALUES (?, ?, ?, ?, ?, 1)
+                """,
+                [
+                    (pid, pid, f"DummyPlayer{i+1}", "USE", "Gold")
+                    for i, pid in enumerate(dummy_ids)
+                ],
             )
-            if entry:
-                added += 1
+            await self.bot.player_service.db.commit()
+        except Exception as e:
+            log.warning(f"[DEV] Could not create dummy player records: {e}")
+
+        # Add tournament entries in one transaction
+        added = await self.tournament_service.add_dummy_entries_bulk(
+            tournament_obj.id, dummy_ids
+        )
 
         new_count = current_entries + added
 
@@ -8,7 +8,7 @@ All dev-only features should check access here for consistency.
 """
 
 import os
-from typing import Set
+from typing import FrozenSet, Set
 
 
 # =============================================================================
@@ -26,6 +26,9 @@ DEV_USERS: Set[int] = {
     1383507533901201449,  # Luke
 }
 
+# Frozen copy for hot-path membership checks (button clicks, etc.)
+DEV_USER_IDS: FrozenSet[int] = frozenset(DEV_USERS)
+
 
 # =============================================================================
 # ENVIRONMENT FLAGS
@@ -56,7 +59,7 @@ def is_dev_user(user_id: int) -> bool:
     Returns:
         True if the user can access dev tools, False otherwise.
     """
-    return user_id in DEV_USERS
+    return user_id in DEV_USER_IDS
 
 
 # =============================================================================
@@ -23,12 +23,14 @@ displayed in Core UX. Core uses claimed_rank for seeding only.
 
 from __future__ import annotations
 
+import hashlib
 import importlib.util
 import logging
 import os
 import time
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Dict, List, Optional
 
 import aiosqlite
 
@@ -39,9 +41,19 @@ DB_NAME = os.getenv("CORE_BOT_DB", "tournament_bot_core.db")
 
 SCHEMA_VERSION = 4  # UMS Core v1.0.0-core
 
+# WAL is durable across application crashes with synchronous=NORMAL; set
+# CORE_BOT_SQLITE_SYNC=FULL to also survive power loss on every commit.
+SQLITE_SYNC = os.getenv("CORE_BOT_SQLITE_SYNC", "NORMAL").strip().upper()
+if SQLITE_SYNC not in ("OFF", "NORMAL", "FULL", "EXTRA"):
+    SQLITE_SYNC = "NORMAL"
+
 # Idempotency flag
 _db_initialized = False
 
+# Idle connections kept open per database path for get_db()
+DB_POOL_SIZE = 4
+_idle_connections: Dict[str, List[aiosqlite.Connection]] = {}
+
 
 async def init_db_once(db_path: Optional[str] = None) -> float:
     """
@@ -67,250 +79,273 @@ def reset_db_init_flag():
     _db_initialized = False
 
 
+async def apply_pragmas(db: aiosqlite.Connection) -> None:
+    """Apply per-connection performance pragmas."""
+    await db.execute(f"PRAGMA synchronous = {SQLITE_SYNC}")
+    await db.execute("PRAGMA temp_store = MEMORY")
+    await db.execute("PRAGMA cache_size = -20000")  # ~20 MB
+    await db.execute("PRAGMA mmap_size = 268435456")  # 256 MB
+
+
+# Statements that build the UMS Core v3 schema, run in order by init_db.
+# Any edit here changes SCHEMA_FINGERPRINT, so existing databases rebuild
+# once on the next start.
+SCHEMA_STATEMENTS: tuple[str, ...] = (
+    # ------------------------------------------------------------------
+    # META - Schema version tracking
+    # ------------------------------------------------------------------
+    """
+    CREATE TABLE IF NOT EXISTS meta (
+        key   TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    )
+    """,
+
+    # ------------------------------------------------------------------
+    # PLAYERS - Minimal player identity for UMS Core
+    # Only fields needed for onboarding and basic identification
+    # ------------------------------------------------------------------
+    """
+    CREATE TABLE IF NOT EXISTS players (
+        user_id                    INTEGER PRIMARY KEY,
+        discord_id                 INTEGER UNIQUE,
+        display_name               TEXT,
+        region                     TEXT,
+        primary_mode               TEXT,
+        claimed_rank               TEXT,
+        has_onboarded              INTEGER DEFAULT 0,
+        created_at                 INTEGER DEFAULT (strftime('%s', 'now')),
+        updated_at                 INTEGER DEFAULT (strftime('%s', 'now'))
+    )
+    """,
+
+    # ------------------------------------------------------------------
+    # GUILD_CONFIG - v3 Server Configuration (source of truth)
+    # Clean, minimal config for UMS Core
+    # ------------------------------------------------------------------
+    """
+    CREATE TABLE IF NOT EXISTS guild_config (
+        guild_id                INTEGER PRIMARY KEY,
+        admin_channel           INTEGER,
+        announce_channel        INTEGER,
+        request_channel         INTEGER,
+        onboarding_channel      INTEGER,
+        ums_admin_role          INTEGER,
+        setup_completed         INTEGER DEFAULT 0,
+        onboarding_channel_created  INTEGER DEFAULT 0,
+        admin_channel_created       INTEGER DEFAULT 0,
+        announce_channel_created    INTEGER DEFAULT 0,
+        created_at              INTEGER DEFAULT (strftime('%s', 'now')),
+        updated_at              INTEGER DEFAULT (strftime('%s', 'now'))
+    )
+    """,
+
+    # ------------------------------------------------------------------
+    # TOURNAMENT_REQUESTS - Request tracking with approval workflow
+    # NOTE: Core edition does NOT use this table.
+    # It exists for schema alignment with the full UMS Bot (Premium).
+    # Core uses direct tournament creation via /tournament_create.
+    # ------------------------------------------------------------------
+    """
+    CREATE TABLE IF NOT EXISTS tournament_requests (
+        id                      INTEGER PRIMARY KEY AUTOINCREMENT,
+        guild_id                INTEGER NOT NULL,
+        requester_id            INTEGER NOT NULL,
+        name                    TEXT NOT NULL,
+        region                  TEXT,
+        format                  TEXT,
+        size                    TEXT,
+        match_length            TEXT,
+        start_time              TEXT,
+        scheduled_start         INTEGER,
+        rank_restriction        TEXT,
+        region_restriction      TEXT,
+        status                  TEXT DEFAULT 'pending',
+        admin_message_id        INTEGER,
+        resolved_by             INTEGER,
+        resolved_at             INTEGER,
+        decline_reason          TEXT,
+        tournament_key          TEXT,
+        created_at              INTEGER DEFAULT (strftime('%s', 'now'))
+    )
+    """,
+
+    "CREATE INDEX IF NOT EXISTS idx_requests_guild_status ON tournament_requests(guild_id, status)",
+    "CREATE INDEX IF NOT EXISTS idx_requests_requester ON tournament_requests(requester_id)",
+
+    # ------------------------------------------------------------------
+    # TOURNAMENTS - Single Elimination tournament records
+    # ------------------------------------------------------------------
+    """
+    CREATE TABLE IF NOT EXISTS tournaments (
+        id                      INTEGER PRIMARY KEY AUTOINCREMENT,
+        guild_id                INTEGER NOT NULL,
+        name                    TEXT NOT NULL,
+        tournament_code         TEXT UNIQUE,
+        format                  TEXT NOT NULL,
+        size                    INTEGER NOT NULL,
+        status                  TEXT NOT NULL DEFAULT 'draft',
+        reg_message_id          INTEGER,
+        reg_channel_id          INTEGER,
+        allowed_regions         TEXT,
+        allowed_ranks           TEXT,
+        winner_player_id        INTEGER,
+        runner_up_player_id     INTEGER,
+        completed_at            INTEGER,
+        dashboard_channel_id    INTEGER,
+        dashboard_message_id    INTEGER,
+        created_at              INTEGER DEFAULT (strftime('%s', 'now'))
+    )
+    """,
+
+    "CREATE INDEX IF NOT EXISTS idx_tournaments_guild_status ON tournaments(guild_id, status)",
+    (
+        "CREATE INDEX IF NOT EXISTS idx_tournaments_guild_status_created "
+        "ON tournaments(guild_id, status, created_at DESC)"
+    ),
+
+    # ------------------------------------------------------------------
+    # TOURNAMENT_ENTRIES - Player/team registrations
+    # ------------------------------------------------------------------
+    """
+    CREATE TABLE IF NOT EXISTS tournament_entries (
+        id                      INTEGER PRIMARY KEY AUTOINCREMENT,
+        tournament_id           INTEGER NOT NULL,
+        player1_id              INTEGER NOT NULL,
+        player2_id              INTEGER,
+        team_name               TEXT,
+        seed                    INTEGER,
+        created_at              INTEGER DEFAULT (strftime('%s', 'now')),
+        FOREIGN KEY (tournament_id) REFERENCES tournaments(id)
+    )
+    """,
+
+    "CREATE INDEX IF NOT EXISTS idx_entries_tournament ON tournament_entries(tournament_id)",
+
+    # ------------------------------------------------------------------
+    # MATCHES - SE bracket matches
+    # ------------------------------------------------------------------
+    """
+    CREATE TABLE IF NOT EXISTS matches (
+        id                      INTEGER PRIMARY KEY AUTOINCREMENT,
+        tournament_id           INTEGER NOT NULL,
+        round                   INTEGER NOT NULL,
+        match_index             INTEGER NOT NULL,
+        entry1_id               INTEGER,
+        entry2_id               INTEGER,
+        winner_entry_id         INTEGER,
+        score_text              TEXT,
+        status                  TEXT NOT NULL DEFAULT 'pending',
+        pending_winner_entry_id INTEGER,
+        pending_reported_by     INTEGER,
+        FOREIGN KEY (tournament_id) REFERENCES tournaments(id)
+    )
+    """,
+
+    "CREATE INDEX IF NOT EXISTS idx_matches_tournament ON matches(tournament_id, round)",
+
+    # ------------------------------------------------------------------
+    # LEGACY: server_configs (read-only fallback, do not write)
+    # Keep for backwards compatibility with existing installs
+    # ------------------------------------------------------------------
+    """
+    CREATE TABLE IF NOT EXISTS server_configs (
+        guild_id                    INTEGER PRIMARY KEY,
+        tournament_requests_channel INTEGER,
+        admin_review_channel        INTEGER,
+        registration_channel        INTEGER,
+        results_channel             INTEGER,
+        casual_match_channel        INTEGER,
+        rank_channel                INTEGER,
+        clan_channel                INTEGER,
+        audit_channel               INTEGER,
+        admin_role                  INTEGER,
+        organizer_role              INTEGER,
+        enabled                     INTEGER DEFAULT 1,
+        setup_completed             INTEGER DEFAULT 0,
+        setup_date                  INTEGER,
+        enable_leaderboard          INTEGER DEFAULT 1,
+        enable_player_profiles      INTEGER DEFAULT 1,
+        enable_casual_matches       INTEGER DEFAULT 1,
+        created_at                  INTEGER,
+        updated_at                  INTEGER
+    )
+    """,
+
+    # ------------------------------------------------------------------
+    # ORGANIZER RATE LIMITING
+    # NOTE: Core edition does NOT use these tables.
+    # They exist for schema alignment with the full UMS Bot (Premium).
+    # ------------------------------------------------------------------
+    """
+    CREATE TABLE IF NOT EXISTS organizer_cooldowns (
+        user_id         INTEGER PRIMARY KEY,
+        cooldown_until  INTEGER NOT NULL
+    )
+    """,
+
+    """
+    CREATE TABLE IF NOT EXISTS organizer_bans (
+        user_id         INTEGER PRIMARY KEY,
+        reason          TEXT,
+        banned_at       INTEGER,
+        banned_by       TEXT
+    )
+    """,
+)
+
+SCHEMA_FINGERPRINT = hashlib.sha1(
+    "\n".join(SCHEMA_STATEMENTS).encode()
+).hexdigest()[:16]
+
+# The whole build as one script (one aiosqlite round-trip, one transaction).
+# Both meta values are constants, so they are inlined at import time.
+_SCHEMA_SCRIPT = (
+    "BEGIN IMMEDIATE;\n"
+    + "".join(f"{statement.strip()};\n" for statement in SCHEMA_STATEMENTS)
+    + "INSERT OR REPLACE INTO meta (key, value) VALUES "
+    + f"('schema_version', '{SCHEMA_VERSION}'), "
+    + f"('schema_fingerprint', '{SCHEMA_FINGERPRINT}');\n"
+    + "COMMIT;\n"
+)
+
+
+async def _schema_is_current(db: aiosqlite.Connection) -> bool:
+    """Return True if the database was built from this exact schema."""
+    try:
+        async with db.execute(
+            "SELECT key, value FROM meta "
+            "WHERE key IN ('schema_version', 'schema_fingerprint')"
+        ) as cursor:
+            stored = dict(await cursor.fetchall())
+    except aiosqlite.OperationalError:
+        return False  # No meta table yet: fresh database
+
+    return stored == {
+        "schema_version": str(SCHEMA_VERSION),
+        "schema_fingerprint": SCHEMA_FINGERPRINT,
+    }
+
+
 async def init_db(db_path: Optional[str] = None) -> None:
     """Initialize the database with the UMS Core v3 schema."""
     target_db = db_path or DB_NAME
 
     async with aiosqlite.connect(target_db) as db:
         await db.execute("PRAGMA foreign_keys = ON")
-
-        # ------------------------------------------------------------------
-        # META - Schema version tracking
-        # ------------------------------------------------------------------
-        await db.execute(
-            """
-            CREATE TABLE IF NOT EXISTS meta (
-                key   TEXT PRIMARY KEY,
-                value TEXT NOT NULL
-            )
-            """
-        )
-
-        await db.execute(
-            """
-            INSERT OR REPLACE INTO meta (key, value)
-            VALUES ('schema_version', ?)
-            """,
-            (str(SCHEMA_VERSION),),
-        )
-
-        # ------------------------------------------------------------------
-        # PLAYERS - Minimal player identity for UMS Core
-        # Only fields needed for onboarding and basic identification
-        # ------------------------------------------------------------------
-        await db.execute(
-            """
-            CREATE TABLE IF NOT EXISTS players (
-                user_id                    INTEGER PRIMARY KEY,
-                discord_id                 INTEGER UNIQUE,
-                display_name               TEXT,
-                region                     TEXT,
-                primary_mode               TEXT,
-                claimed_rank               TEXT,
-                has_onboarded              INTEGER DEFAULT 0,
-                created_at                 INTEGER DEFAULT (strftime('%s', 'now')),
-                updated_at                 INTEGER DEFAULT (strftime('%s', 'now'))
-            )
-            """
-        )
-
-        # ------------------------------------------------------------------
-        # GUILD_CONFIG - v3 Server Configuration (source of truth)
-        # Clean, minimal config for UMS Core
-        # ------------------------------------------------------------------
-        await db.execute(
-            """
-            CREATE TABLE IF NOT EXISTS guild_config (
-                guild_id                INTEGER PRIMARY KEY,
-                admin_channel           INTEGER,
-                announce_channel        INTEGER,
-                request_channel         INTEGER,
-                onboarding_channel      INTEGER,
-                ums_admin_role          INTEGER,
-                setup_completed         INTEGER DEFAULT 0,
-                onboarding_channel_created  INTEGER DEFAULT 0,
-                admin_channel_created       INTEGER DEFAULT 0,
-                announce_channel_created    INTEGER DEFAULT 0,
-                created_at              INTEGER DEFAULT (strftime('%s', 'now')),
-                updated_at              INTEGER DEFAULT (strftime('%s', 'now'))
+        # WAL is persistent in the database file; set it once here
+        await db.execute("PRAGMA journal_mode = WAL")
+        await apply_pragmas(db)
+
+        # Warm boot: skip the CREATE ... IF NOT EXISTS pass entirely
+        if await _schema_is_current(db):
+            log.info(
+                "[CORE-DB] Schema v%s already current at %s", SCHEMA_VERSION, target_db
             )
-            """
-        )
-
-        # ------------------------------------------------------------------
-        # TOURNAMENT_REQUESTS - Request tracking with approval workflow
-        # NOTE: Core edition does NOT use this table.
-        # It exists for schema alignment with the full UMS Bot (Premium).
-        # Core uses direct tournament creation via /tournament_create.
-        # ------------------------------------------------------------------
-        await db.execute(
-            """
-            CREATE TABLE IF NOT EXISTS tournament_requests (
-                id                      INTEGER PRIMARY KEY AUTOINCREMENT,
-                guild_id                INTEGER NOT NULL,
-                requester_id            INTEGER NOT NULL,
-                name                    TEXT NOT NULL,
-                region                  TEXT,
-                format                  TEXT,
-                size                    TEXT,
-                match_length            TEXT,
-                start_time              TEXT,
-                scheduled_start         INTEGER,
-                rank_restriction        TEXT,
-                region_restriction      TEXT,
-                status                  TEXT DEFAULT 'pending',
-                admin_message_id        INTEGER,
-                resolved_by             INTEGER,
-                resolved_at             INTEGER,
-                decline_reason          TEXT,
-                tournament_key          TEXT,
-                created_at              INTEGER DEFAULT (strftime('%s', 'now'))
-            )
-            """
-        )
-
-        await db.execute(
-            "CREATE INDEX IF NOT EXISTS idx_requests_guild_status ON tournament_requests(guild_id, status)"
-        )
-        await db.execute(
-            "CREATE INDEX IF NOT EXISTS idx_requests_requester ON tournament_requests(requester_id)"
-        )
-
-        # ------------------------------------------------------------------
-        # TOURNAMENTS - Single Elimination tournament records
-        # ------------------------------------------------------------------
-        await db.execute(
-            """
-            CREATE TABLE IF NOT EXISTS tournaments (
-                id                      INTEGER PRIMARY KEY AUTOINCREMENT,
-                guild_id                INTEGER NOT NULL,
-                name                    TEXT NOT NULL,
-                tournament_code         TEXT UNIQUE,
-                format                  TEXT NOT NULL,
-                size                    INTEGER NOT NULL,
-                status                  TEXT NOT NULL DEFAULT 'draft',
-                reg_message_id          INTEGER,
-                reg_channel_id          INTEGER,
-                allowed_regions         TEXT,
-                allowed_ranks           TEXT,
-                winner_player_id        INTEGER,
-                runner_up_player_id     INTEGER,
-                completed_at            INTEGER,
-                dashboard_channel_id    INTEGER,
-                dashboard_message_id    INTEGER,
-                created_at              INTEGER DEFAULT (strftime('%s', 'now'))
-            )
-            """
-        )
-
-        await db.execute(
-            "CREATE INDEX IF NOT EXISTS idx_tournaments_guild_status ON tournaments(guild_id, status)"
-        )
-
-        # ------------------------------------------------------------------
-        # TOURNAMENT_ENTRIES - Player/team registrations
-        # ------------------------------------------------------------------
-        await db.execute(
-            """
-            CREATE TABLE IF NOT EXISTS tournament_entries (
-                id                      INTEGER PRIMARY KEY AUTOINCREMENT,
-                tournament_id           INTEGER NOT NULL,
-                player1_id              INTEGER NOT NULL,
-                player2_id              INTEGER,
-                team_name               TEXT,
-                seed                    INTEGER,
-                created_at              INTEGER DEFAULT (strftime('%s', 'now')),
-                FOREIGN KEY (tournament_id) REFERENCES tournaments(id)
-            )
-            """
-        )
-
-        await db.execute(
-            "CREATE INDEX IF NOT EXISTS idx_entries_tournament ON tournament_entries(tournament_id)"
-        )
-
-        # ------------------------------------------------------------------
-        # MATCHES - SE bracket matches
-        # ------------------------------------------------------------------
-        await db.execute(
-            """
-            CREATE TABLE IF NOT EXISTS matches (
-                id                      INTEGER PRIMARY KEY AUTOINCREMENT,
-                tournament_id           INTEGER NOT NULL,
-                round                   INTEGER NOT NULL,
-                match_index             INTEGER NOT NULL,
-                entry1_id               INTEGER,
-                entry2_id               INTEGER,
-                winner_entry_id         INTEGER,
-                score_text              TEXT,
-                status                  TEXT NOT NULL DEFAULT 'pending',
-                pending_winner_entry_id INTEGER,
-                pending_reported_by     INTEGER,
-                FOREIGN KEY (tournament_id) REFERENCES tournaments(id)
-            )
-            """
-        )
-
-        await db.execute(
-            "CREATE INDEX IF NOT EXISTS idx_matches_tournament ON matches(tournament_id, round)"
-        )
-
-        # ------------------------------------------------------------------
-        # LEGACY: server_configs (read-only fallback, do not write)
-        # Keep for backwards compatibility with existing installs
-        # ------------------------------------------------------------------
-        await db.execute(
-            """
-            CREATE TABLE IF NOT EXISTS server_configs (
-                guild_id                    INTEGER PRIMARY KEY,
-                tournament_requests_channel INTEGER,
-                admin_review_channel        INTEGER,
-                registration_channel        INTEGER,
-                results_channel             INTEGER,
-                casual_match_channel        INTEGER,
-                rank_channel                INTEGER,
-                clan_channel                INTEGER,
-                audit_channel               INTEGER,
-                admin_role                  INTEGER,
-                organizer_role              INTEGER,
-                enabled                     INTEGER DEFAULT 1,
-                setup_completed             INTEGER DEFAULT 0,
-                setup_date                  INTEGER,
-                enable_leaderboard          INTEGER DEFAULT 1,
-                enable_player_profiles      INTEGER DEFAULT 1,
-                enable_casual_matches       INTEGER DEFAULT 1,
-                created_at                  INTEGER,
-                updated_at                  INTEGER
-            )
-            """
-        )
-
-        # ------------------------------------------------------------------
-        # ORGANIZER RATE LIMITING
-        # NOTE: Core edition does NOT use these tables.
-        # They exist for schema alignment with the full UMS Bot (Premium).
-        # ------------------------------------------------------------------
-        await db.execute(
-            """
-            CREATE TABLE IF NOT EXISTS organizer_cooldowns (
-                user_id         INTEGER PRIMARY KEY,
-                cooldown_until  INTEGER NOT NULL
-            )
-            """
-        )
-
-        await db.execute(
-            """
-            CREATE TABLE IF NOT EXISTS organizer_bans (
-                user_id         INTEGER PRIMARY KEY,
-                reason          TEXT,
-                banned_at       INTEGER,
-                banned_by       TEXT
-            )
-            """
-        )
+            return
 
-        await db.commit()
+        # Build the whole schema in one transaction (one journal sync)
+        await db.executescript(_SCHEMA_SCRIPT)
         log.info("[CORE-DB] Schema initialized at %s (v%s)", target_db, SCHEMA_VERSION)
 
 
@@ -388,11 +423,47 @@ async def migrate_legacy_config(db: aiosqlite.Connection, guild_id: int) -> bool
     return True
 
 
-async def get_db() -> aiosqlite.Connection:
-    """Get a database connection."""
-    db = await aiosqlite.connect(DB_NAME)
+@asynccontextmanager
+async def get_db(
+    db_path: Optional[str] = None,
+) -> AsyncIterator[aiosqlite.Connection]:
+    """
+    Borrow a pooled database connection.
+
+    Up to DB_POOL_SIZE connections per file stay open between uses, so their
+    page cache stays warm and callers skip connect/pragma setup. Anything
+    left uncommitted is rolled back when the connection is returned.
+    """
+    target_db = db_path or DB_NAME
+    idle = _idle_connections.setdefault(target_db, [])
+    if idle:
+        db = idle.pop()
+    else:
+        db = await aiosqlite.connect(target_db)
+        await apply_pragmas(db)
     db.row_factory = aiosqlite.Row
-    return db
+
+    try:
+        yield db
+    finally:
+        try:
+            if db.in_transaction:
+                await db.rollback()
+            reusable = len(idle) < DB_POOL_SIZE
+        except Exception:
+            reusable = False
+        if reusable:
+            idle.append(db)
+        else:
+            await db.close()
+
+
+async def close_db_pool() -> None:
+    """Close every idle pooled connection (shutdown)."""
+    for idle in _idle_connections.values():
+        while idle:
+            await idle.pop().close()
+    _idle_connections.clear()
 
 
 def get_db_path() -> str:
@@ -438,11 +509,12 @@ async def validate_schema(db_path: Optional[str] = None) -> dict:
     result = {}
 
     async with aiosqlite.connect(target_db) as db:
-        for table in core_tables:
-            async with db.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name=?", (table,)
-            ) as cursor:
-                row = await cursor.fetchone()
-                result[table] = row is not None
+        async with db.execute(
+            "SELECT name FROM sqlite_master WHERE type='table'"
+        ) as cursor:
+            existing = {row[0] for row in await cursor.fetchall()}
+
+    for table in core_tables:
+        result[table] = table in existing
 
     return result
@@ -8,6 +8,8 @@ so factory reset can delete only bot-created channels.
 import logging
 import aiosqlite
 
+from migrations import get_columns, invalidate_columns
+
 log = logging.getLogger(__name__)
 
 
@@ -15,26 +17,28 @@ async def run(db: aiosqlite.Connection) -> None:
     """Add channel_created tracking columns to guild_config."""
     try:
         # Check if columns exist
-        cursor = await db.execute("PRAGMA table_info(guild_config)")
-        columns = [row[1] for row in await cursor.fetchall()]
+        columns = await get_columns(db, "guild_config")
 
         # Add columns if missing
         if "onboarding_channel_created" not in columns:
             await db.execute(
                 "ALTER TABLE guild_config ADD COLUMN onboarding_channel_created INTEGER DEFAULT 0"
             )
+            invalidate_columns("guild_config")
             log.info("[MIGRATION-009] Added onboarding_channel_created column")
 
         if "admin_channel_created" not in columns:
             await db.execute(
                 "ALTER TABLE guild_config ADD COLUMN admin_channel_created INTEGER DEFAULT 0"
             )
+            invalidate_columns("guild_config")
             log.info("[MIGRATION-009] Added admin_channel_created column")
 
         if "announce_channel_created" not in columns:
             await db.execute(
                 "ALTER TABLE guild_config ADD COLUMN announce_channel_created INTEGER DEFAULT 0"
             )
+            invalidate_columns("guild_config")
             log.info("[MIGRATION-009] Added announce_channel_created column")
 
         await db.commit()
@@ -8,15 +8,19 @@ UMS Core needs INTEGER id as primary key.
 import logging
 import aiosqlite
 
+from migrations import get_columns, invalidate_columns
+
 log = logging.getLogger(__name__)
 
 
 async def run(db: aiosqlite.Connection) -> None:
     """Recreate tournaments table with new schema if needed."""
+    # Drop, recreate and index as one unit (one commit at the end)
+    if not db.in_transaction:
+        await db.execute("BEGIN")
     try:
         # Check current schema
-        cursor = await db.execute("PRAGMA table_info(tournaments)")
-        columns = {row[1]: row[2] for row in await cursor.fetchall()}
+        columns = await get_columns(db, "tournaments")
 
         # If 'id' column doesn't exist or 'key' exists, we need to migrate
         if "id" not in columns or "key" in columns:
@@ -24,6 +28,7 @@ async def run(db: aiosqlite.Connection) -> None:
 
             # Drop old tournaments table (data will be lost but that's expected for Core)
             await db.execute("DROP TABLE IF EXISTS tournaments")
+            invalidate_columns("tournaments")
 
             # Create new schema
             await db.execute(
@@ -92,5 +97,6 @@ async def run(db: aiosqlite.Connection) -> None:
         log.info("[MIGRATION-010] Core tournament schema complete")
 
     except Exception as e:
+        await db.rollback()
         log.error(f"[MIGRATION-010] Failed: {e}")
         raise
@@ -7,6 +7,8 @@ Adds optional restriction columns for tournament registration.
 import logging
 import aiosqlite
 
+from migrations import get_columns, invalidate_columns
+
 log = logging.getLogger(__name__)
 
 
@@ -14,16 +16,17 @@ async def run(db: aiosqlite.Connection) -> None:
     """Add allowed_regions and allowed_ranks columns to tournaments."""
     try:
         # Check if columns exist
-        cursor = await db.execute("PRAGMA table_info(tournaments)")
-        columns = [row[1] for row in await cursor.fetchall()]
+        columns = await get_columns(db, "tournaments")
 
         # Add columns if missing
         if "allowed_regions" not in columns:
             await db.execute("ALTER TABLE tournaments ADD COLUMN allowed_regions TEXT")
+            invalidate_columns("tournaments")
             log.info("[MIGRATION-011] Added allowed_regions column")
 
         if "allowed_ranks" not in columns:
             await db.execute("ALTER TABLE tournaments ADD COLUMN allowed_ranks TEXT")
+            invalidate_columns("tournaments")
             log.info("[MIGRATION-011] Added allowed_ranks column")
 
         await db.commit()
@@ -7,6 +7,8 @@ Adds winner_player_id, runner_up_player_id, completed_at for trophy preservation
 import logging
 import aiosqlite
 
+from migrations import get_columns, invalidate_columns
+
 log = logging.getLogger(__name__)
 
 
@@ -14,24 +16,26 @@ async def run(db: aiosqlite.Connection) -> None:
     """Add archive fields to tournaments table."""
     try:
         # Check existing columns
-        cursor = await db.execute("PRAGMA table_info(tournaments)")
-        columns = [row[1] for row in await cursor.fetchall()]
+        columns = await get_columns(db, "tournaments")
 
         # Add columns if missing
         if "winner_player_id" not in columns:
             await db.execute(
                 "ALTER TABLE tournaments ADD COLUMN winner_player_id INTEGER"
             )
+            invalidate_columns("tournaments")
             log.info("[MIGRATION-012] Added winner_player_id column")
 
         if "runner_up_player_id" not in columns:
             await db.execute(
                 "ALTER TABLE tournaments ADD COLUMN runner_up_player_id INTEGER"
             )
+            invalidate_columns("tournaments")
             log.info("[MIGRATION-012] Added runner_up_player_id column")
 
         if "completed_at" not in columns:
             await db.execute("ALTER TABLE tournaments ADD COLUMN completed_at INTEGER")
+            invalidate_columns("tournaments")
             log.info("[MIGRATION-012] Added completed_at column")
 
         await db.commit()
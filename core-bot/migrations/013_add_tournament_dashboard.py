@@ -7,6 +7,8 @@ Adds dashboard_channel_id and dashboard_message_id for the tournament dashboard.
 import logging
 import aiosqlite
 
+from migrations import get_columns, invalidate_columns
+
 log = logging.getLogger(__name__)
 
 
@@ -14,20 +16,21 @@ async def run(db: aiosqlite.Connection) -> None:
     """Add dashboard fields to tournaments table."""
     try:
         # Check existing columns
-        cursor = await db.execute("PRAGMA table_info(tournaments)")
-        columns = [row[1] for row in await cursor.fetchall()]
+        columns = await get_columns(db, "tournaments")
 
         # Add columns if missing
         if "dashboard_channel_id" not in columns:
             await db.execute(
                 "ALTER TABLE tournaments ADD COLUMN dashboard_channel_id INTEGER"
             )
+            invalidate_columns("tournaments")
             log.info("[MIGRATION-013] Added dashboard_channel_id column")
 
         if "dashboard_message_id" not in columns:
             await db.execute(
                 "ALTER TABLE tournaments ADD COLUMN dashboard_message_id INTEGER"
             )
+            invalidate_columns("tournaments")
             log.info("[MIGRATION-013] Added dashboard_message_id column")
 
         await db.commit()
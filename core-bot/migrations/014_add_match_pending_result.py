@@ -8,6 +8,8 @@ When both players report, results are compared before finalizing.
 import logging
 import aiosqlite
 
+from migrations import get_columns, invalidate_columns
+
 log = logging.getLogger(__name__)
 
 
@@ -15,20 +17,21 @@ async def run(db: aiosqlite.Connection) -> None:
     """Add pending result fields to matches table."""
     try:
         # Check existing columns
-        cursor = await db.execute("PRAGMA table_info(matches)")
-        columns = [row[1] for row in await cursor.fetchall()]
+        columns = await get_columns(db, "matches")
 
         # Add columns if missing
         if "pending_winner_entry_id" not in columns:
             await db.execute(
                 "ALTER TABLE matches ADD COLUMN pending_winner_entry_id INTEGER"
             )
+            invalidate_columns("matches")
             log.info("[MIGRATION-014] Added pending_winner_entry_id column")
 
         if "pending_reported_by" not in columns:
             await db.execute(
                 "ALTER TABLE matches ADD COLUMN pending_reported_by INTEGER"
             )
+            invalidate_columns("matches")
             log.info("[MIGRATION-014] Added pending_reported_by column")
 
         await db.commit()
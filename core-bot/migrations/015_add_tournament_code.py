@@ -8,6 +8,8 @@ import logging
 import random
 import aiosqlite
 
+from migrations import get_columns, invalidate_columns
+
 log = logging.getLogger(__name__)
 
 # Code alphabet: no confusing chars (0/O, 1/I)
@@ -24,12 +26,12 @@ async def run(db: aiosqlite.Connection) -> None:
     """Add tournament_code column and backfill existing tournaments."""
     try:
         # Check existing columns
-        cursor = await db.execute("PRAGMA table_info(tournaments)")
-        columns = [row[1] for row in await cursor.fetchall()]
+        columns = await get_columns(db, "tournaments")
 
         # Add column if missing
         if "tournament_code" not in columns:
             await db.execute("ALTER TABLE tournaments ADD COLUMN tournament_code TEXT")
+            invalidate_columns("tournaments")
             log.info("[MIGRATION-015] Added tournament_code column")
 
             # Create unique index
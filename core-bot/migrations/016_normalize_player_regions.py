@@ -0,0 +1,38 @@
+"""
+Migration 016: Normalize player region codes
+--------------------------------------------
+Upper-cases and trims players.region so tournament restriction checks can
+compare stored regions directly. New writes are normalized by PlayerService.
+"""
+
+import logging
+import aiosqlite
+
+from migrations import get_columns
+
+log = logging.getLogger(__name__)
+
+
+async def run(db: aiosqlite.Connection) -> None:
+    """Backfill players.region as trimmed upper-case codes."""
+    try:
+        columns = await get_columns(db, "players")
+
+        if "region" not in columns:
+            return
+
+        cursor = await db.execute(
+            """
+            UPDATE players
+            SET region = UPPER(TRIM(region))
+            WHERE region IS NOT NULL AND region != UPPER(TRIM(region))
+            """
+        )
+        if cursor.rowcount:
+            log.info(f"[MIGRATION-016] Normalized region for {cursor.rowcount} players")
+
+        await db.commit()
+
+    except Exception as e:
+        log.error(f"[MIGRATION-016] Failed: {e}")
+        raise
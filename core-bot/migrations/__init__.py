@@ -9,10 +9,31 @@ Only run migrations that apply to core tables: players, guild_config, tournament
 
 import importlib
 import logging
+from typing import Dict, FrozenSet
+
 import aiosqlite
 
 log = logging.getLogger(__name__)
 
+# Column names per table, shared by the migrations in one run_migrations pass.
+# Defined before the migration imports below so they can import it.
+_column_cache: Dict[str, FrozenSet[str]] = {}
+
+
+async def get_columns(db: aiosqlite.Connection, table: str) -> FrozenSet[str]:
+    """Return a table's column names, reading PRAGMA table_info once per run."""
+    columns = _column_cache.get(table)
+    if columns is None:
+        cursor = await db.execute(f"PRAGMA table_info({table})")
+        columns = frozenset(row[1] for row in await cursor.fetchall())
+        _column_cache[table] = columns
+    return columns
+
+
+def invalidate_columns(table: str) -> None:
+    """Forget a table's cached columns (call after ALTER/DROP TABLE)."""
+    _column_cache.pop(table, None)
+
 # -----------------------------------------------------------------------------
 # UMS CORE MIGRATIONS ONLY
 # DO NOT add migrations that reference: teams, matches_unified, match_participants
@@ -44,6 +65,9 @@ _add_pending_result = importlib.import_module(
 _add_tournament_code = importlib.import_module(
     ".015_add_tournament_code", package="migrations"
 )
+_normalize_player_regions = importlib.import_module(
+    ".016_normalize_player_regions", package="migrations"
+)
 
 # List of UMS Core migrations in order
 # These ONLY touch tables that exist in UMS Core
@@ -57,6 +81,7 @@ MIGRATIONS = [
     _add_dashboard,  # dashboard_channel_id/message_id
     _add_pending_result,  # pending_winner_entry_id/reported_by for confirmations
     _add_tournament_code,  # tournament_code for human-friendly IDs
+    _normalize_player_regions,  # upper-case players.region for restriction checks
     # NOTE: Migrations 003-008 are for full tournament-bot and are intentionally excluded:
     # - 003_create_matches_unified: matches table (not in Core)
     # - 004_create_match_participants: match_participants table (not in Core)
@@ -78,6 +103,7 @@ async def run_migrations(
     """
     log.debug("[CORE-MIGRATIONS] Starting UMS Core migration runner...")
     migrations_run = 0
+    _column_cache.clear()
 
     for migration in MIGRATIONS:
         module_name = getattr(migration, "__name__", "unknown")
@@ -100,4 +126,4 @@ async def run_migrations(
     log.info(f"[CORE-MIGRATIONS] Complete ({migrations_run} migrations checked)")
 
 
-__all__ = ["run_migrations", "MIGRATIONS"]
+__all__ = ["run_migrations", "MIGRATIONS", "get_columns", "invalidate_columns"]
@@ -10,7 +10,7 @@ from __future__ import annotations
 import logging
 import time
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 import aiosqlite
 
@@ -48,16 +48,32 @@ class GuildConfigService:
     Automatically migrates from legacy server_configs on first access.
     """
 
+    CONFIG_CACHE_TTL = 60.0  # seconds
+
     def __init__(self, db: aiosqlite.Connection):
         self.db = db
         self.db.row_factory = aiosqlite.Row
+        # guild_id -> (cached_at, config); only configured guilds are cached
+        self._cache: Dict[int, Tuple[float, GuildConfig]] = {}
+
+    def invalidate(self, guild_id: Optional[int] = None) -> None:
+        """Drop the cached config for a guild (or for all guilds)."""
+        if guild_id is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(guild_id, None)
 
     async def get(self, guild_id: int) -> Optional[GuildConfig]:
         """
         Get guild configuration, migrating from legacy if needed.
 
-        Returns GuildConfig or None if not configured.
+        Returns GuildConfig or None if not configured. Configs are cached for
+        CONFIG_CACHE_TTL seconds; every write in this service invalidates.
         """
+        cached = self._cache.get(guild_id)
+        if cached and time.monotonic() - cached[0] < self.CONFIG_CACHE_TTL:
+            return cached[1]
+
         try:
             # Try guild_config first
             async with self.db.execute(
@@ -65,7 +81,9 @@ class GuildConfigService:
             ) as cursor:
                 row = await cursor.fetchone()
                 if row:
-                    return GuildConfig(**dict(row))
+                    config = GuildConfig(**dict(row))
+                    self._cache[guild_id] = (time.monotonic(), config)
+                    return config
 
             # Try migrating from legacy server_configs
             migrated = await self._migrate_legacy(guild_id)
@@ -190,6 +208,7 @@ class GuildConfigService:
             )
 
         await self.db.commit()
+        self.invalidate(guild_id)
         log.info(f"[CONFIG-SERVICE] Config saved for guild {guild_id}")
 
         return await self.get(guild_id)
@@ -207,6 +226,7 @@ class GuildConfigService:
                 (now, guild_id),
             )
             await self.db.commit()
+            self.invalidate(guild_id)
             log.info(f"[CONFIG-SERVICE] Setup complete for guild {guild_id}")
             return True
         except Exception as e:
@@ -234,6 +254,7 @@ class GuildConfigService:
                 (channel_id, now, guild_id),
             )
             await self.db.commit()
+            self.invalidate(guild_id)
             return True
         except Exception as e:
             log.error(f"[CONFIG-SERVICE] Failed to update channel: {e}")
@@ -248,6 +269,7 @@ class GuildConfigService:
                 (role_id, now, guild_id),
             )
             await self.db.commit()
+            self.invalidate(guild_id)
             return True
         except Exception as e:
             log.error(f"[CONFIG-SERVICE] Failed to update role: {e}")
@@ -265,6 +287,7 @@ class GuildConfigService:
                 "DELETE FROM guild_config WHERE guild_id = ?", (guild_id,)
             )
             await self.db.commit()
+            self.invalidate(guild_id)
             log.info(f"[CONFIG-SERVICE] Deleted config for guild {guild_id}")
             return True
         except Exception as e:
@@ -53,6 +53,11 @@ class PlayerService:
         self.db = db
         self.db.row_factory = aiosqlite.Row
 
+    @staticmethod
+    def normalize_region(region: Optional[str]) -> Optional[str]:
+        """Region codes are stored upper-case so readers can compare as-is."""
+        return region.strip().upper() if region else region
+
     async def get_by_discord_id(self, discord_id: int) -> Optional[Player]:
         """Get player by Discord ID."""
         try:
@@ -126,6 +131,7 @@ class PlayerService:
 
         Idempotent: safe to call multiple times, just updates profile.
         """
+        region = self.normalize_region(region)
         try:
             # Ensure player exists
             await self.get_or_create(discord_id, display_name)
@@ -158,6 +164,7 @@ class PlayerService:
 
     async def update_region(self, discord_id: int, region: str) -> bool:
         """Update player region."""
+        region = self.normalize_region(region)
         try:
             now = int(time.time())
             await self.db.execute(
@@ -20,6 +20,17 @@ class TournamentStatus(str, Enum):
     ARCHIVED = "archived"  # Tournament archived after completion
 
 
+class TournamentPhase(str, Enum):
+    """v3 tournament lifecycle states (tournaments.status)."""
+
+    DRAFT = "draft"  # Created, registration not yet open
+    REG_OPEN = "reg_open"  # Registration panel live
+    REG_CLOSED = "reg_closed"  # Entries locked, bracket not built
+    IN_PROGRESS = "in_progress"  # Bracket running
+    COMPLETED = "completed"  # Champion decided
+    CANCELLED = "cancelled"  # Cancelled by an admin
+
+
 class MatchStatus(str, Enum):
     """Match lifecycle states (applies to tournament matches and solo queue)."""
 
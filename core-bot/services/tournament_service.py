@@ -14,10 +14,13 @@ from __future__ import annotations
 import logging
 import time
 from dataclasses import dataclass
-from typing import Optional, List
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, Iterable, Optional, List
 
 import aiosqlite
 
+from services.status_enums import TournamentPhase
+
 log = logging.getLogger(__name__)
 
 
@@ -76,6 +79,18 @@ class Match:
     pending_reported_by: Optional[int] = None  # Who reported first
 
 
+@lru_cache(maxsize=128)
+def parse_restriction_csv(csv: str, title: bool = False) -> FrozenSet[str]:
+    """
+    Parse an allowed_regions/allowed_ranks CSV into a normalized set.
+
+    Regions are upper-cased; ranks (title=True) are title-cased, matching
+    how player profiles are compared against them.
+    """
+    parts = (r.strip() for r in csv.split(","))
+    return frozenset(r.title() if title else r.upper() for r in parts)
+
+
 # -----------------------------------------------------------------------------
 # Tournament Service
 # -----------------------------------------------------------------------------
@@ -92,22 +107,67 @@ class TournamentService:
     """
 
     # Valid statuses for tournaments
-    VALID_STATUSES = {
-        "draft",
-        "reg_open",
-        "reg_closed",
-        "in_progress",
-        "completed",
-        "cancelled",
+    VALID_STATUSES = {s.value for s in TournamentPhase}
+    ACTIVE_STATUSES = {
+        TournamentPhase.DRAFT.value,
+        TournamentPhase.REG_OPEN.value,
+        TournamentPhase.REG_CLOSED.value,
+        TournamentPhase.IN_PROGRESS.value,
     }
-    ACTIVE_STATUSES = {"draft", "reg_open", "reg_closed", "in_progress"}
 
     # Tournament code alphabet (no confusing chars: 0/O, 1/I)
     CODE_ALPHABET = "ABCDEFGHJKLMNPQRSTUVWXYZ23456789"
     CODE_LENGTH = 8
 
+    # Dummy IDs are 9900000000000000+ (17 digits starting with 99)
+    DUMMY_PLAYER_ID_MIN = 9900000000000000
+
+    # How long get_active_for_guild results are reused (admin click bursts)
+    ACTIVE_CACHE_TTL = 3.0  # seconds
+    # How long entry display names are reused (entries are never edited)
+    ENTRY_NAME_CACHE_TTL = 30.0  # seconds
+    ENTRY_NAME_CACHE_MAX = 4096
+
     def __init__(self, db: aiosqlite.Connection):
         self.db = db
+        # guild_id -> (cached_at, active tournament or None)
+        self._active_cache: Dict[int, tuple[float, Optional[Tournament]]] = {}
+        # tournament_id -> entry count; dropped whenever entries change
+        self._entry_counts: Dict[int, int] = {}
+        # (entry_id, format) -> (cached_at, display name); cleared on deletes
+        self._entry_names: Dict[tuple[int, str], tuple[float, str]] = {}
+        # Called with (tournament_id, new_status) after every status change
+        self._status_listeners: List[Callable[[int, str], None]] = []
+
+    def add_status_listener(self, listener: Callable[[int, str], None]) -> None:
+        """Register a callback run after set_status/update_status succeed."""
+        self._status_listeners.append(listener)
+
+    def remove_status_listener(self, listener: Callable[[int, str], None]) -> None:
+        """Unregister a callback added with add_status_listener."""
+        if listener in self._status_listeners:
+            self._status_listeners.remove(listener)
+
+    def _notify_status(self, tournament_id: int, status: str) -> None:
+        """Run status listeners; a failing listener never fails the update."""
+        for listener in self._status_listeners:
+            try:
+                listener(tournament_id, status)
+            except Exception as e:
+                log.error(f"[TOURNAMENT] Status listener failed: {e}")
+
+    def invalidate_active(self, guild_id: Optional[int] = None) -> None:
+        """Drop the cached active tournament for a guild (or for all guilds)."""
+        if guild_id is None:
+            self._active_cache.clear()
+        else:
+            self._active_cache.pop(guild_id, None)
+
+    def _invalidate_tournament(self, tournament_id: int) -> None:
+        """Drop any cached active-tournament entry for this tournament."""
+        for guild_id, (_, cached) in list(self._active_cache.items()):
+            if cached is not None and cached.id == tournament_id:
+                del self._active_cache[guild_id]
 
     # -------------------------------------------------------------------------
     # Tournament Code Helpers
@@ -223,6 +283,7 @@ class TournamentService:
                 ),
             )
             await self.db.commit()
+            self.invalidate_active(guild_id)
 
             tournament_id = cursor.lastrowid
             log.info(
@@ -295,8 +356,7 @@ class TournamentService:
     @staticmethod
     def is_dummy_player_id(player_id: int) -> bool:
         """Check if a player ID is a dummy (synthetic ID for testing)."""
-        # Dummy IDs are 9900000000000000+ (17 digits starting with 99)
-        return player_id >= 9900000000000000
+        return player_id >= TournamentService.DUMMY_PLAYER_ID_MIN
 
     async def get_by_id(self, tournament_id: int) -> Optional[Tournament]:
         """Get tournament by ID."""
@@ -311,12 +371,51 @@ class TournamentService:
 
         return self._row_to_tournament(row)
 
+    async def get_status(self, tournament_id: int) -> Optional[str]:
+        """Get only a tournament's status (narrow single-column read)."""
+        cursor = await self.db.execute(
+            "SELECT status FROM tournaments WHERE id = ?",
+            (tournament_id,),
+        )
+        row = await cursor.fetchone()
+
+        return row[0] if row else None
+
+    async def get_with_entry_count(
+        self, tournament_id: int
+    ) -> tuple[Optional[Tournament], int]:
+        """Get a tournament and its current entry count in one query."""
+        cursor = await self.db.execute(
+            """
+            SELECT t.*,
+                   (SELECT COUNT(*) FROM tournament_entries e
+                    WHERE e.tournament_id = t.id) AS entry_count
+            FROM tournaments t
+            WHERE t.id = ?
+            """,
+            (tournament_id,),
+        )
+        row = await cursor.fetchone()
+
+        if not row:
+            return None, 0
+
+        return self._row_to_tournament(row), row["entry_count"]
+
     async def get_active_for_guild(self, guild_id: int) -> Optional[Tournament]:
         """
         Get the active tournament for a guild.
 
         Active = status in (draft, reg_open, reg_closed, in_progress)
+
+        Results are cached for ACTIVE_CACHE_TTL seconds; this service's own
+        writes invalidate the entry, and callers that modify tournaments
+        with raw SQL should call invalidate_active().
         """
+        cached = self._active_cache.get(guild_id)
+        if cached and time.monotonic() - cached[0] < self.ACTIVE_CACHE_TTL:
+            return cached[1]
+
         cursor = await self.db.execute(
             """
             SELECT * FROM tournaments
@@ -328,10 +427,25 @@ class TournamentService:
         )
         row = await cursor.fetchone()
 
-        if not row:
-            return None
+        tournament = self._row_to_tournament(row) if row else None
+        self._active_cache[guild_id] = (time.monotonic(), tournament)
+        return tournament
 
-        return self._row_to_tournament(row)
+    async def get_most_recent_archivable(
+        self, guild_id: int
+    ) -> Optional[Tournament]:
+        """Get the guild's most recent completed or cancelled tournament."""
+        cursor = await self.db.execute(
+            """
+            SELECT * FROM tournaments
+            WHERE guild_id = ? AND status IN ('completed', 'cancelled')
+            ORDER BY created_at DESC
+            LIMIT 1
+            """,
+            (guild_id,),
+        )
+        row = await cursor.fetchone()
+        return self._row_to_tournament(row) if row else None
 
     async def set_status(
         self,
@@ -349,12 +463,48 @@ class TournamentService:
                 (status, tournament_id),
             )
             await self.db.commit()
+            self._invalidate_tournament(tournament_id)
+            self._notify_status(tournament_id, status)
             log.info(f"[TOURNAMENT] Tournament {tournament_id} status → {status}")
             return True
         except Exception as e:
             log.error(f"[TOURNAMENT] Failed to update status: {e}")
             return False
 
+    async def update_status(
+        self,
+        tournament_id: int,
+        status: str,
+    ) -> Optional[Tournament]:
+        """
+        Update tournament status and return the updated tournament.
+
+        Like set_status, but uses UPDATE ... RETURNING so callers that need
+        the fresh row don't have to re-read it. Returns None on failure.
+        """
+        if status not in self.VALID_STATUSES:
+            log.error(f"[TOURNAMENT] Invalid status: {status}")
+            return None
+
+        try:
+            cursor = await self.db.execute(
+                "UPDATE tournaments SET status = ? WHERE id = ? RETURNING *",
+                (status, tournament_id),
+            )
+            row = await cursor.fetchone()
+            await self.db.commit()
+            self._invalidate_tournament(tournament_id)
+        except Exception as e:
+            log.error(f"[TOURNAMENT] Failed to update status: {e}")
+            return None
+
+        if not row:
+            return None
+
+        self._notify_status(tournament_id, status)
+        log.info(f"[TOURNAMENT] Tournament {tournament_id} status → {status}")
+        return self._row_to_tournament(row)
+
     async def archive_tournament(
         self,
         tournament_id: int,
@@ -427,12 +577,15 @@ class TournamentService:
                 """,
                 (winner_id, runner_up_id, completed_at, tournament_id),
             )
+            self._invalidate_tournament(tournament_id)
 
             # Delete entries
             await self.db.execute(
                 "DELETE FROM tournament_entries WHERE tournament_id = ?",
                 (tournament_id,),
             )
+            self._entry_counts.pop(tournament_id, None)
+            self._entry_names.clear()
 
             # Delete matches
             await self.db.execute(
@@ -466,6 +619,7 @@ class TournamentService:
                 (message_id, channel_id, tournament_id),
             )
             await self.db.commit()
+            self._invalidate_tournament(tournament_id)
             return True
         except Exception as e:
             log.error(f"[TOURNAMENT] Failed to set registration message: {e}")
@@ -484,6 +638,7 @@ class TournamentService:
                 (channel_id, message_id, tournament_id),
             )
             await self.db.commit()
+            self._invalidate_tournament(tournament_id)
             log.info(
                 f"[TOURNAMENT] Set dashboard message for tournament {tournament_id}"
             )
@@ -520,6 +675,7 @@ class TournamentService:
                 (tournament_id, user_id, now),
             )
             await self.db.commit()
+            self._entry_counts.pop(tournament_id, None)
 
             entry_id = cursor.lastrowid
             log.info(f"[TOURNAMENT] Added 1v1 entry {entry_id}: player {user_id}")
@@ -538,6 +694,128 @@ class TournamentService:
             log.error(f"[TOURNAMENT] Failed to add 1v1 entry: {e}")
             return None, f"Database error: {e}"
 
+    @staticmethod
+    def check_player_restrictions(tournament: Tournament, player) -> Optional[str]:
+        """
+        Check a player profile against a tournament's region/rank restrictions.
+
+        Returns an error message, or None if the player may enter.
+        """
+        # No restrictions = allow everyone
+        if not tournament.allowed_regions and not tournament.allowed_ranks:
+            return None
+
+        if not player:
+            return "You need to complete onboarding first."
+
+        if tournament.allowed_regions:
+            allowed = parse_restriction_csv(tournament.allowed_regions)
+            # Regions are stored upper-case (PlayerService.normalize_region)
+            if (player.region or "") not in allowed:
+                return f"This tournament is restricted to regions: **{tournament.allowed_regions}**. Your region: **{player.region or 'Not set'}**"
+
+        if tournament.allowed_ranks:
+            allowed = parse_restriction_csv(tournament.allowed_ranks, title=True)
+            player_rank = (player.claimed_rank or "").title()
+            if player_rank not in allowed:
+                return f"This tournament is restricted to ranks: **{tournament.allowed_ranks}**. Your rank: **{player.claimed_rank or 'Not set'}**"
+
+        return None
+
+    async def try_register_1v1(
+        self,
+        tournament_id: int,
+        user_id: int,
+        player=None,
+        tournament: Optional[Tournament] = None,
+    ) -> tuple[Optional[Tournament], Optional[TournamentEntry], Optional[str]]:
+        """
+        Validate and insert a 1v1 entry in one step.
+
+        The status, capacity and duplicate checks are folded into a single
+        guarded INSERT, so two concurrent clicks cannot both take the last
+        slot. Restrictions are checked against the preloaded ``player``;
+        pass ``tournament`` too if the caller already fetched it.
+
+        Returns:
+            (Tournament, TournamentEntry, None) on success
+            (Tournament or None, None, error_message) on failure
+        """
+        if tournament is None:
+            tournament = await self.get_by_id(tournament_id)
+        if not tournament:
+            return None, None, "Tournament not found."
+
+        if tournament.status != "reg_open":
+            return (
+                tournament,
+                None,
+                f"Registration is **{tournament.status}**. Cannot register now.",
+            )
+
+        restriction_error = self.check_player_restrictions(tournament, player)
+        if restriction_error:
+            return tournament, None, restriction_error
+
+        try:
+            now = int(time.time())
+            cursor = await self.db.execute(
+                """
+                INSERT INTO tournament_entries (tournament_id, player1_id, created_at)
+                SELECT ?, ?, ?
+                WHERE EXISTS (
+                    SELECT 1 FROM tournaments t
+                    WHERE t.id = ? AND t.status = 'reg_open'
+                      AND (
+                          SELECT COUNT(*) FROM tournament_entries
+                          WHERE tournament_id = t.id
+                      ) < t.size
+                )
+                AND NOT EXISTS (
+                    SELECT 1 FROM tournament_entries
+                    WHERE tournament_id = ? AND (player1_id = ? OR player2_id = ?)
+                )
+                """,
+                (
+                    tournament_id,
+                    user_id,
+                    now,
+                    tournament_id,
+                    tournament_id,
+                    user_id,
+                    user_id,
+                ),
+            )
+            await self.db.commit()
+            self._entry_counts.pop(tournament_id, None)
+        except Exception as e:
+            log.error(f"[TOURNAMENT] Failed to register 1v1 entry: {e}")
+            return tournament, None, f"Database error: {e}"
+
+        if cursor.rowcount == 0:
+            # Guard rejected the insert - work out why (failure path only)
+            if await self.has_entry_for_player(tournament_id, user_id):
+                return (
+                    tournament,
+                    None,
+                    "You are already registered for this tournament.",
+                )
+            return tournament, None, "Tournament is full!"
+
+        entry_id = cursor.lastrowid
+        log.info(f"[TOURNAMENT] Added 1v1 entry {entry_id}: player {user_id}")
+
+        return (
+            tournament,
+            TournamentEntry(
+                id=entry_id,
+                tournament_id=tournament_id,
+                player1_id=user_id,
+                created_at=now,
+            ),
+            None,
+        )
+
     async def add_dummy_entry(
         self,
         tournament_id: int,
@@ -558,6 +836,7 @@ class TournamentService:
                 (tournament_id, dummy_player_id, now),
             )
             await self.db.commit()
+            self._entry_counts.pop(tournament_id, None)
 
             entry_id = cursor.lastrowid
             log.info(f"[DEV] Added dummy entry {entry_id}: player {dummy_player_id}")
@@ -573,6 +852,41 @@ class TournamentService:
             log.error(f"[DEV] Failed to add dummy entry: {e}")
             return None
 
+    async def add_dummy_entries_bulk(
+        self,
+        tournament_id: int,
+        dummy_player_ids: List[int],
+    ) -> int:
+        """
+        Add several dummy entries in one transaction (skips duplicate check).
+
+        Returns the number of entries added.
+        """
+        if not dummy_player_ids:
+            return 0
+        try:
+            now = int(time.time())
+            await self.db.executemany(
+                """
+                INSERT INTO tournament_entries (tournament_id, player1_id, created_at)
+                VALUES (?, ?, ?)
+                """,
+                [(tournament_id, player_id, now) for player_id in dummy_player_ids],
+            )
+            await self.db.commit()
+            self._entry_counts.pop(tournament_id, None)
+
+            log.info(
+                f"[DEV] Added {len(dummy_player_ids)} dummy entries "
+                f"to tournament {tournament_id}"
+            )
+            return len(dummy_player_ids)
+
+        except Exception as e:
+            await self.db.rollback()
+            log.error(f"[DEV] Failed to add dummy entries: {e}")
+            return 0
+
     async def add_entry_2v2(
         self,
         tournament_id: int,
@@ -609,6 +923,7 @@ class TournamentService:
                 (tournament_id, player1_id, player2_id, team_name, now),
             )
             await self.db.commit()
+            self._entry_counts.pop(tournament_id, None)
 
             entry_id = cursor.lastrowid
             log.info(
@@ -676,12 +991,22 @@ class TournamentService:
         ]
 
     async def count_entries(self, tournament_id: int) -> int:
-        """Count entries for a tournament."""
+        """
+        Count entries for a tournament.
+
+        The count is memoized until this service adds or removes an entry
+        for the tournament (served by idx_entries_tournament on a miss).
+        """
+        cached = self._entry_counts.get(tournament_id)
+        if cached is not None:
+            return cached
+
         cursor = await self.db.execute(
             "SELECT COUNT(*) FROM tournament_entries WHERE tournament_id = ?",
             (tournament_id,),
         )
         row = await cursor.fetchone()
+        self._entry_counts[tournament_id] = row[0]
         return row[0]
 
     async def remove_entry(
@@ -699,6 +1024,8 @@ class TournamentService:
                 (tournament_id, user_id, user_id),
             )
             await self.db.commit()
+            self._entry_counts.pop(tournament_id, None)
+            self._entry_names.clear()
             log.info(
                 f"[TOURNAMENT] Removed entry for player {user_id} from tournament {tournament_id}"
             )
@@ -854,6 +1181,46 @@ class TournamentService:
 
         return [self._row_to_match(row) for row in rows]
 
+    async def list_matches_where(
+        self,
+        tournament_id: int,
+        status: str,
+        require_both_entries: bool = True,
+        round_num: Optional[int] = None,
+    ) -> List[Match]:
+        """List matches in one status, filtered in SQL.
+
+        With require_both_entries, matches still waiting on a feeder
+        match (an empty slot) are left out.
+        """
+        query = "SELECT * FROM matches WHERE tournament_id = ? AND status = ?"
+        params: list = [tournament_id, status]
+        if require_both_entries:
+            query += " AND entry1_id IS NOT NULL AND entry2_id IS NOT NULL"
+        if round_num:
+            query += " AND round = ?"
+            params.append(round_num)
+        query += " ORDER BY round ASC, match_index ASC"
+
+        cursor = await self.db.execute(query, params)
+        rows = await cursor.fetchall()
+
+        return [self._row_to_match(row) for row in rows]
+
+    async def count_matches_by_status(self, tournament_id: int) -> Dict[str, int]:
+        """Count a tournament's matches per status without loading the rows."""
+        cursor = await self.db.execute(
+            """
+            SELECT status, COUNT(*) FROM matches
+            WHERE tournament_id = ?
+            GROUP BY status
+            """,
+            (tournament_id,),
+        )
+        rows = await cursor.fetchall()
+
+        return {row[0]: row[1] for row in rows}
+
     async def get_match(self, match_id: int) -> Optional[Match]:
         """Get a match by ID."""
         cursor = await self.db.execute(
@@ -905,7 +1272,12 @@ class TournamentService:
         entry_id: int,
         tournament_format: str,
     ) -> str:
-        """Get a display name for an entry."""
+        """Get a display name for an entry (cached for ENTRY_NAME_CACHE_TTL)."""
+        key = (entry_id, tournament_format)
+        cached = self._entry_names.get(key)
+        if cached and time.monotonic() - cached[0] < self.ENTRY_NAME_CACHE_TTL:
+            return cached[1]
+
         cursor = await self.db.execute(
             "SELECT * FROM tournament_entries WHERE id = ?",
             (entry_id,),
@@ -916,9 +1288,48 @@ class TournamentService:
             return f"Entry #{entry_id}"
 
         if tournament_format == "2v2" and row["team_name"]:
-            return row["team_name"]
+            name = row["team_name"]
+        else:
+            name = f"<@{row['player1_id']}>"
+
+        if len(self._entry_names) >= self.ENTRY_NAME_CACHE_MAX:
+            self._entry_names.clear()
+        self._entry_names[key] = (time.monotonic(), name)
+        return name
+
+    async def get_entry_display_names(
+        self,
+        entry_ids: Iterable[Optional[int]],
+        tournament_format: str,
+    ) -> Dict[Optional[int], str]:
+        """
+        Get display names for several entries with a single query.
 
-        return f"<@{row['player1_id']}>"
+        Same naming rules as get_entry_display_name; ids with no entry
+        map to "Entry #<id>".
+        """
+        wanted = list(dict.fromkeys(entry_ids))
+        lookup = [eid for eid in wanted if eid is not None]
+
+        rows = []
+        if lookup:
+            placeholders = ",".join("?" * len(lookup))
+            cursor = await self.db.execute(
+                f"SELECT id, player1_id, team_name FROM tournament_entries "
+                f"WHERE id IN ({placeholders})",
+                lookup,
+            )
+            rows = await cursor.fetchall()
+
+        names = {
+            row["id"]: (
+                row["team_name"]
+                if tournament_format == "2v2" and row["team_name"]
+                else f"<@{row['player1_id']}>"
+            )
+            for row in rows
+        }
+        return {eid: names.get(eid, f"Entry #{eid}") for eid in wanted}
 
     async def get_match_player_ids(self, match_id: int) -> List[int]:
         """
@@ -994,6 +1405,22 @@ class TournamentService:
 
         return entry1_dummy, entry2_dummy, entry1_dummy and entry2_dummy
 
+    async def list_pending_dummy_matches(self, tournament_id: int) -> List[Match]:
+        """Get pending matches where both entries are dummies, in one query."""
+        cursor = await self.db.execute(
+            """
+            SELECT m.* FROM matches m
+            JOIN tournament_entries e1 ON e1.id = m.entry1_id
+            JOIN tournament_entries e2 ON e2.id = m.entry2_id
+            WHERE m.tournament_id = ? AND m.status = 'pending'
+              AND e1.player1_id >= ? AND e2.player1_id >= ?
+            ORDER BY m.round, m.match_index
+            """,
+            (tournament_id, self.DUMMY_PLAYER_ID_MIN, self.DUMMY_PLAYER_ID_MIN),
+        )
+        rows = await cursor.fetchall()
+        return [self._row_to_match(row) for row in rows]
+
     async def auto_resolve_dummy_match(
         self,
         match_id: int,
@@ -1019,7 +1446,7 @@ class TournamentService:
             return None, None, "Can only auto-resolve dummy vs dummy matches."
 
         # Random winner
-        winner_entry_id = random.choice([match.entry1_id, match.entry2_id])
+        winner_entry_id = match.entry1_id if random.getrandbits(1) else match.entry2_id
 
         return await self.report_result_by_entry(
             match_id=match_id,
@@ -1263,6 +1690,76 @@ class TournamentService:
             log.error(f"[TOURNAMENT] Failed to report result by entry: {e}")
             return None, None, f"Database error: {e}"
 
+    async def report_results_bulk(
+        self,
+        tournament_id: int,
+        results: List[tuple[int, int, Optional[str]]],
+    ) -> tuple[Optional[Tournament], int, List[str]]:
+        """
+        Report several match results in one transaction.
+
+        Args:
+            tournament_id: Tournament the matches belong to
+            results: (match_id, winner_entry_id, score) tuples
+
+        Bracket progression runs once after all updates, so pass matches
+        from the same round.
+
+        Returns:
+            (Tournament, resolved_count, errors)
+        """
+        if not results:
+            return await self.get_by_id(tournament_id), 0, []
+
+        match_ids = [match_id for match_id, _, _ in results]
+        placeholders = ",".join("?" * len(match_ids))
+        cursor = await self.db.execute(
+            f"SELECT * FROM matches WHERE tournament_id = ? AND id IN ({placeholders})",
+            (tournament_id, *match_ids),
+        )
+        rows = await cursor.fetchall()
+        matches = {row["id"]: self._row_to_match(row) for row in rows}
+
+        updates = []
+        errors = []
+        for match_id, winner_entry_id, score in results:
+            match = matches.get(match_id)
+            if not match:
+                errors.append(f"Match {match_id}: not found.")
+            elif match.status != "pending":
+                errors.append(f"Match {match_id}: already completed.")
+            elif winner_entry_id not in (match.entry1_id, match.entry2_id):
+                errors.append(f"Match {match_id}: winner is not a participant.")
+            else:
+                updates.append((winner_entry_id, score, match_id))
+
+        if updates:
+            try:
+                await self.db.executemany(
+                    """
+                    UPDATE matches
+                    SET status = 'completed',
+                        winner_entry_id = ?,
+                        score_text = ?
+                    WHERE id = ? AND status = 'pending'
+                    """,
+                    updates,
+                )
+                await self.db.commit()
+            except Exception as e:
+                log.error(f"[TOURNAMENT] Failed to report results in bulk: {e}")
+                return None, 0, errors + [f"Database error: {e}"]
+
+            log.info(
+                f"[TOURNAMENT] {len(updates)} matches completed in bulk "
+                f"for tournament {tournament_id}"
+            )
+
+            # Advance bracket once for the whole batch
+            await self._advance_single_elim(tournament_id)
+
+        return await self.get_by_id(tournament_id), len(updates), errors
+
     async def _advance_single_elim(self, tournament_id: int) -> None:
         """
         Advance the single elimination bracket.
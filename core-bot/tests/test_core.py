@@ -150,6 +150,59 @@ class TestStartupChecks:
         assert "players" in expected
         assert "guild_config" in expected
 
+    @pytest.mark.asyncio
+    async def test_init_db_enables_wal(self, tmp_path):
+        """init_db should switch the database file to WAL journaling."""
+        db_path = str(tmp_path / "wal.db")
+        await init_db(db_path)
+
+        async with aiosqlite.connect(db_path) as db:
+            async with db.execute("PRAGMA journal_mode") as cursor:
+                assert (await cursor.fetchone())[0] == "wal"
+
+    @pytest.mark.asyncio
+    async def test_init_db_skips_current_schema(self, tmp_path):
+        """A warm boot should not rebuild a schema that is already current."""
+        db_path = str(tmp_path / "warm.db")
+        await init_db(db_path)
+
+        async with aiosqlite.connect(db_path) as db:
+            await db.execute("DROP TABLE organizer_bans")
+            await db.commit()
+
+        # Fingerprint still matches, so the dropped table is not recreated
+        await init_db(db_path)
+        tables = await validate_schema(db_path)
+        assert tables["organizer_bans"] is False
+
+        # A stale fingerprint triggers a rebuild
+        async with aiosqlite.connect(db_path) as db:
+            await db.execute("DELETE FROM meta WHERE key = 'schema_fingerprint'")
+            await db.commit()
+
+        await init_db(db_path)
+        tables = await validate_schema(db_path)
+        assert all(tables.values())
+
+    @pytest.mark.asyncio
+    async def test_get_db_reuses_pooled_connection(self, tmp_path):
+        """get_db should hand back the same connection, rolled back."""
+        from database import close_db_pool, get_db
+
+        db_path = str(tmp_path / "pool.db")
+        await init_db(db_path)
+
+        async with get_db(db_path) as db:
+            first = db
+            await db.execute("INSERT INTO meta (key, value) VALUES ('x', '1')")
+
+        async with get_db(db_path) as db:
+            assert db is first
+            async with db.execute("SELECT 1 FROM meta WHERE key = 'x'") as cursor:
+                assert await cursor.fetchone() is None
+
+        await close_db_pool()
+
     @pytest.mark.asyncio
     async def test_schema_version_is_v4(self):
         """Schema version should be 4 for UMS Core."""
@@ -307,6 +360,10 @@ class TestGuildConfig:
         config = await service.get(111111)
         assert config.admin_channel == 999
 
+        # Cached configs are dropped on delete
+        await service.delete(111111)
+        assert await service.get(111111) is None
+
 
 # -----------------------------------------------------------------------------
 # Test: Factory Reset
@@ -481,6 +538,9 @@ class TestTournamentLifecycle:
         # Verify creation succeeded before testing status transitions
         assert tournament is not None, f"Tournament creation failed: {err}"
 
+        changes = []
+        service.add_status_listener(lambda tid, status: changes.append(status))
+
         # Draft -> reg_open
         result = await service.set_status(tournament.id, "reg_open")
         assert result is True
@@ -501,6 +561,22 @@ class TestTournamentLifecycle:
         updated = await service.get_by_id(tournament.id)
         assert updated.status == "completed"
 
+        # update_status hands back the updated row
+        cancelled = await service.update_status(tournament.id, "cancelled")
+        assert cancelled.id == tournament.id
+        assert cancelled.status == "cancelled"
+        assert await service.update_status(tournament.id, "bogus") is None
+
+        # Listeners saw every successful change, in order
+        assert changes == [
+            "reg_open", "reg_closed", "in_progress", "completed", "cancelled"
+        ]
+
+        # Finished tournaments are found for archiving
+        archivable = await service.get_most_recent_archivable(111222333002)
+        assert archivable.id == tournament.id
+        assert await service.get_most_recent_archivable(999) is None
+
     @pytest.mark.asyncio
     async def test_one_active_tournament_per_guild(self, tournament_db):
         """Should enforce one active tournament per guild."""
@@ -530,6 +606,168 @@ class TestTournamentLifecycle:
         assert error2 is not None
         assert "active tournament" in error2.lower()
 
+    @pytest.mark.asyncio
+    async def test_try_register_1v1_enforces_capacity(self, tournament_db):
+        """Should reject duplicates and stop at tournament size."""
+        from services.tournament_service import TournamentService
+
+        service = TournamentService(tournament_db)
+
+        tournament, err = await service.create_tournament(
+            guild_id=111222333004,  # Unique guild ID for this test
+            name="Capacity Cup",
+            format="1v1",
+            size=8,
+        )
+        assert tournament is not None, f"Tournament creation failed: {err}"
+
+        # Closed registration is rejected
+        _, entry, error = await service.try_register_1v1(tournament.id, 1)
+        assert entry is None
+        assert "draft" in error
+
+        await service.set_status(tournament.id, "reg_open")
+
+        for user_id in range(1, 9):
+            _, entry, error = await service.try_register_1v1(tournament.id, user_id)
+            assert error is None
+            assert entry.player1_id == user_id
+
+        # Duplicate is reported as such, not as "full"
+        _, entry, error = await service.try_register_1v1(tournament.id, 1)
+        assert entry is None
+        assert "already registered" in error
+
+        _, entry, error = await service.try_register_1v1(tournament.id, 9)
+        assert entry is None
+        assert "full" in error
+        assert await service.count_entries(tournament.id) == 8
+
+        fetched, entry_count = await service.get_with_entry_count(tournament.id)
+        assert fetched.name == "Capacity Cup"
+        assert entry_count == 8
+
+        # Memoized count follows removals
+        assert await service.remove_entry(tournament.id, 8) is True
+        assert await service.count_entries(tournament.id) == 7
+
+    @pytest.mark.asyncio
+    async def test_entry_display_names_match_single_lookup(self, tournament_db):
+        """Bulk display names should agree with get_entry_display_name."""
+        from services.tournament_service import TournamentService
+
+        service = TournamentService(tournament_db)
+
+        tournament, err = await service.create_tournament(
+            guild_id=111222333005,  # Unique guild ID for this test
+            name="Names Cup",
+            format="2v2",
+            size=8,
+        )
+        assert tournament is not None, f"Tournament creation failed: {err}"
+
+        named, _ = await service.add_entry_2v2(tournament.id, 1, 2, "Blue")
+        unnamed, _ = await service.add_entry_1v1(tournament.id, 3)
+
+        ids = [named.id, unnamed.id, 9999, named.id]
+        names = await service.get_entry_display_names(ids, "2v2")
+
+        assert list(names) == [named.id, unnamed.id, 9999]
+        for entry_id in ids:
+            assert names[entry_id] == await service.get_entry_display_name(
+                entry_id, "2v2"
+            )
+
+        # Cached names are dropped when entries are removed
+        assert await service.remove_entry(tournament.id, 3) is True
+        assert await service.get_entry_display_name(unnamed.id, "2v2") == (
+            f"Entry #{unnamed.id}"
+        )
+
+    @pytest.mark.asyncio
+    async def test_report_results_bulk_advances_round(self, tournament_db):
+        """Bulk results should complete a round and build the next one."""
+        from services.tournament_service import TournamentService
+
+        service = TournamentService(tournament_db)
+
+        tournament, err = await service.create_tournament(
+            guild_id=111222333006,  # Unique guild ID for this test
+            name="Bulk Cup",
+            format="1v1",
+            size=8,
+        )
+        assert tournament is not None, f"Tournament creation failed: {err}"
+
+        for user_id in range(1, 9):
+            await service.add_entry_1v1(tournament.id, user_id)
+        await service.set_status(tournament.id, "reg_closed")
+        matches, err = await service.build_bracket(tournament.id)
+        assert err is None
+
+        round1 = [m for m in matches if m.status == "pending"]
+        results = [(m.id, m.entry1_id, "DEV") for m in round1]
+        _, resolved, errors = await service.report_results_bulk(
+            tournament.id, results
+        )
+        assert resolved == len(round1)
+        assert errors == []
+
+        # An already-reported match is skipped with an error
+        _, resolved, errors = await service.report_results_bulk(
+            tournament.id, results[:1]
+        )
+        assert resolved == 0
+        assert "already completed" in errors[0]
+
+        round2 = [m for m in await service.list_matches(tournament.id) if m.round == 2]
+        assert len(round2) == len(round1) // 2
+        assert {m.entry1_id for m in round2} <= {m.entry1_id for m in round1}
+
+        ready = await service.list_matches_where(tournament.id, "pending")
+        assert [m.id for m in ready] == [m.id for m in round2]
+        done = await service.list_matches_where(tournament.id, "completed", round_num=2)
+        assert done == []
+
+        counts = await service.count_matches_by_status(tournament.id)
+        assert counts == {"completed": len(round1), "pending": len(round2)}
+        assert await service.get_status(tournament.id) == "reg_closed"
+
+    @pytest.mark.asyncio
+    async def test_list_pending_dummy_matches(self, tournament_db):
+        """Only pending dummy vs dummy matches should be listed."""
+        from services.tournament_service import TournamentService
+
+        service = TournamentService(tournament_db)
+
+        tournament, err = await service.create_tournament(
+            guild_id=111222333007,  # Unique guild ID for this test
+            name="Dummy Cup",
+            format="1v1",
+            size=8,
+        )
+        assert tournament is not None, f"Tournament creation failed: {err}"
+
+        # Entries 1-2 are real players, the rest are dummies
+        await service.add_entry_1v1(tournament.id, 1)
+        await service.add_entry_1v1(tournament.id, 2)
+        added = await service.add_dummy_entries_bulk(
+            tournament.id, [service.DUMMY_PLAYER_ID_MIN + i for i in range(6)]
+        )
+        assert added == 6
+        assert await service.count_entries(tournament.id) == 8
+        await service.set_status(tournament.id, "reg_closed")
+        matches, err = await service.build_bracket(tournament.id)
+        assert err is None
+
+        dummy_matches = await service.list_pending_dummy_matches(tournament.id)
+        expected = []
+        for m in matches:
+            _, _, both = await service.is_dummy_match(m.id)
+            if both and m.status == "pending":
+                expected.append(m.id)
+        assert sorted(m.id for m in dummy_matches) == sorted(expected)
+
 
 # -----------------------------------------------------------------------------
 # Run Tests
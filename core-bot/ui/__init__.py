@@ -40,9 +40,6 @@ from ui.registration_views import (
     Registration2v2View,
     TeamRegistrationModal,
     # Legacy registration components
-    RegisterButton,
-    UnregisterButton,
-    RefreshButton,
     RegionMismatchView,
     ManualRegisterModal,
     KickPlayerModal,
@@ -54,9 +51,12 @@ from ui.registration_views import (
 
 # Registration embeds
 from ui.registration_embeds import (
+    RegistrationPanelState,
     build_public_registration_embed,
     build_admin_registration_embed,
     build_region_mismatch_embed,
+    invalidate_admin_embed,
+    normalize_restriction,
 )
 
 # Bracket components
@@ -95,9 +95,6 @@ __all__ = [
     "Registration2v2View",
     "TeamRegistrationModal",
     # Registration views (Legacy RegistrationCog flow)
-    "RegisterButton",
-    "UnregisterButton",
-    "RefreshButton",
     "RegionMismatchView",
     "ManualRegisterModal",
     "KickPlayerModal",
@@ -106,9 +103,12 @@ __all__ = [
     "EditTournamentModal",
     "AdminControlsView",
     # Registration embeds
+    "RegistrationPanelState",
     "build_public_registration_embed",
     "build_admin_registration_embed",
     "build_region_mismatch_embed",
+    "invalidate_admin_embed",
+    "normalize_restriction",
     # Bracket views
     "ScoreModal",
     "ScoreSubmissionView",
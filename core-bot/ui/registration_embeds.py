@@ -6,8 +6,10 @@ Embed construction for registration panels (public and admin).
 
 from __future__ import annotations
 
+import functools
 import logging
-from typing import TYPE_CHECKING, Dict, Any, Set
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Any, Optional, Set, Tuple, Union
 
 import discord
 
@@ -16,84 +18,288 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+# Restriction values that mean "no restriction" (compared lowercase)
+_SENTINEL_EMPTY = frozenset({"", "none", "n/a"})
 
-def build_public_registration_embed(state: Dict[str, Any]) -> discord.Embed:
+# Keys read by the public panel, in unpack order
+_PUBLIC_KEYS = (
+    "name",
+    "region",
+    "format",
+    "size",
+    "start_time",
+    "rank_restriction",
+    "region_restriction",
+    "team_size",
+)
+_PUBLIC_DEFAULTS = {
+    "name": "Unknown",
+    "region": "N/A",
+    "format": "N/A",
+    "size": "N/A",
+    "start_time": "N/A",
+    "rank_restriction": "",
+    "region_restriction": "",
+    "team_size": 1,
+}
+
+# Embed colors as raw ints. Embed accepts an int directly, so no
+# discord.Color object is allocated per build. Resolved once from
+# discord.py's named palette so the hex values cannot drift from it.
+_COLOR_GOLD: int = discord.Color.gold().value  # 0xF1C40F
+_COLOR_DARK_GREY: int = discord.Color.dark_grey().value  # 0x607D8B
+_COLOR_YELLOW: int = discord.Color.yellow().value  # 0xFEE75C
+
+# Static field text, indexed by bool(is_open) / team size
+_STATUS = ("⛔ Closed", "✅ Open")
+_TEAM_SIZE_CACHE = {n: f"{n}v{n}" for n in range(2, 9)}
+
+# Admin panel embeds keyed by tournament key -> (static_hash, embed).
+# Only Status (field 0) and Players (field 1) change during registration.
+_ADMIN_EMBED_CACHE: Dict[str, Tuple[int, discord.Embed]] = {}
+
+
+def invalidate_admin_embed(key: str) -> None:
+    """Drop the cached admin panel embed for a tournament."""
+    _ADMIN_EMBED_CACHE.pop(key, None)
+
+
+def _is_meaningful(value: str) -> bool:
+    """True if a restriction value is set (not empty / "none" / "n/a")."""
+    # Normalized values ("" or exact sentinels) bail out before .lower()
+    return (
+        bool(value)
+        and value not in _SENTINEL_EMPTY
+        and value.lower() not in _SENTINEL_EMPTY
+    )
+
+
+def normalize_restriction(value: Optional[str]) -> str:
+    """Normalize a restriction for storage: sentinels become ""."""
+    value = (value or "").strip()
+    return value if _is_meaningful(value) else ""
+
+
+@dataclass(slots=True, frozen=True)
+class RegistrationPanelState:
+    """
+    Fixed-layout snapshot of the fields the registration panels render.
+
+    Build once per state change with from_state() and pass the same
+    instance to both builders; attribute reads replace dict lookups.
+    """
+
+    name: str = "Unknown"
+    region: Any = "N/A"
+    format: Any = "N/A"
+    size: Any = "N/A"
+    match_length: Any = "Bo3"
+    start_time: Any = "N/A"
+    is_open: bool = False
+    participant_count: int = 0
+    rank_restriction: str = ""
+    region_restriction: str = ""
+    team_size: int = 1
+    key: Optional[str] = None
+    role_id: Optional[int] = None
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> RegistrationPanelState:
+        """Snapshot a RegistrationCog tournament state dict."""
+        (
+            name,
+            region,
+            fmt,
+            size,
+            start,
+            rank_restriction,
+            region_restriction,
+            team_size,
+        ) = tuple(state.get(k, _PUBLIC_DEFAULTS[k]) for k in _PUBLIC_KEYS)
+        count = state.get("participant_count")
+        if count is None:
+            count = len(state.get("participants") or ())
+        return cls(
+            name=name,
+            region=region,
+            format=fmt,
+            size=size,
+            match_length=state.get("match_length", "Bo3"),
+            start_time=start,
+            is_open=bool(state.get("is_open", False)),
+            participant_count=count,
+            rank_restriction=rank_restriction,
+            region_restriction=region_restriction,
+            team_size=team_size,
+            key=state.get("key"),
+            role_id=state.get("role_id"),
+        )
+
+
+PanelStateLike = Union[RegistrationPanelState, Dict[str, Any]]
+
+
+def _as_panel_state(state: PanelStateLike) -> RegistrationPanelState:
+    """Fast-path snapshots; convert legacy state dicts."""
+    if isinstance(state, RegistrationPanelState):
+        return state
+    return RegistrationPanelState.from_state(state)
+
+
+def _common_header(snap: RegistrationPanelState) -> Tuple[str, int, str]:
+    """Return (status_str, count, match_length) shared by both panels."""
+    return _STATUS[snap.is_open], snap.participant_count, snap.match_length
+
+
+def _status_fields(status: str, count: int, count_label: str) -> list:
+    """Build the Status + count field pair used by both panels."""
+    return [
+        {"name": "Status", "value": status, "inline": True},
+        {"name": count_label, "value": str(count), "inline": True},
+    ]
+
+
+def _clone_embed(embed: discord.Embed) -> discord.Embed:
+    """Copy an embed with its own field dicts (Embed.copy shares them)."""
+    payload = embed.to_dict()
+    payload["fields"] = [dict(f) for f in payload.get("fields", ())]
+    return discord.Embed.from_dict(payload)
+
+
+def build_public_registration_embed(state: PanelStateLike) -> discord.Embed:
     """
     Create a public embed from tournament state.
 
     Args:
-        state: Tournament state dictionary with keys like 'name', 'region', 'format', etc.
+        state: RegistrationPanelState snapshot, or the tournament state
+            dictionary with keys like 'name', 'region', 'format', etc.
 
     Returns:
         discord.Embed for the public registration panel.
     """
-    name = state.get("name", "Unknown")
-    region = state.get("region", "N/A")
-    match_length = state.get("match_length", "Bo3")
-    fmt = state.get("format", "N/A")
-    size = state.get("size", "N/A")
-    start = state.get("start_time", "N/A")
-    is_open = bool(state.get("is_open", False))
-    participants = state.get("participants") or set()
-    count = len(participants)
-
-    e = discord.Embed(title=f"🏆 {name}", color=discord.Color.gold())
-    e.add_field(name="Region", value=region, inline=True)
-    e.add_field(name="Format", value=fmt, inline=True)
-    e.add_field(name="Size", value=size, inline=True)
-    e.add_field(name="Match Length", value=match_length, inline=True)
+    snap = _as_panel_state(state)
+    status, count, match_length = _common_header(snap)
+    rank_restriction = snap.rank_restriction
+    region_restriction = snap.region_restriction
+    team_size = snap.team_size
+
+    fields = [
+        {"name": "Region", "value": str(snap.region), "inline": True},
+        {"name": "Format", "value": str(snap.format), "inline": True},
+        {"name": "Size", "value": str(snap.size), "inline": True},
+        {"name": "Match Length", "value": str(match_length), "inline": True},
+    ]
 
     # Add rank restriction if set
-    rank_restriction = state.get("rank_restriction", "")
-    if rank_restriction and rank_restriction.lower() not in ["", "none", "n/a"]:
-        e.add_field(name="🎖️ Rank Restriction", value=rank_restriction, inline=True)
+    if _is_meaningful(rank_restriction):
+        fields.append(
+            {"name": "🎖️ Rank Restriction", "value": rank_restriction, "inline": True}
+        )
 
     # Add region restriction if set
-    region_restriction = state.get("region_restriction", "")
-    if region_restriction and region_restriction.lower() not in ["", "none", "n/a"]:
-        e.add_field(name="🌍 Region Restriction", value=region_restriction, inline=True)
+    if _is_meaningful(region_restriction):
+        fields.append(
+            {
+                "name": "🌍 Region Restriction",
+                "value": region_restriction,
+                "inline": True,
+            }
+        )
 
     # Add Team Size info if applicable
-    team_size = state.get("team_size", 1)
     if team_size > 1:
-        e.add_field(name="🛡️ Team Size", value=f"{team_size}v{team_size}", inline=True)
+        fields.append(
+            {
+                "name": "🛡️ Team Size",
+                "value": _TEAM_SIZE_CACHE.get(team_size)
+                or f"{team_size}v{team_size}",
+                "inline": True,
+            }
+        )
 
-    e.add_field(name="Start Time", value=start, inline=False)
-    e.add_field(
-        name="Status", value=("✅ Open" if is_open else "⛔ Closed"), inline=True
+    fields.append(
+        {"name": "Start Time", "value": str(snap.start_time), "inline": False}
+    )
+    fields.extend(_status_fields(status, count, "Registered"))
+
+    return discord.Embed.from_dict(
+        {
+            "type": "rich",
+            "title": f"🏆 {snap.name}",
+            "color": _COLOR_GOLD,
+            "fields": fields,
+        }
     )
-    e.add_field(name="Registered", value=str(count), inline=True)
-    return e
 
 
-def build_admin_registration_embed(state: Dict[str, Any]) -> discord.Embed:
+def build_admin_registration_embed(state: PanelStateLike) -> discord.Embed:
     """
     Create an admin embed from tournament state.
 
     Args:
-        state: Tournament state dictionary.
+        state: RegistrationPanelState snapshot or tournament state dictionary.
 
     Returns:
         discord.Embed for the admin control panel.
     """
-    name = state.get("name", "Unknown")
-    is_open = bool(state.get("is_open", False))
-    participants = state.get("participants") or set()
-    count = len(participants)
-    match_length = state.get("match_length", "Bo3")
-
-    e = discord.Embed(title=f"⚙️ Admin Panel — {name}", color=discord.Color.dark_grey())
-    e.description = (
-        f"**Key**: `{state.get('key')}`\n**Role**: <@&{state.get('role_id')}>"
-    )
-    e.add_field(
-        name="Status", value=("✅ Open" if is_open else "⛔ Closed"), inline=True
+    snap = _as_panel_state(state)
+    name = snap.name
+    key = snap.key
+    role_id = snap.role_id
+    status, count, match_length = _common_header(snap)
+
+    static_hash = hash((name, key, role_id, match_length))
+    cached = _ADMIN_EMBED_CACHE.get(key)
+    if cached is not None and cached[0] == static_hash:
+        e = _clone_embed(cached[1])
+        e.set_field_at(0, name="Status", value=status, inline=True)
+        e.set_field_at(1, name="Players", value=str(count), inline=True)
+        return e
+
+    e = discord.Embed.from_dict(
+        {
+            "type": "rich",
+            "title": "⚙️ Admin Panel — " + name,
+            "description": f"**Key**: `{key}`\n**Role**: <@&{role_id}>",
+            "color": _COLOR_DARK_GREY,
+            "fields": _status_fields(status, count, "Players")
+            + [{"name": "Match Length", "value": str(match_length), "inline": True}],
+        }
     )
-    e.add_field(name="Players", value=str(count), inline=True)
-    e.add_field(name="Match Length", value=match_length, inline=True)
+    if key:
+        _ADMIN_EMBED_CACHE[key] = (static_hash, _clone_embed(e))
     return e
 
 
+@functools.lru_cache(maxsize=64)
+def _join_regions(regions_key: Tuple[str, ...]) -> str:
+    """Comma-join a normalized region tuple (small, bounded key space)."""
+    return ", ".join(regions_key)
+
+
+@functools.lru_cache(maxsize=128)
+def _build_region_mismatch_cached(region: str, regions_key: tuple) -> dict:
+    """Build the region mismatch payload for a (region, player regions) pair."""
+    if not regions_key:
+        description = (
+            f"This tournament is for **{region}**.\n"
+            "You don't have any region roles assigned.\n\n"
+            "Consider selecting your region in the roles channel."
+        )
+    else:
+        description = (
+            f"This tournament is for **{region}**.\n"
+            f"Your region role(s): **{_join_regions(regions_key)}**\n\n"
+            "Playing outside your region may cause high ping."
+        )
+    return {
+        "type": "rich",
+        "title": "⚠️ Region Mismatch",
+        "description": description,
+        "color": _COLOR_YELLOW,
+    }
+
+
 def build_region_mismatch_embed(
     tournament_region: str, player_regions: list
 ) -> discord.Embed:
@@ -107,17 +313,7 @@ def build_region_mismatch_embed(
     Returns:
         discord.Embed warning about region mismatch.
     """
-    embed = discord.Embed(title="⚠️ Region Mismatch", color=discord.Color.yellow())
-    if not player_regions:
-        embed.description = (
-            f"This tournament is for **{tournament_region}**.\n"
-            "You don't have any region roles assigned.\n\n"
-            "Consider selecting your region in the roles channel."
-        )
-    else:
-        embed.description = (
-            f"This tournament is for **{tournament_region}**.\n"
-            f"Your region role(s): **{', '.join(player_regions)}**\n\n"
-            "Playing outside your region may cause high ping."
-        )
-    return embed
+    regions_key = tuple(sorted(set(player_regions)))
+    payload = _build_region_mismatch_cached(tournament_region, regions_key)
+    # Fresh instance per call so callers can mutate it safely
+    return discord.Embed.from_dict(payload)
@@ -8,15 +8,18 @@ Includes both player-facing and admin controls.
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import re
 import time
-from typing import Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
 import discord
 from discord import ui
+from discord.ext import commands
 
-from config.dev_flags import is_dev_user
+from config.dev_flags import DEV_USER_IDS
+from services.tournament_service import parse_restriction_csv
 from ui.registration_embeds import build_region_mismatch_embed
 
 if TYPE_CHECKING:
@@ -24,121 +27,121 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+# Real Discord snowflakes are 15-20 digits; every raw-ID parser uses this range
+_SNOWFLAKE_DIGITS = r"\d{15,20}"
+
+# Discord snowflake, or a negative dummy-player ID
+_SNOWFLAKE_RE = re.compile(rf"^\s*({_SNOWFLAKE_DIGITS}|-\d{{1,20}})\s*$")
+
+# User mention: <@123> or legacy nickname form <@!123>
+_MENTION_RE = re.compile(r"<@!?(\d+)>")
+
+# A real (non-dummy) Discord user ID typed as a raw number
+_USER_ID_RE = re.compile(_SNOWFLAKE_DIGITS)
+
+
+def _parse_snowflake(value: str) -> Optional[int]:
+    """Parse a user ID typed into a modal; None if it isn't one."""
+    m = _SNOWFLAKE_RE.match(value)
+    return int(m.group(1)) if m else None
+
+
+async def _safe_reply(inter: discord.Interaction, *args, **kwargs) -> None:
+    """Reply via the initial response, or a followup if already responded."""
+    if inter.response.is_done():
+        await inter.followup.send(*args, **kwargs)
+    else:
+        await inter.response.send_message(*args, **kwargs)
+
+
+# How long a RegistrationView remembers a member's region check result
+REGION_CHECK_TTL = 30  # seconds
+REGION_CACHE_MAX = 256
+
 
 # -----------------------------------------------------------------------------
 # PLAYER-FACING BUTTONS (Persistent)
 # -----------------------------------------------------------------------------
 
 
-class RegisterButton(ui.Button):
-    """Button for players to register for a tournament."""
+async def _register_cb(button: ui.Button, inter: discord.Interaction):
+    """Register button: add the clicking member to the tournament."""
+    # ACK within Discord's 3s window; DB/role/panel work happens after
+    await inter.response.defer(ephemeral=True, thinking=False)
 
-    def __init__(self):
-        super().__init__(
-            style=discord.ButtonStyle.primary,
-            label="Register",
-            custom_id="reg:register",
-        )
+    view: RegistrationView = button.view  # type: ignore
+    state = await view._get_state_for_inter(inter)
+    if not state:
+        return
 
-    async def callback(self, inter: discord.Interaction):
-        view: RegistrationView = self.view  # type: ignore
-        state = await view._get_state_for_inter(inter)
-        if not state:
-            return
+    if not state.get("is_open", False):
+        await inter.followup.send("❌ Registration is currently closed.", ephemeral=True)
+        return
 
-        if not state.get("is_open", False):
-            try:
-                await inter.response.send_message(
-                    "❌ Registration is currently closed.", ephemeral=True
-                )
-            except discord.InteractionResponded:
-                await inter.followup.send(
-                    "❌ Registration is currently closed.", ephemeral=True
-                )
-            return
+    # Duplicate clicks stop here, before the region check or any state work
+    if view.cog.is_registered(state["key"], inter.user.id):
+        await inter.followup.send("⚠️ You are already registered.", ephemeral=True)
+        return
 
-        # Region Check
-        region = state.get("region", "OPEN")
-        match, player_regions = view.cog._check_region_match(inter.user, region)
+    # Region Check
+    region = state.get("region", "OPEN")
+    match, player_regions = view.check_region(inter.user, region)
 
-        if not match and region != "OPEN":
-            # Show warning using embed builder
-            embed = build_region_mismatch_embed(region, player_regions)
+    if not match and region != "OPEN":
+        # Show warning using embed builder
+        embed = build_region_mismatch_embed(region, player_regions)
 
-            await inter.response.send_message(
-                embed=embed,
-                view=RegionMismatchView(view.cog, state["key"], inter.user),
-                ephemeral=True,
-            )
-            return
+        await inter.followup.send(
+            embed=embed,
+            view=RegionMismatchView(view.cog, state["key"], inter.user),
+            ephemeral=True,
+        )
+        return
 
-        # Use the centralized method to handle Role + State + Panels
-        added = await view.cog.add_participant(state["key"], inter.user.id, inter.user)
+    # Use the centralized method to handle Role + State + Panels
+    added = await view.cog.add_participant(state["key"], inter.user.id, inter.user)
 
-        msg = (
-            "✅ You have been registered!" if added else "⚠️ You are already registered."
-        )
-        try:
-            await inter.response.send_message(msg, ephemeral=True)
-        except discord.InteractionResponded:
-            await inter.followup.send(msg, ephemeral=True)
+    msg = "✅ You have been registered!" if added else "⚠️ You are already registered."
+    await inter.followup.send(msg, ephemeral=True)
 
 
-class UnregisterButton(ui.Button):
-    """Button for players to unregister from a tournament."""
+async def _unregister_cb(button: ui.Button, inter: discord.Interaction):
+    """Unregister button: remove the clicking member from the tournament."""
+    await inter.response.defer(ephemeral=True, thinking=False)
 
-    def __init__(self):
-        super().__init__(
-            style=discord.ButtonStyle.secondary,
-            label="Unregister",
-            custom_id="reg:unregister",
-        )
+    view: RegistrationView = button.view  # type: ignore
+    state = await view._get_state_for_inter(inter)
+    if not state:
+        return
 
-    async def callback(self, inter: discord.Interaction):
-        view: RegistrationView = self.view  # type: ignore
-        state = await view._get_state_for_inter(inter)
-        if not state:
-            return
+    removed = await view.cog.remove_participant(state["key"], inter.user.id, inter.user)
 
-        removed = await view.cog.remove_participant(
-            state["key"], inter.user.id, inter.user
-        )
+    msg = "✅ You have been unregistered." if removed else "⚠️ You were not registered."
+    await inter.followup.send(msg, ephemeral=True)
 
-        msg = (
-            "✅ You have been unregistered."
-            if removed
-            else "⚠️ You were not registered."
-        )
-        try:
-            await inter.response.send_message(msg, ephemeral=True)
-        except discord.InteractionResponded:
-            await inter.followup.send(msg, ephemeral=True)
 
+async def _refresh_cb(button: ui.Button, inter: discord.Interaction):
+    """Refresh button: re-render the registration panel."""
+    await inter.response.defer(ephemeral=True, thinking=False)
 
-class RefreshButton(ui.Button):
-    """Button to refresh the registration panel."""
+    view: RegistrationView = button.view  # type: ignore
+    state = await view._get_state_for_inter(inter)
+    if not state:
+        return
 
-    def __init__(self):
-        super().__init__(
-            style=discord.ButtonStyle.secondary,
-            label="Refresh",
-            custom_id="reg:refresh",
-        )
+    await inter.followup.send("♻️ Registration panel refreshed!", ephemeral=True)
 
-    async def callback(self, inter: discord.Interaction):
-        view: RegistrationView = self.view  # type: ignore
-        state = await view._get_state_for_inter(inter)
-        if not state:
-            return
+    # Concurrent clicks share one debounced edit
+    await asyncio.shield(view.cog.schedule_panel_refresh(state["key"]))
 
-        try:
-            await inter.response.send_message(
-                "♻️ Registration panel refreshed!", ephemeral=True
-            )
-        except discord.InteractionResponded:
-            await inter.followup.send("♻️ Registration panel refreshed!", ephemeral=True)
 
-        await view.cog.update_public_panel(state["key"])
+# Persistent button definitions: (label, style, custom_id, callback).
+# The custom_ids are the persistent-view contract; never change them.
+_PERSISTENT_ITEMS = (
+    ("Register", discord.ButtonStyle.primary, "reg:register", _register_cb),
+    ("Unregister", discord.ButtonStyle.secondary, "reg:unregister", _unregister_cb),
+    ("Refresh", discord.ButtonStyle.secondary, "reg:refresh", _refresh_cb),
+)
 
 
 # -----------------------------------------------------------------------------
@@ -163,14 +166,13 @@ class RegionMismatchView(ui.View):
             "✅ You have been registered!" if added else "⚠️ You are already registered."
         )
 
-        # Disable buttons
-        for child in self.children:
-            child.disabled = True
-
+        # view=None removes the buttons; stop() ends our timeout as well
+        self.stop()
         await inter.response.edit_message(content=msg, embed=None, view=None)
 
     @ui.button(label="Cancel", style=discord.ButtonStyle.secondary)
     async def cancel(self, inter: discord.Interaction, button: ui.Button):
+        self.stop()
         await inter.response.edit_message(
             content="❌ Registration cancelled.", embed=None, view=None
         )
@@ -194,24 +196,30 @@ class ManualRegisterModal(ui.Modal, title="Register Player Manually"):
         self.key = key
 
     async def on_submit(self, inter: discord.Interaction):
+        uid = _parse_snowflake(self.user_id.value)
+        if uid is None:
+            return await inter.response.send_message("Invalid User ID.", ephemeral=True)
+
+        # No member lookup needed for someone who is already in
+        if self.cog.is_registered(self.key, uid):
+            return await inter.response.send_message(
+                f"⚠️ <@{uid}> is already registered.", ephemeral=True
+            )
+
         try:
-            uid = int(self.user_id.value.strip())
-            user = inter.guild.get_member(uid)
+            user = await self.cog.resolve_member(inter.guild, uid)
             if not user:
-                # Try fetching if not in cache
-                try:
-                    user = await inter.guild.fetch_member(uid)
-                except discord.NotFound:
-                    return await inter.response.send_message(
-                        "User not found in this server.", ephemeral=True
-                    )
-
-            await self.cog.add_participant(self.key, user.id, user)
-            await inter.response.send_message(
-                f"✅ Registered {user.mention}.", ephemeral=True
+                return await inter.response.send_message(
+                    "User not found in this server.", ephemeral=True
+                )
+
+            added = await self.cog.add_participant(self.key, user.id, user)
+            msg = (
+                f"✅ Registered {user.mention}."
+                if added
+                else f"⚠️ {user.mention} is already registered."
             )
-        except ValueError:
-            await inter.response.send_message("Invalid User ID.", ephemeral=True)
+            await inter.response.send_message(msg, ephemeral=True)
         except Exception as e:
             await inter.response.send_message(f"Error: {e}", ephemeral=True)
 
@@ -229,21 +237,20 @@ class KickPlayerModal(ui.Modal, title="Kick Player"):
         self.key = key
 
     async def on_submit(self, inter: discord.Interaction):
+        uid = _parse_snowflake(self.user_id.value)
+        if uid is None:
+            return await inter.response.send_message("Invalid User ID.", ephemeral=True)
+
         try:
-            uid = int(self.user_id.value.strip())
             # We don't strictly need the member object to remove them from the set,
             # but we need it to remove the role.
-            user = inter.guild.get_member(uid)
-            if not user:
-                try:
-                    user = await inter.guild.fetch_member(uid)
-                except:
-                    user = None  # Just remove from DB if they left server
+            try:
+                user = await self.cog.resolve_member(inter.guild, uid)
+            except discord.HTTPException:
+                user = None  # Just remove from DB if they left server
 
             await self.cog.remove_participant(self.key, uid, user)
             await inter.response.send_message(f"✅ Removed user {uid}.", ephemeral=True)
-        except ValueError:
-            await inter.response.send_message("Invalid User ID.", ephemeral=True)
         except Exception as e:
             await inter.response.send_message(f"Error: {e}", ephemeral=True)
 
@@ -275,21 +282,24 @@ class AddDummiesModal(ui.Modal, title="Add Dummy Players"):
             teams_cog = self.cog.bot.get_cog("TeamsCog")
 
             # Add dummies
-            count = 0
-            for i in range(num):
-                if team_size > 1 and teams_cog:
-                    if await teams_cog.create_dummy_team(self.key, team_size):
-                        count += 1
-                    # Small sleep to ensure unique IDs if using time in create_dummy_team
-                    await asyncio.sleep(0.01)
+            if team_size > 1 and teams_cog:
+                bulk = getattr(teams_cog, "create_dummy_teams_bulk", None)
+                if bulk is not None:
+                    count = await bulk(self.key, team_size, num)
                 else:
-                    # Use negative IDs for dummies to avoid conflicts
-                    dummy_id = -1 * (int(time.time()) + i)
-                    success = await self.cog.add_participant(self.key, dummy_id, None)
-                    if success:
-                        count += 1
-                    # Small sleep to ensure unique IDs
-                    await asyncio.sleep(0.01)
+                    count = 0
+                    for _ in range(num):
+                        if await teams_cog.create_dummy_team(self.key, team_size):
+                            count += 1
+                        # Small sleep to ensure unique IDs if using time in create_dummy_team
+                        await asyncio.sleep(0.01)
+            else:
+                # Negative IDs avoid conflicts; consecutive offsets from a
+                # millisecond base are unique without sleeping between adds
+                base = -int(time.time() * 1000)
+                count = await self.cog.add_participants_bulk(
+                    self.key, [(base - i, None) for i in range(num)]
+                )
 
             await inter.followup.send(
                 f"✅ Added {count} dummy participants.", ephemeral=True
@@ -300,6 +310,32 @@ class AddDummiesModal(ui.Modal, title="Add Dummy Players"):
             await inter.followup.send(f"Error: {e}", ephemeral=True)
 
 
+# Tournament state keys edited by EditTournamentModal, with their fallbacks,
+# and the modal inputs they pre-fill (same order)
+_EDIT_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("name", ""),
+    ("region", ""),
+    ("format", ""),
+    ("match_length", "Bo3"),
+    ("start_time", ""),
+)
+_EDIT_INPUTS = ("name", "region", "fmt", "match_length", "start_time")
+
+_EDIT_OK_TEMPLATE = (
+    "✅ **Tournament updated!**\n\n"
+    "**Name**: {name}\n"
+    "**Region**: {region}\n"
+    "**Format**: {fmt}\n"
+    "**Match Length**: {match_length}\n"
+    "**Start Time**: {start_time}"
+)
+
+
+def _edit_defaults(state: dict) -> Tuple[str, ...]:
+    """Current values for the edit modal, in _EDIT_FIELDS order."""
+    return tuple(state.get(key, default) for key, default in _EDIT_FIELDS)
+
+
 class EditTournamentModal(ui.Modal, title="Edit Tournament Details"):
     """Modal for editing tournament details before it starts."""
 
@@ -333,11 +369,8 @@ class EditTournamentModal(ui.Modal, title="Edit Tournament Details"):
         self.key = key
 
         # Pre-fill with current values
-        self.name.default = current_state.get("name", "")
-        self.region.default = current_state.get("region", "")
-        self.fmt.default = current_state.get("format", "")
-        self.match_length.default = current_state.get("match_length", "Bo3")
-        self.start_time.default = current_state.get("start_time", "")
+        for attr, value in zip(_EDIT_INPUTS, _edit_defaults(current_state)):
+            getattr(self, attr).default = value
 
     async def on_submit(self, inter: discord.Interaction):
         await inter.response.defer(ephemeral=True)
@@ -353,67 +386,67 @@ class EditTournamentModal(ui.Modal, title="Edit Tournament Details"):
         if not current_state:
             return await inter.followup.send("❌ Tournament not found.", ephemeral=True)
 
-        if new_name.lower() != current_state.get("name", "").lower():
+        old_name = current_state.get("name", "")
+        if new_name.lower() != old_name.lower():
             # Name changed, check uniqueness
-            for other_key, other_data in self.cog.tournaments.items():
-                if (
-                    other_key != self.key
-                    and other_data.get("name", "").lower() == new_name.lower()
-                ):
-                    return await inter.followup.send(
-                        f"❌ A tournament named '{new_name}' already exists.\n"
-                        f"Please choose a different name.",
-                        ephemeral=True,
-                    )
+            owner = self.cog.find_tournament_by_name(new_name)
+            if owner and owner != self.key:
+                return await inter.followup.send(
+                    f"❌ A tournament named '{new_name}' already exists.\n"
+                    f"Please choose a different name.",
+                    ephemeral=True,
+                )
 
         # Update Discord role and category names if tournament name changed
-        if new_name != current_state.get("name", ""):
+        # Discord names are case-sensitive, so compare exactly here
+        renames = []
+        if new_name != old_name and inter.guild:
             guild = inter.guild
-            if guild:
-                # Update role name
-                role_id = current_state.get("role_id")
-                if role_id:
-                    role = guild.get_role(role_id)
-                    if role:
-                        try:
-                            await role.edit(name=new_name)
-                            log.info(f"Updated role name to '{new_name}'")
-                        except Exception as e:
-                            log.warning(f"Failed to update role name: {e}")
-
-                # Update category name
-                category_id = current_state.get("category_id")
-                if category_id:
-                    category = guild.get_channel(category_id)
-                    if category:
-                        try:
-                            await category.edit(name=f"Tournaments: {new_name}")
-                            log.info(
-                                f"Updated category name to 'Tournaments: {new_name}'"
-                            )
-                        except Exception as e:
-                            log.warning(f"Failed to update category name: {e}")
+            role_id = current_state.get("role_id")
+            role = guild.get_role(role_id) if role_id else None
+            if role:
+                renames.append(("role", new_name, role.edit(name=new_name)))
+
+            category_id = current_state.get("category_id")
+            category = guild.get_channel(category_id) if category_id else None
+            if category:
+                category_name = f"Tournaments: {new_name}"
+                renames.append(
+                    ("category", category_name, category.edit(name=category_name))
+                )
 
         # Update state
+        self.cog.update_name_index(self.key, old_name, new_name)
         current_state["name"] = new_name
         current_state["region"] = new_region
         current_state["format"] = new_fmt
         current_state["match_length"] = new_match_length
         current_state["start_time"] = new_start_time
 
-        # Save to DB
-        await self.cog.save_tournament(self.key)
-
-        # Update public panel if it exists
-        await self.cog.update_public_panel(self.key)
+        # Renames, DB save and public panel update are independent
+        results = await asyncio.gather(
+            *(coro for _, _, coro in renames),
+            self.cog.save_tournament(self.key),
+            self.cog.update_public_panel(self.key),
+            return_exceptions=True,
+        )
+        for (kind, target, _), result in zip(renames, results):
+            if isinstance(result, Exception):
+                log.warning(f"Failed to update {kind} name: {result}")
+            else:
+                log.info(f"Updated {kind} name to '{target}'")
+        for result in results[len(renames) :]:
+            if isinstance(result, Exception):
+                raise result
 
         await inter.followup.send(
-            f"✅ **Tournament updated!**\n\n"
-            f"**Name**: {new_name}\n"
-            f"**Region**: {new_region or 'N/A'}\n"
-            f"**Format**: {new_fmt}\n"
-            f"**Match Length**: {new_match_length}\n"
-            f"**Start Time**: {new_start_time or 'N/A'}",
+            _EDIT_OK_TEMPLATE.format(
+                name=new_name,
+                region=new_region or "N/A",
+                fmt=new_fmt,
+                match_length=new_match_length,
+                start_time=new_start_time or "N/A",
+            ),
             ephemeral=True,
         )
         log.info(f"Tournament {self.key} details updated by {inter.user}")
@@ -436,12 +469,55 @@ class RegistrationView(ui.View):
         super().__init__(timeout=None)  # Persistent view
         self.cog = cog
         self.tournament_key = tournament_key
-        self.is_open = is_open
 
-        # Add persistent buttons with custom IDs
-        self.add_item(RegisterButton())
-        self.add_item(UnregisterButton())
-        self.add_item(RefreshButton())
+        # Add persistent buttons with custom IDs (Register is first)
+        for label, style, custom_id, cb in _PERSISTENT_ITEMS:
+            button = ui.Button(style=style, label=label, custom_id=custom_id)
+            button.callback = functools.partial(cb, button)
+            self.add_item(button)
+        self._register_button = self.children[0]
+
+        # (user_id, region) -> (checked_at, match, player_regions)
+        self._region_cache: Dict[Tuple[int, str], Tuple[float, bool, List[str]]] = {}
+
+        self.set_open(is_open)
+
+    def set_open(self, is_open: bool) -> RegistrationView:
+        """
+        Update open/closed state in place (no new view or buttons).
+
+        Callers re-send the same instance with message.edit(view=self).
+        """
+        self.is_open = bool(is_open)
+        button = self._register_button
+        button.disabled = not self.is_open
+        if self.is_open:
+            button.label = "Register"
+            button.style = discord.ButtonStyle.primary
+        else:
+            button.label = "Registration Closed"
+            button.style = discord.ButtonStyle.secondary
+        return self
+
+    def check_region(
+        self, member: discord.Member, region: str
+    ) -> Tuple[bool, List[str]]:
+        """Region match for a member, cached briefly so repeat clicks are free."""
+        cache_key = (member.id, region)
+        now = time.monotonic()
+        hit = self._region_cache.get(cache_key)
+        if hit and now - hit[0] < REGION_CHECK_TTL:
+            return hit[1], hit[2]
+
+        match, player_regions = self.cog._check_region_match(member, region)
+        if len(self._region_cache) >= REGION_CACHE_MAX:
+            self._region_cache = {
+                k: v
+                for k, v in self._region_cache.items()
+                if now - v[0] < REGION_CHECK_TTL
+            }
+        self._region_cache[cache_key] = (now, match, player_regions)
+        return match, player_regions
 
     async def _get_state_for_inter(self, inter: discord.Interaction) -> Optional[dict]:
         """Get the state for the given interaction with error handling."""
@@ -453,14 +529,9 @@ class RegistrationView(ui.View):
             state = self.cog.get_state_by_message(inter.message.id)
 
         if not state:
-            try:
-                await inter.response.send_message(
-                    "Tournament data not found. Try refreshing.", ephemeral=True
-                )
-            except discord.InteractionResponded:
-                await inter.followup.send(
-                    "Tournament data not found. Try refreshing.", ephemeral=True
-                )
+            await _safe_reply(
+                inter, "Tournament data not found. Try refreshing.", ephemeral=True
+            )
         return state
 
 
@@ -479,6 +550,40 @@ class AdminControlsView(ui.View):
         super().__init__(timeout=None)
         self.cog = cog
         self.key = key
+        self._cogs: Dict[str, commands.Cog] = {}
+
+    async def interaction_check(self, inter: discord.Interaction) -> bool:
+        # First admin click warms the member cache for the modals that follow
+        if inter.guild:
+            self.cog.warm_member_cache(inter.guild, self.key)
+        return True
+
+    def _get_cog(self, name: str) -> Optional[commands.Cog]:
+        """
+        Resolve a cog once per view instead of on every click.
+
+        Only hits are memoized, so a cog that loads later is still found.
+        Core-bot does not reload extensions at runtime, so the references
+        stay valid for the life of the view.
+        """
+        cog = self._cogs.get(name)
+        if cog is None:
+            cog = self.cog.bot.get_cog(name)
+            if cog is not None:
+                self._cogs[name] = cog
+        return cog
+
+    @property
+    def _reg_cog(self):
+        return self._get_cog("RegistrationCog")
+
+    @property
+    def _bracket_cog(self):
+        return self._get_cog("BracketCog")
+
+    @property
+    def _de_cog(self):
+        return self._get_cog("DoubleEliminationCog")
 
     # Row 0: Player Management
     @ui.button(
@@ -528,7 +633,7 @@ class AdminControlsView(ui.View):
     )
     async def resend_score(self, inter: discord.Interaction, _: ui.Button):
         await inter.response.defer(ephemeral=True)
-        bracket_cog = inter.client.get_cog("BracketCog")
+        bracket_cog = self._bracket_cog
         if not bracket_cog:
             return await inter.followup.send(
                 "Bracket system not loaded.", ephemeral=True
@@ -545,7 +650,7 @@ class AdminControlsView(ui.View):
         custom_id="admin:edit",
     )
     async def edit_details(self, inter: discord.Interaction, _: ui.Button):
-        reg_cog = inter.client.get_cog("RegistrationCog")
+        reg_cog = self._reg_cog
         if not reg_cog:
             return await inter.response.send_message("System error.", ephemeral=True)
 
@@ -560,7 +665,7 @@ class AdminControlsView(ui.View):
             )
 
         # Check if tournament has started (check if bracket exists)
-        bracket_cog = inter.client.get_cog("BracketCog")
+        bracket_cog = self._bracket_cog
         if bracket_cog and self.key in bracket_cog.matches:
             return await inter.response.send_message(
                 "❌ Cannot edit tournament details after it has started.",
@@ -592,14 +697,14 @@ class AdminControlsView(ui.View):
 
         # 🔒 Dev-user guard: requires both admin perms AND dev-user whitelist.
         # This provides dual-layer security for dev tools.
-        if not is_dev_user(inter.user.id):
+        if inter.user.id not in DEV_USER_IDS:
             await inter.response.send_message(
                 "⚠️ Auto-simulation is available only to authorized dev users.",
                 ephemeral=True,
             )
             return
 
-        bracket_cog = inter.client.get_cog("BracketCog")
+        bracket_cog = self._bracket_cog
         if bracket_cog is None:
             await inter.response.send_message(
                 "BracketCog is not loaded; cannot auto-simulate.",
@@ -624,8 +729,8 @@ class AdminControlsView(ui.View):
     async def start_tourney(self, inter: discord.Interaction, _: ui.Button):
         await inter.response.defer(ephemeral=True)
 
-        reg_cog = inter.client.get_cog("RegistrationCog")
-        bracket_cog = inter.client.get_cog("BracketCog")
+        reg_cog = self._reg_cog
+        bracket_cog = self._bracket_cog
 
         if not reg_cog or not bracket_cog:
             return await inter.followup.send(
@@ -649,7 +754,7 @@ class AdminControlsView(ui.View):
         )
 
         if tourney_format == "Double Elimination":
-            de_cog = inter.client.get_cog("DoubleEliminationCog")
+            de_cog = self._de_cog
             if not de_cog:
                 return await inter.followup.send(
                     "❌ Double Elimination system not loaded.", ephemeral=True
@@ -677,7 +782,7 @@ class AdminControlsView(ui.View):
     )
     async def end_tourney(self, inter: discord.Interaction, _: ui.Button):
         await inter.response.defer(ephemeral=True)
-        reg_cog = inter.client.get_cog("RegistrationCog")
+        reg_cog = self._reg_cog
         if reg_cog:
             # Track interaction
             await reg_cog.update_organizer_interaction(self.key, inter.user.id)
@@ -691,7 +796,7 @@ class AdminControlsView(ui.View):
     )
     async def reset_tourney(self, inter: discord.Interaction, _: ui.Button):
         await inter.response.defer(ephemeral=True)
-        reg_cog = inter.client.get_cog("RegistrationCog")
+        reg_cog = self._reg_cog
         if reg_cog:
             # Track interaction
             await reg_cog.update_organizer_interaction(self.key, inter.user.id)
@@ -706,7 +811,7 @@ class AdminControlsView(ui.View):
     async def delete_tourney(self, inter: discord.Interaction, _: ui.Button):
         await inter.response.defer(ephemeral=True)
 
-        reg_cog = inter.client.get_cog("RegistrationCog")
+        reg_cog = self._reg_cog
         if reg_cog:
             # Track interaction
             await reg_cog.update_organizer_interaction(self.key, inter.user.id)
@@ -765,46 +870,27 @@ class Registration1v1View(ui.View):
     )
     async def register(self, interaction: discord.Interaction, button: ui.Button):
         """Handle 1v1 registration."""
-        # Get tournament to verify it's still open
-        tournament = await self.cog.tournament_service.get_by_id(self.tournament_id)
-
-        if not tournament:
-            await interaction.response.send_message(
-                "❌ Tournament not found.",
-                ephemeral=True,
-            )
-            return
-
-        if tournament.status != "reg_open":
-            await interaction.response.send_message(
-                f"❌ Registration is **{tournament.status}**. Cannot register now.",
-                ephemeral=True,
-            )
-            return
-
-        # Check entry count
-        entry_count = await self.cog.tournament_service.count_entries(tournament.id)
-        if entry_count >= tournament.size:
-            await interaction.response.send_message(
-                "❌ Tournament is full!",
-                ephemeral=True,
-            )
-            return
-
-        # Check restrictions (region/rank)
-        restriction_error = await self._check_restrictions(
-            interaction.user.id, tournament
+        # Tournament and profile are independent - fetch them together.
+        # Read-only lookup: a click never creates a player row; no profile
+        # means "complete onboarding" when restrictions apply.
+        tournament, player = await asyncio.gather(
+            self.cog.tournament_service.get_by_id(self.tournament_id),
+            self.cog.bot.player_service.get_by_discord_id(interaction.user.id),
+            return_exceptions=True,
         )
-        if restriction_error:
-            await interaction.response.send_message(
-                f"❌ {restriction_error}", ephemeral=True
+        if isinstance(tournament, BaseException):
+            raise tournament
+        if isinstance(player, BaseException):
+            # Only matters if the tournament has restrictions
+            player = None
+
+        tournament, entry, error = (
+            await self.cog.tournament_service.try_register_1v1(
+                self.tournament_id,
+                interaction.user.id,
+                player,
+                tournament=tournament,
             )
-            return
-
-        # Try to add entry
-        entry, error = await self.cog.tournament_service.add_entry_1v1(
-            tournament_id=tournament.id,
-            user_id=interaction.user.id,
         )
 
         if error:
@@ -820,37 +906,6 @@ class Registration1v1View(ui.View):
             f"[TOURNAMENT] Player {interaction.user.id} registered for tournament {tournament.id}"
         )
 
-    async def _check_restrictions(self, user_id: int, tournament) -> Optional[str]:
-        """Check if player meets tournament restrictions. Returns error message or None."""
-        # No restrictions = allow everyone
-        if not tournament.allowed_regions and not tournament.allowed_ranks:
-            return None
-
-        # Get player profile
-        try:
-            player = await self.cog.bot.player_service.get_or_create(user_id)
-        except Exception:
-            return "Could not verify your profile. Please complete onboarding first."
-
-        if not player:
-            return "You need to complete onboarding first."
-
-        # Check region restriction
-        if tournament.allowed_regions:
-            allowed = [r.strip().upper() for r in tournament.allowed_regions.split(",")]
-            player_region = (player.region or "").upper()
-            if player_region not in allowed:
-                return f"This tournament is restricted to regions: **{tournament.allowed_regions}**. Your region: **{player.region or 'Not set'}**"
-
-        # Check rank restriction
-        if tournament.allowed_ranks:
-            allowed = [r.strip().title() for r in tournament.allowed_ranks.split(",")]
-            player_rank = (player.claimed_rank or "").title()
-            if player_rank not in allowed:
-                return f"This tournament is restricted to ranks: **{tournament.allowed_ranks}**. Your rank: **{player.claimed_rank or 'Not set'}**"
-
-        return None
-
 
 class Registration2v2View(ui.View):
     """Registration view for 2v2 tournaments (TournamentService flow)."""
@@ -867,8 +922,10 @@ class Registration2v2View(ui.View):
     )
     async def register_team(self, interaction: discord.Interaction, button: ui.Button):
         """Open team registration modal."""
-        # Get tournament to verify it's still open
-        tournament = await self.cog.tournament_service.get_by_id(self.tournament_id)
+        # Get tournament to verify it's still open, counting entries alongside
+        tournament, entry_count = (
+            await self.cog.tournament_service.get_with_entry_count(self.tournament_id)
+        )
 
         if not tournament:
             await interaction.response.send_message(
@@ -884,8 +941,6 @@ class Registration2v2View(ui.View):
             )
             return
 
-        # Check entry count
-        entry_count = await self.cog.tournament_service.count_entries(tournament.id)
         if entry_count >= tournament.size:
             await interaction.response.send_message(
                 "❌ Tournament is full!",
@@ -910,7 +965,7 @@ class TeamRegistrationModal(ui.Modal, title="Register Your Team"):
 
     teammate = ui.TextInput(
         label="Teammate",
-        placeholder="@mention or Discord ID (e.g., 123456789)",
+        placeholder="@mention or Discord ID (e.g., 123456789012345678)",
         required=True,
         max_length=100,
     )
@@ -920,6 +975,18 @@ class TeamRegistrationModal(ui.Modal, title="Register Your Team"):
         self.cog = cog
         self.tournament = tournament
 
+        # Parse restrictions once; both players are checked against them
+        self._allowed_regions = (
+            parse_restriction_csv(tournament.allowed_regions)
+            if tournament.allowed_regions
+            else None
+        )
+        self._allowed_ranks = (
+            parse_restriction_csv(tournament.allowed_ranks, title=True)
+            if tournament.allowed_ranks
+            else None
+        )
+
     async def on_submit(self, interaction: discord.Interaction):
         """Handle team registration submission."""
         # Parse teammate input
@@ -939,10 +1006,14 @@ class TeamRegistrationModal(ui.Modal, title="Register Your Team"):
             )
             return
 
-        # Verify teammate is in the guild
+        # Verify teammate is in the guild before looking at their profile, so
+        # an unknown ID reports "not found" rather than a restriction error
+        # (cache first, REST fallback)
         guild = interaction.guild
         try:
-            teammate_member = await guild.fetch_member(teammate_id)
+            teammate_member = guild.get_member(
+                teammate_id
+            ) or await guild.fetch_member(teammate_id)
         except discord.NotFound:
             await interaction.response.send_message(
                 "❌ Teammate not found in this server.",
@@ -956,14 +1027,12 @@ class TeamRegistrationModal(ui.Modal, title="Register Your Team"):
             )
             return
 
-        # Check restrictions for player 1
-        error = await self._check_restrictions(interaction.user.id, "You")
-        if error:
-            await interaction.response.send_message(f"❌ {error}", ephemeral=True)
-            return
-
-        # Check restrictions for teammate
-        error = await self._check_restrictions(teammate_id, "Your teammate")
+        # Check restrictions for both players at once (player 1's error wins)
+        errors = await asyncio.gather(
+            self._check_restrictions(interaction.user.id, "You"),
+            self._check_restrictions(teammate_id, "Your teammate"),
+        )
+        error = next((e for e in errors if e), None)
         if error:
             await interaction.response.send_message(f"❌ {error}", ephemeral=True)
             return
@@ -1001,13 +1070,13 @@ class TeamRegistrationModal(ui.Modal, title="Register Your Team"):
 
     async def _check_restrictions(self, user_id: int, label: str) -> Optional[str]:
         """Check if player meets tournament restrictions. Returns error message or None."""
-        # No restrictions = allow everyone
-        if not self.tournament.allowed_regions and not self.tournament.allowed_ranks:
+        # No restrictions = allow everyone, without loading the profile
+        if self._allowed_regions is None and self._allowed_ranks is None:
             return None
 
-        # Get player profile
+        # Get player profile (read-only: never create a row for either player)
         try:
-            player = await self.cog.bot.player_service.get_or_create(user_id)
+            player = await self.cog.bot.player_service.get_by_discord_id(user_id)
         except Exception:
             return f"{label} profile could not be verified. Complete onboarding first."
 
@@ -1015,21 +1084,15 @@ class TeamRegistrationModal(ui.Modal, title="Register Your Team"):
             return f"{label} need to complete onboarding first."
 
         # Check region restriction
-        if self.tournament.allowed_regions:
-            allowed = [
-                r.strip().upper() for r in self.tournament.allowed_regions.split(",")
-            ]
-            player_region = (player.region or "").upper()
-            if player_region not in allowed:
+        if self._allowed_regions is not None:
+            # Regions are stored upper-case (PlayerService.normalize_region)
+            if (player.region or "") not in self._allowed_regions:
                 return f"{label} region (**{player.region or 'Not set'}**) is not allowed. This tournament is restricted to: **{self.tournament.allowed_regions}**"
 
         # Check rank restriction
-        if self.tournament.allowed_ranks:
-            allowed = [
-                r.strip().title() for r in self.tournament.allowed_ranks.split(",")
-            ]
+        if self._allowed_ranks is not None:
             player_rank = (player.claimed_rank or "").title()
-            if player_rank not in allowed:
+            if player_rank not in self._allowed_ranks:
                 return f"{label} rank (**{player.claimed_rank or 'Not set'}**) is not allowed. This tournament is restricted to: **{self.tournament.allowed_ranks}**"
 
         return None
@@ -1039,12 +1102,14 @@ class TeamRegistrationModal(ui.Modal, title="Register Your Team"):
         value = value.strip()
 
         # Try mention format: <@123456789> or <@!123456789>
-        match = re.match(r"<@!?(\d+)>", value)
-        if match:
-            return int(match.group(1))
-
-        # Try raw ID
-        if value.isdigit():
+        # (raw IDs are the common case, so only run the regex on mentions)
+        if value.startswith("<@"):
+            match = _MENTION_RE.match(value)
+            if match:
+                return int(match.group(1))
+
+        # Try raw ID (must look like a real Discord snowflake)
+        if _USER_ID_RE.fullmatch(value):
             return int(value)
 
         return None
@@ -17,6 +17,51 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+# Dashboard (color, emoji) per tournament status; built once at import
+_STATUS_STYLE = {
+    "completed": (discord.Color.gold(), "🏆"),
+    "archived": (discord.Color.dark_gold(), "🏆"),
+    "in_progress": (discord.Color.green(), "⚔️"),
+}
+_DEFAULT_STYLE = (discord.Color.blue(), "📋")
+
+# Display label per status ("in_progress" -> "In Progress")
+_STATUS_LABEL = {
+    status: status.replace("_", " ").title()
+    for status in (
+        "draft",
+        "reg_open",
+        "reg_closed",
+        "in_progress",
+        "completed",
+        "cancelled",
+        "archived",
+    )
+}
+
+
+def _latest_round(matches: list) -> tuple:
+    """Return (round number, that round's matches in order) in one pass."""
+    current_round = -1
+    round_matches = []
+    for m in matches:
+        if m.round > current_round:
+            current_round = m.round
+            round_matches = [m]
+        elif m.round == current_round:
+            round_matches.append(m)
+    return current_round, round_matches
+
+
+def _format_match_line(m, names: dict) -> str:
+    """One dashboard line for a match, using pre-resolved entry names."""
+    if not m.entry2_id:
+        return f"#{m.match_index+1}: {names[m.entry1_id]} — BYE"
+    if m.status == "pending":
+        return f"#{m.match_index+1}: {names[m.entry1_id]} vs {names[m.entry2_id]} — ⏳ pending"
+    score_text = f" ({m.score_text})" if m.score_text else ""
+    return f"#{m.match_index+1}: ✅ {names[m.winner_entry_id]} wins{score_text}"
+
 
 async def build_dashboard_embed(bot: commands.Bot, tournament) -> discord.Embed:
     """Build the tournament dashboard embed (or trophy embed when completed)."""
@@ -24,18 +69,7 @@ async def build_dashboard_embed(bot: commands.Bot, tournament) -> discord.Embed:
     matches = await bot.tournament_service.list_matches(tournament.id)
 
     # Determine status color and mode
-    if tournament.status == "completed":
-        color = discord.Color.gold()
-        status_emoji = "🏆"
-    elif tournament.status == "archived":
-        color = discord.Color.dark_gold()
-        status_emoji = "🏆"
-    elif tournament.status == "in_progress":
-        color = discord.Color.green()
-        status_emoji = "⚔️"
-    else:
-        color = discord.Color.blue()
-        status_emoji = "📋"
+    color, status_emoji = _STATUS_STYLE.get(tournament.status, _DEFAULT_STYLE)
 
     # TROPHY MODE: When tournament is completed or archived
     if tournament.status in ("completed", "archived"):
@@ -56,34 +90,41 @@ async def build_dashboard_embed(bot: commands.Bot, tournament) -> discord.Embed:
         )
         embed.add_field(name="Format", value=tournament.format, inline=True)
         embed.add_field(name="Size", value=str(tournament.size), inline=True)
+        # Tracked locally; Embed.fields builds a new list on every access
+        field_count = 3
 
         # Get winner from final match
         if matches:
-            final_match = max(matches, key=lambda m: m.round)
+            # First match of the highest round, as max() would pick
+            final_match = _latest_round(matches)[1][0]
             if final_match.winner_entry_id:
-                winner_name = await bot.tournament_service.get_entry_display_name(
-                    final_match.winner_entry_id, tournament.format
-                )
-                embed.add_field(name="🥇 Winner", value=winner_name, inline=True)
-
-                # Get runner-up (loser of final match)
+                # Runner-up is the loser of the final match
                 loser_entry_id = (
                     final_match.entry2_id
                     if final_match.winner_entry_id == final_match.entry1_id
                     else final_match.entry1_id
                 )
+                entry_ids = [final_match.winner_entry_id]
+                if loser_entry_id:
+                    entry_ids.append(loser_entry_id)
+
+                names = await bot.tournament_service.get_entry_display_names(
+                    entry_ids, tournament.format
+                )
+                embed.add_field(
+                    name="🥇 Winner",
+                    value=names[final_match.winner_entry_id],
+                    inline=True,
+                )
+                field_count += 1
                 if loser_entry_id:
-                    runner_up_name = (
-                        await bot.tournament_service.get_entry_display_name(
-                            loser_entry_id, tournament.format
-                        )
-                    )
                     embed.add_field(
-                        name="🥈 Runner-up", value=runner_up_name, inline=True
+                        name="🥈 Runner-up", value=names[loser_entry_id], inline=True
                     )
+                    field_count += 1
 
         # Add empty field for alignment if needed
-        if len(embed.fields) % 3 == 2:
+        if field_count % 3 == 2:
             embed.add_field(name="\u200b", value="\u200b", inline=True)
 
         embed.set_footer(text="Thank you for participating!")
@@ -104,37 +145,29 @@ async def build_dashboard_embed(bot: commands.Bot, tournament) -> discord.Embed:
     )
     embed.add_field(name="Format", value=tournament.format, inline=True)
     embed.add_field(
-        name="Status", value=tournament.status.replace("_", " ").title(), inline=True
+        name="Status",
+        value=_STATUS_LABEL.get(tournament.status)
+        or tournament.status.replace("_", " ").title(),
+        inline=True,
     )
 
     # Add current round matches
     if matches:
-        current_round = max(m.round for m in matches)
-        round_matches = [m for m in matches if m.round == current_round]
+        current_round, round_matches = _latest_round(matches)
 
-        match_lines = []
+        # Look up every name the round needs in one query, not one per line
+        needed = []
         for m in round_matches:
-            entry1_name = await bot.tournament_service.get_entry_display_name(
-                m.entry1_id, tournament.format
-            )
-
+            needed.append(m.entry1_id)
             if m.entry2_id:
-                entry2_name = await bot.tournament_service.get_entry_display_name(
-                    m.entry2_id, tournament.format
-                )
-
-                if m.status == "pending":
-                    line = f"#{m.match_index+1}: {entry1_name} vs {entry2_name} — ⏳ pending"
-                else:
-                    winner_name = await bot.tournament_service.get_entry_display_name(
-                        m.winner_entry_id, tournament.format
-                    )
-                    score_text = f" ({m.score_text})" if m.score_text else ""
-                    line = f"#{m.match_index+1}: ✅ {winner_name} wins{score_text}"
-            else:
-                line = f"#{m.match_index+1}: {entry1_name} — BYE"
+                needed.append(m.entry2_id)
+                if m.status != "pending":
+                    needed.append(m.winner_entry_id)
+        names = await bot.tournament_service.get_entry_display_names(
+            needed, tournament.format
+        )
 
-            match_lines.append(line)
+        match_lines = [_format_match_line(m, names) for m in round_matches]
 
         embed.add_field(
             name=f"Round {current_round}",
@@ -6,21 +6,140 @@ Dashboard, admin control panel, and related confirmation views.
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import functools
+import importlib
 import logging
-from typing import TYPE_CHECKING
+import math
+import random
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional, Set
 
 import discord
 from discord import ui
 from discord.ext import commands
 
+from services.status_enums import TournamentPhase
+
 # Brand kit imports
 from ui.brand import Colors, FOOTER_TEXT, create_embed, success_embed, error_embed
+from ui.match_modals import ReportResultModal
 
 if TYPE_CHECKING:
     pass
 
 log = logging.getLogger(__name__)
 
+# Status groups checked by the admin panel
+_OPENABLE = frozenset({TournamentPhase.DRAFT.value, TournamentPhase.REG_OPEN.value})
+_FINISHED = frozenset(
+    {TournamentPhase.COMPLETED.value, TournamentPhase.CANCELLED.value}
+)
+
+# cogs.* modules import this one, so their helpers are resolved on first
+# use and cached here rather than re-imported in every handler.
+_LAZY: Dict[str, Any] = {}
+
+
+def _lazy(module: str, name: str) -> Any:
+    """Return ``module.name``, importing it on first access only."""
+    key = f"{module}.{name}"
+    attr = _LAZY.get(key)
+    if attr is None:
+        attr = getattr(importlib.import_module(module), name)
+        _LAZY[key] = attr
+    return attr
+
+
+async def _update_dashboard(bot, guild, tournament_id: int) -> None:
+    """Refresh a tournament's dashboard (cogs.tournaments owns the renderer)."""
+    update_tournament_dashboard = _lazy(
+        "cogs.tournaments", "update_tournament_dashboard"
+    )
+    await update_tournament_dashboard(bot, guild, tournament_id)
+
+
+# Heavy admin actions (bracket build, panel/dashboard posts) run in the
+# background after the defer; cap how many run at once across guilds.
+_ADMIN_WORK_LIMIT = asyncio.Semaphore(4)
+# Warn when a background admin action takes longer than this
+ADMIN_WORK_BUDGET = 2.0  # seconds
+# Strong references so pending admin tasks aren't garbage-collected
+_admin_tasks: Set[asyncio.Task] = set()
+
+
+async def _run_admin_work(
+    interaction: discord.Interaction, name: str, work: Awaitable[None]
+) -> None:
+    """Run deferred admin work under the concurrency cap, reporting failures."""
+    async with _ADMIN_WORK_LIMIT:
+        started = time.monotonic()
+        try:
+            await work
+        except Exception as e:
+            log.error(f"[ADMIN] {name} failed: {e}", exc_info=True)
+            try:
+                await interaction.followup.send(
+                    f"❌ {name} failed: {e}", ephemeral=True
+                )
+            except discord.HTTPException:
+                pass
+        finally:
+            elapsed = time.monotonic() - started
+            if elapsed > ADMIN_WORK_BUDGET:
+                log.warning(
+                    f"[ADMIN] {name} took {elapsed:.2f}s "
+                    f"(budget_overrun_ms={int((elapsed - ADMIN_WORK_BUDGET) * 1000)})"
+                )
+
+
+def _schedule_admin_work(
+    interaction: discord.Interaction, name: str, work: Awaitable[None]
+) -> None:
+    """Hand deferred admin work to a background task and return immediately."""
+    task = asyncio.create_task(_run_admin_work(interaction, name, work))
+    _admin_tasks.add(task)
+    task.add_done_callback(_admin_tasks.discard)
+
+
+# Dashboard refreshes after match results wait this long, so a burst of
+# results (repeated dev advances, overrides) shares a single render.
+DASHBOARD_DEBOUNCE = 0.5  # seconds
+# Tournament ids with a refresh waiting out the debounce
+_dashboard_pending: Set[int] = set()
+
+
+def _schedule_dashboard_refresh(bot, guild, tournament_id: int) -> None:
+    """Refresh a dashboard after a short quiet period, coalescing bursts."""
+    if tournament_id in _dashboard_pending:
+        return
+    _dashboard_pending.add(tournament_id)
+
+    async def refresh() -> None:
+        await asyncio.sleep(DASHBOARD_DEBOUNCE)
+        # Clear first so results landing mid-render schedule another pass
+        _dashboard_pending.discard(tournament_id)
+        try:
+            await _update_dashboard(bot, guild, tournament_id)
+        except Exception as e:
+            log.error(
+                f"[TOURNAMENT] Dashboard refresh for {tournament_id} failed: {e}",
+                exc_info=True,
+            )
+
+    task = asyncio.create_task(refresh())
+    _admin_tasks.add(task)
+    task.add_done_callback(_admin_tasks.discard)
+
+
+async def _safe_defer(interaction: discord.Interaction) -> None:
+    """ACK an interaction, ignoring one that was already acknowledged."""
+    try:
+        await interaction.response.defer(ephemeral=True)
+    except (discord.NotFound, discord.InteractionResponded):
+        pass
+
 
 class DashboardView(ui.View):
     """Tournament dashboard view with My Match and Refresh buttons."""
@@ -47,7 +166,7 @@ class DashboardView(ui.View):
             )
             return
 
-        if tournament.status != "in_progress":
+        if tournament.status != TournamentPhase.IN_PROGRESS:
             await interaction.response.send_message(
                 "❌ This tournament is not currently in progress.",
                 ephemeral=True,
@@ -81,8 +200,6 @@ class DashboardView(ui.View):
         )
 
         # Show modal
-        from ui.match_modals import ReportResultModal
-
         modal = ReportResultModal(
             self.bot,
             tournament,
@@ -105,12 +222,36 @@ class DashboardView(ui.View):
         """Refresh the dashboard display."""
         await interaction.response.defer()
 
-        # Import here to avoid circular imports
-        from cogs.tournaments import update_tournament_dashboard
+        await _update_dashboard(self.bot, interaction.guild, self.tournament_id)
+
+
+@functools.lru_cache(maxsize=256)
+def _status_embed_fields(
+    status: str, fmt: str, size: int, entry_count: int
+) -> tuple:
+    """
+    Render the admin Status embed as immutable ``(name, value)`` field pairs.
+
+    Keyed on every value it displays, so a changed tournament simply misses.
+    Tuples are safe to share between hits; ``_status_embed`` builds a fresh
+    Embed from them on every call.
+    """
+    return (
+        ("Format", fmt),
+        ("Size", str(size)),
+        ("Status", status),
+        ("Entries", f"{entry_count}/{size}"),
+    )
+
 
-        await update_tournament_dashboard(
-            self.bot, interaction.guild, self.tournament_id
-        )
+def _status_embed(
+    name: str, status: str, fmt: str, size: int, entry_count: int
+) -> discord.Embed:
+    """Build a new admin Status embed from the cached field pairs."""
+    embed = create_embed(name, f"Status: **{status}**")
+    for field_name, value in _status_embed_fields(status, fmt, size, entry_count):
+        embed.add_field(name=field_name, value=value, inline=True)
+    return embed
 
 
 class AdminControlPanel(ui.View):
@@ -120,6 +261,39 @@ class AdminControlPanel(ui.View):
         super().__init__(timeout=None)  # Persistent
         self.bot = bot
 
+    # Buttons that require Administrator. Status is open to everyone and
+    # Refresh Panels checks Manage Server itself.
+    _ADMIN_ONLY = frozenset(
+        {
+            "admin_create_tournament",
+            "admin_open_reg",
+            "admin_close_reg",
+            "admin_start_tournament",
+            "admin_cancel_tournament",
+            "admin_delete_tournament",
+        }
+    )
+    # Buttons whose callbacks read the active tournament from interaction.extras
+    _USES_ACTIVE = _ADMIN_ONLY | {"admin_tournament_status"}
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        """Reject non-admins and load the active tournament, once per click."""
+        custom_id = (interaction.data or {}).get("custom_id")
+        if (
+            custom_id in self._ADMIN_ONLY
+            and not interaction.user.guild_permissions.administrator
+        ):
+            await interaction.response.send_message("❌ Admin only.", ephemeral=True)
+            return False
+        # Fetch the active tournament once per click for the button callback
+        if custom_id in self._USES_ACTIVE:
+            interaction.extras["active_tournament"] = (
+                await self.bot.tournament_service.get_active_for_guild(
+                    interaction.guild.id
+                )
+            )
+        return True
+
     @ui.button(
         label="🏆 Create Tournament",
         style=discord.ButtonStyle.primary,
@@ -130,15 +304,8 @@ class AdminControlPanel(ui.View):
         self, interaction: discord.Interaction, button: ui.Button
     ):
         """Open create tournament modal."""
-        if not interaction.user.guild_permissions.administrator:
-            return await interaction.response.send_message(
-                "❌ Admin only.", ephemeral=True
-            )
-
         # Check for existing active tournament
-        tournament = await self.bot.tournament_service.get_active_for_guild(
-            interaction.guild.id
-        )
+        tournament = interaction.extras.get("active_tournament")
         if tournament:
             await interaction.response.send_message(
                 f"❌ There's already an active tournament: **{tournament.name}** ({tournament.status})\n"
@@ -160,35 +327,37 @@ class AdminControlPanel(ui.View):
         self, interaction: discord.Interaction, button: ui.Button
     ):
         """Open registration for current tournament."""
-        if not interaction.user.guild_permissions.administrator:
-            return await interaction.response.send_message(
-                "❌ Admin only.", ephemeral=True
-            )
-
         await interaction.response.defer(ephemeral=True)
 
-        tournament = await self.bot.tournament_service.get_active_for_guild(
-            interaction.guild.id
-        )
+        tournament = interaction.extras.get("active_tournament")
         if not tournament:
             await interaction.followup.send("❌ No active tournament.", ephemeral=True)
             return
 
-        if tournament.status not in ("draft", "reg_open"):
+        if tournament.status not in _OPENABLE:
             await interaction.followup.send(
                 f"❌ Can't open registration. Status is **{tournament.status}**.",
                 ephemeral=True,
             )
             return
 
+        _schedule_admin_work(
+            interaction, "Open registration", self._do_open(interaction, tournament)
+        )
+
+    async def _do_open(self, interaction: discord.Interaction, tournament) -> None:
+        """Open registration and post the panel (runs after the defer)."""
         # Update status
-        await self.bot.tournament_service.set_status(tournament.id, "reg_open")
+        await self.bot.tournament_service.set_status(
+            tournament.id, TournamentPhase.REG_OPEN.value
+        )
 
         # Get announce channel
-        config = await self.bot.guild_config_service.get(interaction.guild.id)
+        guild = interaction.guild
+        config = await self.bot.guild_config_service.get(guild.id)
         target = interaction.channel
         if config and config.announce_channel:
-            ch = interaction.guild.get_channel(config.announce_channel)
+            ch = guild.get_channel(config.announce_channel)
             if ch:
                 target = ch
 
@@ -206,12 +375,7 @@ class AdminControlPanel(ui.View):
             )
             reg_embed.add_field(name="Registered", value="0", inline=True)
 
-            from ui.registration_views import Registration1v1View, Registration2v2View
-
-            if tournament.format == "1v1":
-                view = Registration1v1View(cog, tournament.id)
-            else:
-                view = Registration2v2View(cog, tournament.id)
+            view = cog.get_registration_view(tournament)
 
             reg_message = await target.send(embed=reg_embed, view=view)
             await self.bot.tournament_service.set_registration_message(
@@ -233,21 +397,14 @@ class AdminControlPanel(ui.View):
         self, interaction: discord.Interaction, button: ui.Button
     ):
         """Close registration."""
-        if not interaction.user.guild_permissions.administrator:
-            return await interaction.response.send_message(
-                "❌ Admin only.", ephemeral=True
-            )
-
         await interaction.response.defer(ephemeral=True)
 
-        tournament = await self.bot.tournament_service.get_active_for_guild(
-            interaction.guild.id
-        )
+        tournament = interaction.extras.get("active_tournament")
         if not tournament:
             await interaction.followup.send("❌ No active tournament.", ephemeral=True)
             return
 
-        if tournament.status != "reg_open":
+        if tournament.status != TournamentPhase.REG_OPEN:
             await interaction.followup.send(
                 f"❌ Can't close registration. Status is **{tournament.status}**.",
                 ephemeral=True,
@@ -255,7 +412,9 @@ class AdminControlPanel(ui.View):
             return
 
         entry_count = await self.bot.tournament_service.count_entries(tournament.id)
-        await self.bot.tournament_service.set_status(tournament.id, "reg_closed")
+        await self.bot.tournament_service.set_status(
+            tournament.id, TournamentPhase.REG_CLOSED.value
+        )
 
         await interaction.followup.send(
             f"✅ Registration closed for **{tournament.name}**!\n"
@@ -274,21 +433,14 @@ class AdminControlPanel(ui.View):
         self, interaction: discord.Interaction, button: ui.Button
     ):
         """Generate bracket and start."""
-        if not interaction.user.guild_permissions.administrator:
-            return await interaction.response.send_message(
-                "❌ Admin only.", ephemeral=True
-            )
-
         await interaction.response.defer(ephemeral=True)
 
-        tournament = await self.bot.tournament_service.get_active_for_guild(
-            interaction.guild.id
-        )
+        tournament = interaction.extras.get("active_tournament")
         if not tournament:
             await interaction.followup.send("❌ No active tournament.", ephemeral=True)
             return
 
-        if tournament.status != "reg_closed":
+        if tournament.status != TournamentPhase.REG_CLOSED:
             await interaction.followup.send(
                 f"❌ Can't start. Status is **{tournament.status}**.\n"
                 f"Close registration first.",
@@ -296,45 +448,64 @@ class AdminControlPanel(ui.View):
             )
             return
 
+        _schedule_admin_work(
+            interaction, "Start tournament", self._do_start(interaction, tournament)
+        )
+
+    async def _do_start(self, interaction: discord.Interaction, tournament) -> None:
+        """Build the bracket and post the dashboard (runs after the defer)."""
         # Build bracket
         matches, error = await self.bot.tournament_service.build_bracket(tournament.id)
         if error:
             await interaction.followup.send(f"❌ {error}", ephemeral=True)
             return
 
-        await self.bot.tournament_service.set_status(tournament.id, "in_progress")
+        # Returns the updated row, so no separate re-read is needed
+        tournament = (
+            await self.bot.tournament_service.update_status(
+                tournament.id, TournamentPhase.IN_PROGRESS.value
+            )
+            or tournament
+        )
 
         pending = [m for m in matches if m.status == "pending"]
         byes = [m for m in matches if m.status == "completed"]
 
-        # Refresh tournament to get updated status
-        tournament = await self.bot.tournament_service.get_by_id(tournament.id)
-
-        # Delete registration panel (cleanup)
-        reg_deleted = False
-        if tournament.reg_channel_id and tournament.reg_message_id:
+        # Registration panel cleanup and dashboard post are independent
+        # Discord calls, so run them side by side.
+        post_tournament_dashboard = _lazy(
+            "cogs.tournaments", "post_tournament_dashboard"
+        )
+        guild = interaction.guild
+
+        async def delete_reg_panel() -> bool:
+            if not (tournament.reg_channel_id and tournament.reg_message_id):
+                return False
+            reg_channel = guild.get_channel(tournament.reg_channel_id)
+            if not reg_channel:
+                return False
             try:
-                reg_channel = interaction.guild.get_channel(tournament.reg_channel_id)
-                if reg_channel:
-                    reg_msg = await reg_channel.fetch_message(tournament.reg_message_id)
-                    await reg_msg.delete()
-                    reg_deleted = True
-                    log.info(
-                        f"[TOURNAMENT] Deleted registration panel for tournament {tournament.id}"
-                    )
+                await reg_channel.get_partial_message(tournament.reg_message_id).delete()
             except discord.NotFound:
                 log.warning(
                     f"[TOURNAMENT] Registration message already deleted for tournament {tournament.id}"
                 )
-            except Exception as e:
-                log.warning(f"[TOURNAMENT] Could not delete registration panel: {e}")
-
-        # Post tournament dashboard
-        from cogs.tournaments import post_tournament_dashboard
+                return False
+            log.info(
+                f"[TOURNAMENT] Deleted registration panel for tournament {tournament.id}"
+            )
+            return True
 
-        dashboard_posted = await post_tournament_dashboard(
-            self.bot, interaction.guild, tournament
+        reg_deleted, dashboard_posted = await asyncio.gather(
+            delete_reg_panel(),
+            post_tournament_dashboard(self.bot, guild, tournament),
+            return_exceptions=True,
         )
+        if isinstance(reg_deleted, BaseException):
+            log.warning(f"[TOURNAMENT] Could not delete registration panel: {reg_deleted}")
+        if isinstance(dashboard_posted, BaseException):
+            log.error(f"[TOURNAMENT] Dashboard post failed: {dashboard_posted}")
+            dashboard_posted = False
 
         await interaction.followup.send(
             (
@@ -357,9 +528,7 @@ class AdminControlPanel(ui.View):
         self, interaction: discord.Interaction, button: ui.Button
     ):
         """Show current tournament status."""
-        tournament = await self.bot.tournament_service.get_active_for_guild(
-            interaction.guild.id
-        )
+        tournament = interaction.extras.get("active_tournament")
 
         if not tournament:
             await interaction.response.send_message(
@@ -370,14 +539,13 @@ class AdminControlPanel(ui.View):
 
         entry_count = await self.bot.tournament_service.count_entries(tournament.id)
 
-        embed = create_embed(tournament.name, f"Status: **{tournament.status}**")
-        embed.add_field(name="Format", value=tournament.format, inline=True)
-        embed.add_field(name="Size", value=str(tournament.size), inline=True)
-        embed.add_field(name="Status", value=tournament.status, inline=True)
-        embed.add_field(
-            name="Entries", value=f"{entry_count}/{tournament.size}", inline=True
+        embed = _status_embed(
+            tournament.name,
+            tournament.status,
+            tournament.format,
+            tournament.size,
+            entry_count,
         )
-
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
     @ui.button(
@@ -390,14 +558,7 @@ class AdminControlPanel(ui.View):
         self, interaction: discord.Interaction, button: ui.Button
     ):
         """Cancel current tournament."""
-        if not interaction.user.guild_permissions.administrator:
-            return await interaction.response.send_message(
-                "❌ Admin only.", ephemeral=True
-            )
-
-        tournament = await self.bot.tournament_service.get_active_for_guild(
-            interaction.guild.id
-        )
+        tournament = interaction.extras.get("active_tournament")
         if not tournament:
             await interaction.response.send_message(
                 "❌ No active tournament to cancel.",
@@ -405,7 +566,9 @@ class AdminControlPanel(ui.View):
             )
             return
 
-        await self.bot.tournament_service.set_status(tournament.id, "cancelled")
+        await self.bot.tournament_service.set_status(
+            tournament.id, TournamentPhase.CANCELLED.value
+        )
         await interaction.response.send_message(
             f"✅ **{tournament.name}** has been cancelled.",
             ephemeral=True,
@@ -424,48 +587,29 @@ class AdminControlPanel(ui.View):
                 "❌ Admin only.", ephemeral=True
             )
 
-        await interaction.response.defer(ephemeral=True)
-
-        # Get guild config
-        config = await self.bot.guild_config_service.get(interaction.guild.id)
+        # Get guild config (cached) and answer directly when there is nothing
+        # to post, so the defer is only spent on real work
+        guild = interaction.guild
+        config = await self.bot.guild_config_service.get(guild.id)
         if not config:
-            await interaction.followup.send(
+            return await interaction.response.send_message(
                 "❌ No configuration found. Run quick setup first.",
                 ephemeral=True,
             )
-            return
-
-        refreshed = []
+        if not (config.onboarding_channel or config.admin_channel):
+            return await interaction.response.send_message(
+                "❌ No panels to refresh. Check channel configuration.",
+                ephemeral=True,
+            )
 
-        # Refresh onboarding panel
-        if config.onboarding_channel:
-            channel = interaction.guild.get_channel(config.onboarding_channel)
-            if channel:
-                try:
-                    # Import here to avoid circular imports
-                    from cogs.onboarding_view import PersistentOnboardingView
+        await interaction.response.defer(ephemeral=True)
 
-                    embed = create_embed(
-                        "Player Onboarding",
-                        "Complete your profile to participate in tournaments.\n\nClick the button below to set your region and rank.",
-                    )
-                    view = PersistentOnboardingView(self.bot)
-                    await channel.send(embed=embed, view=view)
-                    refreshed.append("Onboarding Panel")
-                except Exception as e:
-                    log.warning(f"[REFRESH] Could not refresh onboarding: {e}")
-
-        # Refresh admin panel
-        if config.admin_channel:
-            channel = interaction.guild.get_channel(config.admin_channel)
-            if channel:
-                try:
-                    from cogs.tournaments import post_admin_panel
-
-                    await post_admin_panel(self.bot, channel)
-                    refreshed.append("Admin Panel")
-                except Exception as e:
-                    log.warning(f"[REFRESH] Could not refresh admin panel: {e}")
+        # The two panels live in different channels, so post them concurrently
+        results = await asyncio.gather(
+            self._refresh_onboarding(guild, config.onboarding_channel),
+            self._refresh_admin(guild, config.admin_channel),
+        )
+        refreshed = [label for label in results if label]
 
         if refreshed:
             await interaction.followup.send(
@@ -478,6 +622,45 @@ class AdminControlPanel(ui.View):
                 ephemeral=True,
             )
 
+    async def _refresh_onboarding(
+        self, guild: discord.Guild, channel_id: Optional[int]
+    ) -> Optional[str]:
+        """Post a fresh onboarding panel; returns its label on success."""
+        channel = guild.get_channel(channel_id) if channel_id else None
+        if not channel:
+            return None
+        try:
+            PersistentOnboardingView = _lazy(
+                "cogs.onboarding_view", "PersistentOnboardingView"
+            )
+
+            embed = create_embed(
+                "Player Onboarding",
+                "Complete your profile to participate in tournaments.\n\nClick the button below to set your region and rank.",
+            )
+            view = PersistentOnboardingView(self.bot)
+            await channel.send(embed=embed, view=view)
+            return "Onboarding Panel"
+        except Exception as e:
+            log.warning(f"[REFRESH] Could not refresh onboarding: {e}")
+            return None
+
+    async def _refresh_admin(
+        self, guild: discord.Guild, channel_id: Optional[int]
+    ) -> Optional[str]:
+        """Post a fresh admin panel; returns its label on success."""
+        channel = guild.get_channel(channel_id) if channel_id else None
+        if not channel:
+            return None
+        try:
+            post_admin_panel = _lazy("cogs.tournaments", "post_admin_panel")
+
+            await post_admin_panel(self.bot, channel)
+            return "Admin Panel"
+        except Exception as e:
+            log.warning(f"[REFRESH] Could not refresh admin panel: {e}")
+            return None
+
     @ui.button(
         label="🗑️ Delete Tournament",
         style=discord.ButtonStyle.danger,
@@ -488,31 +671,14 @@ class AdminControlPanel(ui.View):
         self, interaction: discord.Interaction, button: ui.Button
     ):
         """Archive and delete tournament data."""
-        if not interaction.user.guild_permissions.administrator:
-            return await interaction.response.send_message(
-                "❌ Admin only.", ephemeral=True
-            )
-
         # Get completed/cancelled tournament
-        tournament = await self.bot.tournament_service.get_active_for_guild(
-            interaction.guild.id
-        )
+        tournament = interaction.extras.get("active_tournament")
 
         # If no active, look for most recent completed/cancelled
         if not tournament:
-            # Query for most recent completed/cancelled
-            cursor = await self.bot.tournament_service.db.execute(
-                """
-                SELECT * FROM tournaments
-                WHERE guild_id = ? AND status IN ('completed', 'cancelled')
-                ORDER BY created_at DESC
-                LIMIT 1
-                """,
-                (interaction.guild.id,),
+            tournament = await self.bot.tournament_service.get_most_recent_archivable(
+                interaction.guild.id
             )
-            row = await cursor.fetchone()
-            if row:
-                tournament = await self.bot.tournament_service.get_by_id(row["id"])
 
         if not tournament:
             await interaction.response.send_message(
@@ -521,7 +687,7 @@ class AdminControlPanel(ui.View):
             )
             return
 
-        if tournament.status not in ("completed", "cancelled"):
+        if tournament.status not in _FINISHED:
             await interaction.response.send_message(
                 "❌ Finish or cancel the tournament before deleting it.",
                 ephemeral=True,
@@ -543,6 +709,33 @@ class AdminControlPanel(ui.View):
         )
 
 
+async def _delete_tournament_message(
+    guild: discord.Guild,
+    channel_id: Optional[int],
+    message_id: Optional[int],
+    label: str,
+    tournament_id: int,
+) -> bool:
+    """Delete a tournament's panel message without fetching it first."""
+    if not (channel_id and message_id):
+        return False
+    channel = guild.get_channel(channel_id)
+    if not channel:
+        return False
+    try:
+        await channel.get_partial_message(message_id).delete()
+    except discord.NotFound:
+        log.warning(
+            f"[TOURNAMENT] {label.capitalize()} message already deleted for tournament {tournament_id}"
+        )
+        return False
+    except Exception as e:
+        log.warning(f"[TOURNAMENT] Could not delete {label} on archive: {e}")
+        return False
+    log.info(f"[TOURNAMENT] Deleted {label} for archived tournament {tournament_id}")
+    return True
+
+
 class DeleteTournamentConfirmView(ui.View):
     """Confirmation view for deleting/archiving a tournament."""
 
@@ -577,50 +770,29 @@ class DeleteTournamentConfirmView(ui.View):
             )
             return
 
-        # Clean up Discord messages
-        messages_deleted = []
-
-        # Delete registration panel
-        if tournament.reg_channel_id and tournament.reg_message_id:
-            try:
-                reg_channel = interaction.guild.get_channel(tournament.reg_channel_id)
-                if reg_channel:
-                    reg_msg = await reg_channel.fetch_message(tournament.reg_message_id)
-                    await reg_msg.delete()
-                    messages_deleted.append("registration panel")
-                    log.info(
-                        f"[TOURNAMENT] Deleted registration panel for archived tournament {tournament.id}"
-                    )
-            except discord.NotFound:
-                log.warning(
-                    f"[TOURNAMENT] Registration message already deleted for tournament {tournament.id}"
-                )
-            except Exception as e:
-                log.warning(
-                    f"[TOURNAMENT] Could not delete registration panel on archive: {e}"
-                )
-
-        # Delete dashboard/trophy message
-        if tournament.dashboard_channel_id and tournament.dashboard_message_id:
-            try:
-                dash_channel = interaction.guild.get_channel(
-                    tournament.dashboard_channel_id
-                )
-                if dash_channel:
-                    dash_msg = await dash_channel.fetch_message(
-                        tournament.dashboard_message_id
-                    )
-                    await dash_msg.delete()
-                    messages_deleted.append("dashboard/trophy")
-                    log.info(
-                        f"[TOURNAMENT] Deleted dashboard for archived tournament {tournament.id}"
-                    )
-            except discord.NotFound:
-                log.warning(
-                    f"[TOURNAMENT] Dashboard message already deleted for tournament {tournament.id}"
-                )
-            except Exception as e:
-                log.warning(f"[TOURNAMENT] Could not delete dashboard on archive: {e}")
+        # Clean up Discord messages (both deletions run concurrently)
+        guild = interaction.guild
+        reg_ok, dash_ok = await asyncio.gather(
+            _delete_tournament_message(
+                guild,
+                tournament.reg_channel_id,
+                tournament.reg_message_id,
+                "registration panel",
+                tournament.id,
+            ),
+            _delete_tournament_message(
+                guild,
+                tournament.dashboard_channel_id,
+                tournament.dashboard_message_id,
+                "dashboard",
+                tournament.id,
+            ),
+        )
+        messages_deleted = [
+            label
+            for label, ok in (("registration panel", reg_ok), ("dashboard/trophy", dash_ok))
+            if ok
+        ]
 
         cleanup_msg = (
             f" ({', '.join(messages_deleted)} cleaned up)" if messages_deleted else ""
@@ -633,7 +805,7 @@ class DeleteTournamentConfirmView(ui.View):
 
         log.info(
             f"[TOURNAMENT] Archived tournament {self.tournament.id} "
-            f"in guild {interaction.guild.id}"
+            f"in guild {guild.id}"
         )
 
     @ui.button(
@@ -648,6 +820,12 @@ class DeleteTournamentConfirmView(ui.View):
         )
 
 
+def _norm_csv(raw: Optional[str], fn: Callable[[str], str]) -> Optional[str]:
+    """Normalize a comma-separated input, or None when it has no values."""
+    parts = [fn(p.strip()) for p in (raw or "").split(",") if p.strip()]
+    return ",".join(parts) or None
+
+
 class CreateTournamentModal(ui.Modal, title="Create Tournament"):
     """Modal for creating a new tournament."""
 
@@ -713,23 +891,9 @@ class CreateTournamentModal(ui.Modal, title="Create Tournament"):
             )
             return
 
-        # Parse restrictions (convert to uppercase CSV)
-        regions = None
-        if self.allowed_regions.value and self.allowed_regions.value.strip():
-            regions = ",".join(
-                r.strip().upper()
-                for r in self.allowed_regions.value.split(",")
-                if r.strip()
-            )
-
-        ranks = None
-        if self.allowed_ranks.value and self.allowed_ranks.value.strip():
-            # Capitalize first letter of each rank
-            ranks = ",".join(
-                r.strip().title()
-                for r in self.allowed_ranks.value.split(",")
-                if r.strip()
-            )
+        # Parse restrictions (regions upper-case, ranks title-case)
+        regions = _norm_csv(self.allowed_regions.value, str.upper)
+        ranks = _norm_csv(self.allowed_ranks.value, str.title)
 
         # Create tournament
         tournament, error = await self.bot.tournament_service.create_tournament(
@@ -768,6 +932,25 @@ class CreateTournamentModal(ui.Modal, title="Create Tournament"):
 # -----------------------------------------------------------------------------
 
 
+# Select-option fallback when a match's entry names couldn't be resolved
+_UNKNOWN_NAMES = ("???", "???")
+
+
+def _match_select_options(
+    matches: list, match_names: dict[int, tuple[str, str]]
+) -> list[discord.SelectOption]:
+    """Build match dropdown options (first 25, Discord's limit)."""
+    return [
+        discord.SelectOption(
+            label=f"R{match.round} M{match.match_index + 1}",
+            description=f"{names[0]} vs {names[1]}"[:100],
+            value=str(match.id),
+        )
+        for match in matches[:25]
+        for names in (match_names.get(match.id, _UNKNOWN_NAMES),)
+    ]
+
+
 class MatchOverrideSelect(ui.Select):
     """Dropdown to select an unresolved match for admin override."""
 
@@ -778,18 +961,10 @@ class MatchOverrideSelect(ui.Select):
             match_names: Dict mapping match.id -> (entry1_name, entry2_name)
         """
         self.matches = matches
+        self._by_id = {m.id: m for m in matches}
         self.match_names = match_names
 
-        options = []
-        for match in matches[:25]:  # Discord limit
-            entry1_name, entry2_name = match_names.get(match.id, ("???", "???"))
-            options.append(
-                discord.SelectOption(
-                    label=f"R{match.round} M{match.match_index + 1}",
-                    description=f"{entry1_name} vs {entry2_name}"[:100],
-                    value=str(match.id),
-                )
-            )
+        options = _match_select_options(matches, match_names)
 
         super().__init__(
             placeholder="Select a match to override...",
@@ -800,7 +975,7 @@ class MatchOverrideSelect(ui.Select):
     async def callback(self, interaction: discord.Interaction):
         """When a match is selected, show winner selection buttons."""
         match_id = int(self.values[0])
-        match = next((m for m in self.matches if m.id == match_id), None)
+        match = self._by_id.get(match_id)
 
         if not match:
             embed = error_embed("Match Not Found", "Could not find the selected match.")
@@ -825,6 +1000,7 @@ class MatchOverrideSelect(ui.Select):
             entry1_name,
             entry2_name,
         )
+        view.interaction = interaction
 
         await interaction.response.edit_message(embed=embed, view=view)
 
@@ -861,14 +1037,33 @@ class WinnerSelectView(ui.View):
         entry1_name: str,
         entry2_name: str,
     ):
-        super().__init__(timeout=60)
+        # Long enough for an admin to decide; on_timeout disables the
+        # buttons so a lapsed view never turns a click into a failure.
+        super().__init__(timeout=300)
         self.bot = bot
+        # Interaction that showed this view, used to edit it on timeout
+        self.interaction: Optional[discord.Interaction] = None
         self.match = match
         self.entry1_id = entry1_id
         self.entry2_id = entry2_id
         self.entry1_name = entry1_name
         self.entry2_name = entry2_name
 
+        # Match-specific custom_ids, like the match card buttons
+        self.winner_entry1.custom_id = f"override_winner_{match.id}_1"
+        self.winner_entry2.custom_id = f"override_winner_{match.id}_2"
+        self.cancel.custom_id = f"override_cancel_{match.id}"
+
+    async def on_timeout(self):
+        """Disable the buttons once the wizard has been abandoned."""
+        for item in self.children:
+            item.disabled = True
+        if self.interaction is not None:
+            try:
+                await self.interaction.edit_original_response(view=self)
+            except discord.HTTPException:
+                pass
+
     @ui.button(
         label="Winner: Player 1",
         style=discord.ButtonStyle.primary,
@@ -876,6 +1071,7 @@ class WinnerSelectView(ui.View):
     )
     async def winner_entry1(self, interaction: discord.Interaction, button: ui.Button):
         """Set entry1 as winner."""
+        await _safe_defer(interaction)
         await self._report_winner(interaction, self.entry1_id, self.entry1_name)
 
     @ui.button(
@@ -885,6 +1081,7 @@ class WinnerSelectView(ui.View):
     )
     async def winner_entry2(self, interaction: discord.Interaction, button: ui.Button):
         """Set entry2 as winner."""
+        await _safe_defer(interaction)
         await self._report_winner(interaction, self.entry2_id, self.entry2_name)
 
     @ui.button(
@@ -894,6 +1091,7 @@ class WinnerSelectView(ui.View):
     )
     async def cancel(self, interaction: discord.Interaction, button: ui.Button):
         """Cancel."""
+        self.stop()
         embed = create_embed(
             "Override Cancelled", "No changes were made.", Colors.WARNING
         )
@@ -905,9 +1103,8 @@ class WinnerSelectView(ui.View):
         winner_entry_id: int,
         winner_name: str,
     ):
-        """Report the winner using TournamentService."""
-        await interaction.response.defer(ephemeral=True)
-
+        """Report the winner using TournamentService (interaction is deferred)."""
+        self.stop()
         tournament, match, error = (
             await self.bot.tournament_service.report_result_by_entry(
                 match_id=self.match.id,
@@ -922,9 +1119,7 @@ class WinnerSelectView(ui.View):
             return
 
         # Update dashboard
-        from cogs.tournaments import update_tournament_dashboard
-
-        await update_tournament_dashboard(self.bot, interaction.guild, tournament.id)
+        _schedule_dashboard_refresh(self.bot, interaction.guild, tournament.id)
 
         embed = success_embed("Match Result Updated", f"**Winner:** {winner_name}")
         embed.add_field(name="Round", value=str(self.match.round), inline=True)
@@ -932,7 +1127,7 @@ class WinnerSelectView(ui.View):
             name="Match", value=str(self.match.match_index + 1), inline=True
         )
 
-        if tournament.status == "completed":
+        if tournament.status == TournamentPhase.COMPLETED:
             embed.add_field(
                 name="Tournament Complete",
                 value=f"🏆 {winner_name} wins the tournament!",
@@ -952,6 +1147,54 @@ class WinnerSelectView(ui.View):
 # -----------------------------------------------------------------------------
 
 
+# Static help text for the dev panels
+_BRACKET_TOOLS_ACTIONS = (
+    "• **Advance One** — Pick and resolve a single match\n"
+    "• **Advance Round** — Resolve all matches in lowest round\n"
+    "• **Auto-resolve** — Resolve all dummy vs dummy matches"
+)
+_HUB_TOOLS = (
+    "• **Bracket Tools** — Open Dev Bracket Tools panel\n"
+    "• **Add Dummies** — Fill tournament with dummy entries\n"
+    "• **Auto-resolve** — Resolve all dummy vs dummy matches"
+)
+
+
+async def _auto_resolve_dummies(service, tournament) -> tuple[Any, int]:
+    """Resolve dummy vs dummy matches round by round.
+
+    Each pass resolves at least one round, so a bracket of `size` needs at
+    most ceil(log2(size)) passes; one spare pass covers byes. Returns the
+    latest tournament and the number of matches resolved.
+    """
+    resolved = 0
+    max_passes = math.ceil(math.log2(max(tournament.size, 2))) + 1
+
+    for _ in range(max_passes):
+        # Dummy vs dummy matches are filtered in SQL, one query per pass
+        dummy_matches = await service.list_pending_dummy_matches(tournament.id)
+        if not dummy_matches:
+            break
+
+        batch = [
+            (m.id, m.entry1_id if random.getrandbits(1) else m.entry2_id, "AUTO")
+            for m in dummy_matches
+        ]
+        updated, resolved_this_round, _ = await service.report_results_bulk(
+            tournament.id, batch
+        )
+        resolved += resolved_this_round
+
+        if resolved_this_round == 0 or not updated:
+            break
+
+        tournament = updated
+        if tournament.status == TournamentPhase.COMPLETED:
+            break
+
+    return tournament, resolved
+
+
 class DevMatchSelect(ui.Select):
     """Dropdown to select a match for dev advance."""
 
@@ -963,18 +1206,10 @@ class DevMatchSelect(ui.Select):
     ):
         self.parent_view = view
         self.matches = matches
+        self._by_id = {m.id: m for m in matches}
         self.match_names = match_names
 
-        options = []
-        for match in matches[:25]:  # Discord limit
-            entry1_name, entry2_name = match_names.get(match.id, ("???", "???"))
-            options.append(
-                discord.SelectOption(
-                    label=f"R{match.round} M{match.match_index + 1}",
-                    description=f"{entry1_name} vs {entry2_name}"[:100],
-                    value=str(match.id),
-                )
-            )
+        options = _match_select_options(matches, match_names)
 
         super().__init__(
             placeholder="Select a match to advance...",
@@ -984,19 +1219,16 @@ class DevMatchSelect(ui.Select):
 
     async def callback(self, interaction: discord.Interaction):
         """When a match is selected, resolve it with random winner."""
-        import random
-
-        match_id = int(self.values[0])
-        match = next((m for m in self.matches if m.id == match_id), None)
+        await _safe_defer(interaction)
 
+        match = self._by_id.get(int(self.values[0]))
         if not match:
             embed = error_embed("Match Not Found", "Could not find the selected match.")
-            return await interaction.response.send_message(embed=embed, ephemeral=True)
-
-        await interaction.response.defer(ephemeral=True)
+            await interaction.edit_original_response(embed=embed, view=None)
+            return
 
         # Pick random winner
-        winner_entry_id = random.choice([match.entry1_id, match.entry2_id])
+        winner_entry_id = match.entry1_id if random.getrandbits(1) else match.entry2_id
 
         tournament, updated_match, error = (
             await self.parent_view.bot.tournament_service.report_result_by_entry(
@@ -1019,9 +1251,7 @@ class DevMatchSelect(ui.Select):
         )
 
         # Update dashboard
-        from cogs.tournaments import update_tournament_dashboard
-
-        await update_tournament_dashboard(
+        _schedule_dashboard_refresh(
             self.parent_view.bot, interaction.guild, tournament.id
         )
 
@@ -1045,43 +1275,46 @@ class DevBracketToolsView(ui.View):
         self.tournament = tournament
         self.message_content = None
 
-    async def refresh_panel(
-        self, interaction: discord.Interaction, status_msg: str = None
-    ):
-        """Refresh the panel with current tournament state."""
-        # Refresh tournament
-        self.tournament = await self.bot.tournament_service.get_by_id(
-            self.tournament.id
-        )
-
-        # Get match counts
-        all_matches = await self.bot.tournament_service.list_matches(self.tournament.id)
-        pending = [m for m in all_matches if m.status == "pending"]
-        completed = [m for m in all_matches if m.status == "completed"]
-
+    @staticmethod
+    def build_embed(
+        tournament, counts: Dict[str, int], status_msg: Optional[str] = None
+    ) -> discord.Embed:
+        """Build the panel embed from match counts per status."""
         embed = create_embed(
             "Dev Bracket Tools",
-            f"**Tournament:** {self.tournament.name}\n**Code:** `{self.tournament.tournament_code}`",
+            f"**Tournament:** {tournament.name}\n**Code:** `{tournament.tournament_code}`",
+        )
+        embed.add_field(name="Status", value=tournament.status, inline=True)
+        embed.add_field(name="Pending", value=str(counts.get("pending", 0)), inline=True)
+        embed.add_field(
+            name="Completed", value=str(counts.get("completed", 0)), inline=True
         )
-        embed.add_field(name="Status", value=self.tournament.status, inline=True)
-        embed.add_field(name="Pending", value=str(len(pending)), inline=True)
-        embed.add_field(name="Completed", value=str(len(completed)), inline=True)
 
         if status_msg:
             embed.add_field(name="Last Action", value=status_msg, inline=False)
 
-        embed.add_field(
-            name="Actions",
-            value=(
-                "• **Advance One** — Pick and resolve a single match\n"
-                "• **Advance Round** — Resolve all matches in lowest round\n"
-                "• **Auto-resolve** — Resolve all dummy vs dummy matches"
-            ),
-            inline=False,
-        )
+        embed.add_field(name="Actions", value=_BRACKET_TOOLS_ACTIONS, inline=False)
+        return embed
+
+    async def refresh_panel(
+        self, interaction: discord.Interaction, status_msg: str = None
+    ):
+        """Refresh the panel with current tournament state."""
+        service = self.bot.tournament_service
+
+        # Only the status changes under this panel; name and code are fixed.
+        # Copy rather than mutate: the tournament may be the service's
+        # cached active-tournament object.
+        status = await service.get_status(self.tournament.id)
+        if status and status != self.tournament.status:
+            self.tournament = dataclasses.replace(self.tournament, status=status)
+
+        # Get match counts
+        counts = await service.count_matches_by_status(self.tournament.id)
+        embed = self.build_embed(self.tournament, counts, status_msg)
 
         # Disable buttons if tournament completed
-        if self.tournament.status == "completed":
+        if self.tournament.status == TournamentPhase.COMPLETED:
             for item in self.children:
                 if hasattr(item, "disabled"):
                     item.disabled = True
@@ -1095,30 +1328,23 @@ class DevBracketToolsView(ui.View):
     )
     async def advance_one(self, interaction: discord.Interaction, button: ui.Button):
         """Show match selector for single match advance."""
-        await interaction.response.defer(ephemeral=True)
+        await _safe_defer(interaction)
 
-        # Get pending matches
-        all_matches = await self.bot.tournament_service.list_matches(self.tournament.id)
-        pending = [
-            m
-            for m in all_matches
-            if m.status == "pending" and m.entry1_id and m.entry2_id
-        ]
+        # Get pending matches that have both entries
+        pending = await self.bot.tournament_service.list_matches_where(
+            self.tournament.id, "pending"
+        )
 
         if not pending:
             await self.refresh_panel(interaction, "No pending matches to advance.")
             return
 
-        # Build match names
-        match_names = {}
-        for match in pending:
-            entry1_name = await self.bot.tournament_service.get_entry_display_name(
-                match.entry1_id, self.tournament.format
-            )
-            entry2_name = await self.bot.tournament_service.get_entry_display_name(
-                match.entry2_id, self.tournament.format
-            )
-            match_names[match.id] = (entry1_name, entry2_name)
+        # Build match names with one lookup for every entry
+        names = await self.bot.tournament_service.get_entry_display_names(
+            [e for m in pending for e in (m.entry1_id, m.entry2_id)],
+            self.tournament.format,
+        )
+        match_names = {m.id: (names[m.entry1_id], names[m.entry2_id]) for m in pending}
 
         # Show selector
         embed = create_embed(
@@ -1139,17 +1365,12 @@ class DevBracketToolsView(ui.View):
     )
     async def advance_round(self, interaction: discord.Interaction, button: ui.Button):
         """Resolve all matches in the lowest unresolved round."""
-        import random
+        await _safe_defer(interaction)
 
-        await interaction.response.defer(ephemeral=True)
-
-        # Get pending matches
-        all_matches = await self.bot.tournament_service.list_matches(self.tournament.id)
-        pending = [
-            m
-            for m in all_matches
-            if m.status == "pending" and m.entry1_id and m.entry2_id
-        ]
+        # Get pending matches that have both entries
+        pending = await self.bot.tournament_service.list_matches_where(
+            self.tournament.id, "pending"
+        )
 
         if not pending:
             await self.refresh_panel(interaction, "No pending matches to advance.")
@@ -1159,28 +1380,24 @@ class DevBracketToolsView(ui.View):
         lowest_round = min(m.round for m in pending)
         round_matches = [m for m in pending if m.round == lowest_round]
 
-        resolved = 0
-        for match in round_matches:
-            # Pick random winner
-            winner_entry_id = random.choice([match.entry1_id, match.entry2_id])
-
-            t, m, err = await self.bot.tournament_service.report_result_by_entry(
-                match_id=match.id,
-                winner_entry_id=winner_entry_id,
-                score="DEV",
+        # Random winners, reported in one batch
+        tournament, resolved, _ = (
+            await self.bot.tournament_service.report_results_bulk(
+                self.tournament.id,
+                [
+                    (
+                        m.id,
+                        m.entry1_id if random.getrandbits(1) else m.entry2_id,
+                        "DEV",
+                    )
+                    for m in round_matches
+                ],
             )
-            if not err:
-                resolved += 1
-
-        # Update dashboard
-        self.tournament = await self.bot.tournament_service.get_by_id(
-            self.tournament.id
         )
-        from cogs.tournaments import update_tournament_dashboard
 
-        await update_tournament_dashboard(
-            self.bot, interaction.guild, self.tournament.id
-        )
+        # Update dashboard
+        self.tournament = tournament or self.tournament
+        _schedule_dashboard_refresh(self.bot, interaction.guild, self.tournament.id)
 
         log.info(
             f"[DEV] Advanced round {lowest_round} ({resolved} matches) in tournament {self.tournament.id}"
@@ -1199,52 +1416,14 @@ class DevBracketToolsView(ui.View):
         self, interaction: discord.Interaction, button: ui.Button
     ):
         """Auto-resolve all dummy vs dummy matches (calls existing logic)."""
-        await interaction.response.defer(ephemeral=True)
-
-        resolved = 0
-
-        # Keep resolving until no more dummy matches
-        while True:
-            matches = await self.bot.tournament_service.list_matches(self.tournament.id)
-            pending = [
-                m for m in matches if m.status == "pending" and m.entry2_id is not None
-            ]
-
-            if not pending:
-                break
-
-            resolved_this_round = 0
-
-            for match in pending:
-                entry1_dummy, entry2_dummy, both_dummy = (
-                    await self.bot.tournament_service.is_dummy_match(match.id)
-                )
-
-                if both_dummy:
-                    t, m, err = (
-                        await self.bot.tournament_service.auto_resolve_dummy_match(
-                            match.id
-                        )
-                    )
-                    if not err:
-                        resolved += 1
-                        resolved_this_round += 1
+        await _safe_defer(interaction)
 
-            if resolved_this_round == 0:
-                break
-
-            self.tournament = await self.bot.tournament_service.get_by_id(
-                self.tournament.id
-            )
-            if self.tournament.status == "completed":
-                break
+        self.tournament, resolved = await _auto_resolve_dummies(
+            self.bot.tournament_service, self.tournament
+        )
 
         # Update dashboard
-        from cogs.tournaments import update_tournament_dashboard
-
-        await update_tournament_dashboard(
-            self.bot, interaction.guild, self.tournament.id
-        )
+        _schedule_dashboard_refresh(self.bot, interaction.guild, self.tournament.id)
 
         log.info(
             f"[DEV] Auto-resolved {resolved} matches in tournament {self.tournament.id}"
@@ -1312,15 +1491,7 @@ class DevToolsHubView(ui.View):
                 name="Current Tournament", value="None active", inline=False
             )
 
-        embed.add_field(
-            name="Available Tools",
-            value=(
-                "• **Bracket Tools** — Open Dev Bracket Tools panel\n"
-                "• **Add Dummies** — Fill tournament with dummy entries\n"
-                "• **Auto-resolve** — Resolve all dummy vs dummy matches"
-            ),
-            inline=False,
-        )
+        embed.add_field(name="Available Tools", value=_HUB_TOOLS, inline=False)
 
         embed.add_field(name="Last Action", value=self.last_action, inline=False)
 
@@ -1346,7 +1517,7 @@ class DevToolsHubView(ui.View):
         self, interaction: discord.Interaction, button: ui.Button
     ):
         """Open the Dev Bracket Tools panel."""
-        await interaction.response.defer(ephemeral=True)
+        await _safe_defer(interaction)
 
         tournament, error = await self._get_tournament(["in_progress"])
         if error:
@@ -1355,27 +1526,12 @@ class DevToolsHubView(ui.View):
             return
 
         # Get match counts
-        all_matches = await self.bot.tournament_service.list_matches(tournament.id)
-        pending = [m for m in all_matches if m.status == "pending"]
-        completed = [m for m in all_matches if m.status == "completed"]
+        counts = await self.bot.tournament_service.count_matches_by_status(
+            tournament.id
+        )
 
         # Show bracket tools panel (replaces this message)
-        embed = create_embed(
-            "Dev Bracket Tools",
-            f"**Tournament:** {tournament.name}\n**Code:** `{tournament.tournament_code}`",
-        )
-        embed.add_field(name="Status", value=tournament.status, inline=True)
-        embed.add_field(name="Pending", value=str(len(pending)), inline=True)
-        embed.add_field(name="Completed", value=str(len(completed)), inline=True)
-        embed.add_field(
-            name="Actions",
-            value=(
-                "• **Advance One** — Pick and resolve a single match\n"
-                "• **Advance Round** — Resolve all matches in lowest round\n"
-                "• **Auto-resolve** — Resolve all dummy vs dummy matches"
-            ),
-            inline=False,
-        )
+        embed = DevBracketToolsView.build_embed(tournament, counts)
 
         view = DevBracketToolsView(self.bot, tournament)
         await interaction.edit_original_response(embed=embed, view=view)
@@ -1391,7 +1547,7 @@ class DevToolsHubView(ui.View):
     )
     async def add_dummies(self, interaction: discord.Interaction, button: ui.Button):
         """Add dummy entries to the active tournament."""
-        await interaction.response.defer(ephemeral=True)
+        await _safe_defer(interaction)
 
         tournament, error = await self._get_tournament(
             ["draft", "reg_open", "reg_closed"]
@@ -1414,38 +1570,33 @@ class DevToolsHubView(ui.View):
             return
 
         # Add dummy entries (up to remaining slots)
-        base_dummy_id = 9900000000000000 + (tournament.id * 1000)
-        added = 0
-
-        for i in range(remaining):
-            dummy_player_id = base_dummy_id + current_entries + i
-
-            # Create dummy player record
-            try:
-                await self.bot.player_service.db.execute(
-                    """
-                    INSERT OR IGNORE INTO players (user_id, discord_id, display_name, region, claimed_rank, has_onboarded)
-                    VALUES (?, ?, ?, ?, ?, 1)
-                    """,
-                    (
-                        dummy_player_id,
-                        dummy_player_id,
-                        f"DummyPlayer{current_entries + i + 1}",
-                        "USE",
-                        "Gold",
-                    ),
-                )
-                await self.bot.player_service.db.commit()
-            except Exception:
-                pass
+        base_dummy_id = self.bot.tournament_service.DUMMY_PLAYER_ID_MIN + (
+            tournament.id * 1000
+        )
+        dummy_ids = [base_dummy_id + current_entries + i for i in range(remaining)]
 
-            # Add tournament entry
-            entry = await self.bot.tournament_service.add_dummy_entry(
-                tournament_id=tournament.id,
-                dummy_player_id=dummy_player_id,
+        # Create dummy player records in one batch
+        try:
+            await self.bot.player_service.db.executemany(
+                """
+                INSERT OR IGNORE INTO players (user_id, discord_id, display_name, region, claimed_rank, has_onboarded)
+                VALUES (?, ?, ?, ?, ?, 1)
+                """,
+                [
+                    (pid, pid, f"DummyPlayer{current_entries + i + 1}", "USE", "Gold")
+                    for i, pid in enumerate(dummy_ids)
+                ],
             )
-            if entry:
-                added += 1
+            await self.bot.player_service.db.commit()
+        except Exception as e:
+            # Don't leave a half-applied batch open on the shared connection
+            await self.bot.player_service.db.rollback()
+            log.warning(f"[DEV] Could not create dummy player records: {e}")
+
+        # Add tournament entries
+        added = await self.bot.tournament_service.add_dummy_entries_bulk(
+            tournament.id, dummy_ids
+        )
 
         log.info(
             f"[DEV] Dev Tools Hub: added {added} dummy entries to tournament {tournament.id}"
@@ -1461,7 +1612,7 @@ class DevToolsHubView(ui.View):
     )
     async def auto_resolve(self, interaction: discord.Interaction, button: ui.Button):
         """Auto-resolve all dummy vs dummy matches."""
-        await interaction.response.defer(ephemeral=True)
+        await _safe_defer(interaction)
 
         tournament, error = await self._get_tournament(["in_progress"])
         if error:
@@ -1469,46 +1620,12 @@ class DevToolsHubView(ui.View):
             await self.refresh_hub(interaction)
             return
 
-        resolved = 0
-
-        # Keep resolving until no more dummy matches
-        while True:
-            matches = await self.bot.tournament_service.list_matches(tournament.id)
-            pending = [
-                m for m in matches if m.status == "pending" and m.entry2_id is not None
-            ]
-
-            if not pending:
-                break
-
-            resolved_this_round = 0
-
-            for match in pending:
-                entry1_dummy, entry2_dummy, both_dummy = (
-                    await self.bot.tournament_service.is_dummy_match(match.id)
-                )
-
-                if both_dummy:
-                    t, m, err = (
-                        await self.bot.tournament_service.auto_resolve_dummy_match(
-                            match.id
-                        )
-                    )
-                    if not err:
-                        resolved += 1
-                        resolved_this_round += 1
-
-            if resolved_this_round == 0:
-                break
-
-            tournament = await self.bot.tournament_service.get_by_id(tournament.id)
-            if tournament.status == "completed":
-                break
+        tournament, resolved = await _auto_resolve_dummies(
+            self.bot.tournament_service, tournament
+        )
 
         # Update dashboard
-        from cogs.tournaments import update_tournament_dashboard
-
-        await update_tournament_dashboard(self.bot, interaction.guild, tournament.id)
+        _schedule_dashboard_refresh(self.bot, interaction.guild, tournament.id)
 
         log.info(f"[DEV] Dev Tools Hub: auto-resolved tournament {tournament.id}")
 
@@ -3,6 +3,66 @@ Ranking utilities for Elo-based rank calculation
 Matches Rocket League Sideswipe ranking system
 """
 
+from bisect import bisect_right
+from types import MappingProxyType
+
+
+# Tier lower bounds (ascending) with names and division widths
+_TIER_BASES = (0, 800, 1000, 1200, 1400, 1600, 1800)
+_TIER_NAMES = (
+    "Bronze",
+    "Silver",
+    "Gold",
+    "Platinum",
+    "Diamond",
+    "Champion",
+    "Grand Champion",
+)
+_TIER_WIDTHS = (160, 40, 40, 40, 40, 40, 0)
+_GC_TIER = len(_TIER_BASES) - 1
+
+_ROMAN_NUMERALS = MappingProxyType({1: "I", 2: "II", 3: "III", 4: "IV", 5: "V"})
+
+# Division tokens accepted in rank strings ("Diamond 2", "Diamond II")
+_DIVISION_MAP = MappingProxyType(
+    {
+        "1": 1,
+        "2": 2,
+        "3": 3,
+        "4": 4,
+        "5": 5,
+        "i": 1,
+        "ii": 2,
+        "iii": 3,
+        "iv": 4,
+        "v": 5,
+    }
+)
+
+# Base Elos for each rank
+_BASE_ELOS = MappingProxyType(
+    {
+        "bronze": 0,
+        "silver": 800,
+        "gold": 1000,
+        "platinum": 1200,
+        "diamond": 1400,
+        "champion": 1600,
+    }
+)
+
+_RANK_EMOJIS = MappingProxyType(
+    {
+        "Bronze": "🥉",
+        "Silver": "🥈",
+        "Gold": "🥇",
+        "Platinum": "💎",
+        "Diamond": "💠",
+        "Champion": "👑",
+        "Grand Champion": "🏆",
+    }
+)
+
 
 def get_rank_from_elo(elo: int) -> tuple[str, int]:
     """
@@ -18,26 +78,11 @@ def get_rank_from_elo(elo: int) -> tuple[str, int]:
     - Champion I-V: 1600-1799
     - Grand Champion: 1800+
     """
-    if elo >= 1800:
-        return "Grand Champion", 0
-    elif elo >= 1600:
-        division = min(5, max(1, 5 - ((elo - 1600) // 40)))
-        return "Champion", division
-    elif elo >= 1400:
-        division = min(5, max(1, 5 - ((elo - 1400) // 40)))
-        return "Diamond", division
-    elif elo >= 1200:
-        division = min(5, max(1, 5 - ((elo - 1200) // 40)))
-        return "Platinum", division
-    elif elo >= 1000:
-        division = min(5, max(1, 5 - ((elo - 1000) // 40)))
-        return "Gold", division
-    elif elo >= 800:
-        division = min(5, max(1, 5 - ((elo - 800) // 40)))
-        return "Silver", division
-    else:
-        division = min(5, max(1, 5 - (elo // 160)))
-        return "Bronze", division
+    tier = max(0, bisect_right(_TIER_BASES, elo) - 1)
+    if tier == _GC_TIER:
+        return _TIER_NAMES[tier], 0
+    division = 5 - (elo - _TIER_BASES[tier]) // _TIER_WIDTHS[tier]
+    return _TIER_NAMES[tier], min(5, max(1, division))
 
 
 def format_rank(rank_name: str, division: int) -> str:
@@ -45,8 +90,7 @@ def format_rank(rank_name: str, division: int) -> str:
     if rank_name == "Grand Champion":
         return "Grand Champion"
 
-    roman_numerals = {1: "I", 2: "II", 3: "III", 4: "IV", 5: "V"}
-    div_str = roman_numerals.get(division, "I")
+    div_str = _ROMAN_NUMERALS.get(division, "I")
     return f"{rank_name} {div_str}"
 
 
@@ -60,7 +104,7 @@ def get_starting_elo_from_rank(rank_str: str) -> int:
     - "Diamond 1" -> 1580 (mid Diamond I)
     - "Grand Champion" -> 1850
     """
-    rank_str = rank_str.lower().strip()
+    rank_str = rank_str.casefold().strip()
 
     # Handle Grand Champion
     if "grand" in rank_str or "gc" in rank_str:
@@ -71,35 +115,9 @@ def get_starting_elo_from_rank(rank_str: str) -> int:
     if len(parts) < 2:
         return 1000  # Default to Gold I
 
-    rank_name = parts[0].capitalize()
-    division_str = parts[1]
-
-    # Convert division
-    division_map = {
-        "1": 1,
-        "2": 2,
-        "3": 3,
-        "4": 4,
-        "5": 5,
-        "i": 1,
-        "ii": 2,
-        "iii": 3,
-        "iv": 4,
-        "v": 5,
-    }
-    division = division_map.get(division_str.lower(), 3)  # Default to III
-
-    # Base Elos for each rank
-    base_elos = {
-        "bronze": 0,
-        "silver": 800,
-        "gold": 1000,
-        "platinum": 1200,
-        "diamond": 1400,
-        "champion": 1600,
-    }
-
-    base = base_elos.get(rank_name.lower(), 1000)
+    # Already casefolded above
+    division = _DIVISION_MAP.get(parts[1], 3)  # Default to III
+    base = _BASE_ELOS.get(parts[0], 1000)
 
     # Each division is 40 Elo wide, start in the middle
     # Division 5 (highest) = base + 20
@@ -111,13 +129,4 @@ def get_starting_elo_from_rank(rank_str: str) -> int:
 
 def get_rank_emoji(rank_name: str) -> str:
     """Get emoji for rank display."""
-    emojis = {
-        "Bronze": "🥉",
-        "Silver": "🥈",
-        "Gold": "🥇",
-        "Platinum": "💎",
-        "Diamond": "💠",
-        "Champion": "👑",
-        "Grand Champion": "🏆",
-    }
-    return emojis.get(rank_name, "⭐")
+    return _RANK_EMOJIS.get(rank_name, "⭐")